@@ -0,0 +1,73 @@
+"""
+Benchmark translating and grounding rules comparing data against constants, with equality and `in` lookups.
+
+Usage: python -m benchmarks.constant_matches [--rules RULES] [--repeat REPEAT]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from clingo import Control
+
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.translator.data_generator import generate_single_data_asp_definition
+from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_definition
+
+
+def build_constant_rule(rule: int) -> Dict[str, Any]:
+    return {
+        "or": [
+            {"==": [{"var": "category"}, f"c{rule}"]},
+            {"in": [{"var": "country"}, [f"k{rule}", f"k{rule + 1}", f"k{rule + 2}"]]},
+        ]
+    }
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def ground(program: str) -> Control:
+    control = Control(["--warn=none"])
+    control.add("base", [], program)
+    control.ground([("base", [])])
+    return control
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rule_inputs = [RuleInput(rule_tree=build_constant_rule(rule), rule_id=str(rule)) for rule in range(args.rules)]
+    data_definition = generate_single_data_asp_definition(
+        DataInput(
+            data_object={"category": f"c{args.rules - 1}", "country": f"k{args.rules // 2}"},
+            data_id="record",
+        )
+    )
+
+    translate_time = measure(lambda: generate_multiple_rule_asp_definition(rule_inputs), args.repeat)
+    rule_definition, _ = generate_multiple_rule_asp_definition(rule_inputs)
+    program = f"{rule_definition}\n{data_definition}"
+    ground_time = measure(lambda: ground(program), args.repeat)
+
+    control = ground(program)
+    control.solve()
+    ground_rules = control.statistics["problem"]["lp"]["rules"]
+
+    print(
+        f"{args.rules} rules: translate {translate_time:.3f}s, "
+        f"program {len(program) / 1024:.0f} KiB, ground {ground_time:.3f}s, {ground_rules:.0f} ground rules"
+    )
+
+
+if __name__ == "__main__":
+    main()
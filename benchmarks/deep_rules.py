@@ -0,0 +1,63 @@
+"""
+Benchmark parsing, simplifying and translating rules nested thousands of levels deep.
+
+Usage: python -m benchmarks.deep_rules [--depth DEPTH] [--repeat REPEAT]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from json_logic_asp.simplifier.simplify import simplify_json_logic
+from json_logic_asp.translator.rule_compiler import RuleCompiler
+
+
+def build_and_rule(depth: int) -> Dict[str, Any]:
+    rule: Dict[str, Any] = {"==": [{"var": "a"}, 0]}
+    for level in range(1, depth):
+        rule = {"and": [{"==": [{"var": "a"}, level]}, {"or": [rule, {"missing": "b"}]}]}
+    return rule
+
+
+def build_if_rule(depth: int) -> Dict[str, Any]:
+    rule: Dict[str, Any] = {"missing": "a"}
+    for level in range(1, depth):
+        rule = {"if": [{">": [{"var": "a"}, level]}, rule, {"missing": "b"}]}
+    return rule
+
+
+def build_not_rule(depth: int) -> Dict[str, Any]:
+    rule: Dict[str, Any] = {"var": "a"}
+    for _ in range(depth):
+        rule = {"!": rule}
+    return rule
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depth", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, builder in [("and/or", build_and_rule), ("if", build_if_rule), ("not", build_not_rule)]:
+        rule = builder(args.depth)
+        parse_time = measure(lambda: RuleCompiler().parse(rule), args.repeat)
+        simplify_time = measure(lambda: simplify_json_logic(rule), args.repeat)
+        emit_time = measure(lambda: RuleCompiler().parse(rule).to_asp_statements(), args.repeat)
+        print(
+            f"{name:>6} depth={args.depth}: parse {parse_time:.3f}s, simplify {simplify_time:.3f}s, "
+            f"parse and emit {emit_time:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
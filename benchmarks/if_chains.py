@@ -0,0 +1,74 @@
+"""
+Benchmark translating and grounding decision-table style rules, with long if/elif/else chains.
+
+Usage: python -m benchmarks.if_chains [--branches BRANCHES] [--rules RULES] [--repeat REPEAT]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from clingo import Control
+
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.translator.data_generator import generate_single_data_asp_definition
+from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_definition
+
+
+def build_if_chain_rule(branches: int, offset: int = 0) -> Dict[str, Any]:
+    children: List[Any] = []
+    for branch in range(branches):
+        children.append({"==": [{"var": "category"}, f"c{branch}"]})
+        children.append({"<": [{"var": "score"}, branch + offset]})
+    children.append({"missing": "score"})
+    return {"if": children}
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def ground(program: str) -> Control:
+    control = Control(["--warn=none"])
+    control.add("base", [], program)
+    control.ground([("base", [])])
+    return control
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--branches", type=int, default=200)
+    parser.add_argument("--rules", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rule_inputs = [
+        RuleInput(rule_tree=build_if_chain_rule(args.branches, offset=rule), rule_id=str(rule))
+        for rule in range(args.rules)
+    ]
+    data_definition = generate_single_data_asp_definition(
+        DataInput(data_object={"category": f"c{args.branches - 1}", "score": 1}, data_id="record")
+    )
+
+    translate_time = measure(lambda: generate_multiple_rule_asp_definition(rule_inputs), args.repeat)
+    rule_definition, _ = generate_multiple_rule_asp_definition(rule_inputs)
+    program = f"{rule_definition}\n{data_definition}"
+    ground_time = measure(lambda: ground(program), args.repeat)
+
+    control = ground(program)
+    control.solve()
+    ground_rules = control.statistics["problem"]["lp"]["rules"]
+
+    print(
+        f"{args.rules} rules of {args.branches} branches: translate {translate_time:.3f}s, "
+        f"program {len(program) / 1024:.0f} KiB, ground {ground_time:.3f}s, {ground_rules:.0f} ground rules"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@ __all__ = [
     "evaluate_single_json_logic_rule_against_single_data",
     "evaluate_multiple_json_logic_rules_against_single_data",
     "evaluate_pregenerated_json_logic_rules_against_single_data",
+    "evaluate_json_logic_rules_against_multiple_data",
+    "RuleSet",
 ]
 
 from .evaluator import (
+    evaluate_json_logic_rules_against_multiple_data,
     evaluate_multiple_json_logic_rules_against_single_data,
     evaluate_pregenerated_json_logic_rules_against_single_data,
     evaluate_single_json_logic_rule_against_single_data,
 )
+from .rule_set import RuleSet
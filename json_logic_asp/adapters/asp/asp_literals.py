@@ -1,23 +1,44 @@
 from abc import ABC
-from typing import List, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
 from json_logic_asp.models.asp_base import Atom
 
 
 class Literal(Atom, ABC):
-    pass
+    __slots__ = ()
+
+    def scoped(self, scope_term: str) -> "Literal":
+        """
+        Return the literal lifted into the given scope (ex: a data record).
+        :param scope_term: term to prepend to predicates
+        :return: lifted literal
+        """
+        return self
 
 
 class PredicateAtom(Literal):
+    __slots__ = ("predicate_name", "terms", "negated", "__asp_atom")
+
     def __init__(
-        self, predicate_name: Union[str, PredicateNames], terms: List[Union[str, VariableNames]], negated: bool = False
+        self,
+        predicate_name: Union[str, PredicateNames],
+        terms: Sequence[Union[str, VariableNames]],
+        negated: bool = False,
     ):
         self.predicate_name = predicate_name if not isinstance(predicate_name, PredicateNames) else predicate_name.value
-        self.terms: List[str] = [term if not isinstance(term, VariableNames) else term.value for term in terms]
+        # Atoms are created for every emitted statement, so their terms are kept in a tuple instead of a list
+        self.terms: Tuple[str, ...] = tuple(
+            term if not isinstance(term, VariableNames) else term.value for term in terms
+        )
         self.negated = negated
+        # Node atoms are reused by every statement referencing the node, so they are only rendered once
+        self.__asp_atom: Optional[str] = None
 
     def to_asp_atom(self):
+        if self.__asp_atom is not None:
+            return self.__asp_atom
+
         asp_terms = ""
         if self.terms:
             asp_terms = f"({', '.join([str(term) for term in self.terms])})"
@@ -26,10 +47,70 @@ class PredicateAtom(Literal):
         if self.negated:
             negated = "not "
 
-        return f"{negated}{self.predicate_name}{asp_terms}"
+        self.__asp_atom = f"{negated}{self.predicate_name}{asp_terms}"
+        return self.__asp_atom
+
+    def scoped(self, scope_term: str) -> "PredicateAtom":
+        return PredicateAtom(
+            predicate_name=self.predicate_name,
+            terms=[scope_term, *self.terms],
+            negated=self.negated,
+        )
+
+
+class ParameterAtom(PredicateAtom):
+    __slots__ = ()
+
+    def scoped(self, scope_term: str) -> "ParameterAtom":
+        # Parameter tables hold rule constants, shared by every scope, so they are never lifted
+        return self
+
+
+# Data atom whose last term is bound to the compared constant (or pool of constants), instead of a variable joined
+# through a comparison, so Clingo looks the value up in the atom index. The variable is kept to join it where cheaper
+class MatchAtom(PredicateAtom):
+    __slots__ = ("variable_name",)
+
+    def __init__(
+        self,
+        predicate_name: Union[str, PredicateNames],
+        terms: Sequence[Union[str, VariableNames]],
+        variable_name: str,
+        negated: bool = False,
+    ):
+        super().__init__(predicate_name=predicate_name, terms=terms, negated=negated)
+        self.variable_name = variable_name
+
+    def scoped(self, scope_term: str) -> "MatchAtom":
+        return MatchAtom(
+            predicate_name=self.predicate_name,
+            terms=[scope_term, *self.terms],
+            variable_name=self.variable_name,
+            negated=self.negated,
+        )
+
+    def to_join_literals(self) -> List[Literal]:
+        """
+        Get the match as the atom with its variable, compared against the constant, as it would be joined.
+        :return: list of literals, only the atom itself if it already matches a variable
+        """
+        value = self.terms[-1]
+        if value[0] == "_" or value[0].isupper():
+            return [self]
+
+        return [
+            PredicateAtom(
+                predicate_name=self.predicate_name,
+                terms=[*self.terms[:-1], self.variable_name],
+                negated=self.negated,
+            ),
+            ComparatorAtom(left_value=self.variable_name, comparator="=", right_value=value),
+        ]
 
 
 class ComparatorAtom(Literal):
+    __slots__ = ("left_value", "comparator", "right_value")
+
     def __init__(self, left_value: Union[str, VariableNames], comparator: str, right_value: Union[str, VariableNames]):
         self.left_value = left_value if not isinstance(left_value, VariableNames) else left_value.value
         self.comparator = comparator
@@ -1,30 +1,70 @@
-from typing import Sequence, Union
+from typing import List, Optional, Sequence, Union
 
-from json_logic_asp.adapters.asp.asp_literals import Literal, PredicateAtom
+from json_logic_asp.adapters.asp.asp_literals import Literal, MatchAtom, ParameterAtom, PredicateAtom
 from json_logic_asp.constants.asp_naming import PredicateNames
 from json_logic_asp.models.asp_base import Statement
 
 
 class FactStatement(Statement):
+    __slots__ = ("atom", "__asp_statement")
+
     def __init__(self, atom: PredicateAtom, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.atom = atom
+        self.__asp_statement: Optional[str] = None
 
     def to_asp_statement(self):
-        return f"{self.atom.to_asp_atom()}."
+        if self.__asp_statement is None:
+            self.__asp_statement = f"{self.atom.to_asp_atom()}."
+        return self.__asp_statement
+
+    def scoped(self, scope_term: str, scope_guard: Optional[PredicateAtom] = None) -> Statement:
+        if scope_guard is None:
+            return FactStatement(atom=self.atom.scoped(scope_term), comment=self.comment)
+        return RuleStatement(atom=self.atom.scoped(scope_term), literals=[scope_guard], comment=self.comment)
+
+
+class ParameterFactStatement(FactStatement):
+    __slots__ = ()
+
+    def __init__(self, atom: ParameterAtom, *args, **kwargs):
+        super().__init__(atom, *args, **kwargs)
+
+    def scoped(self, scope_term: str, scope_guard: Optional[PredicateAtom] = None) -> Statement:
+        # Parameter tables hold rule constants, shared by every scope, so they are never lifted
+        return self
 
 
 class RuleStatement(Statement):
+    __slots__ = ("atom", "literals", "__asp_statement")
+
     def __init__(self, atom: PredicateAtom, literals: Sequence[Literal], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.atom = atom
         self.literals = literals
+        # Node statements are kept and emitted again for every rule sharing the node, so they are only rendered once
+        self.__asp_statement: Optional[str] = None
 
     def to_asp_statement(self):
-        return f"{self.atom.to_asp_atom()} :- {', '.join([literal.to_asp_atom() for literal in self.literals])}."
+        if self.__asp_statement is None:
+            literals = ", ".join([literal.to_asp_atom() for literal in self.literals])
+            self.__asp_statement = f"{self.atom.to_asp_atom()} :- {literals}."
+        return self.__asp_statement
+
+    def scoped(self, scope_term: str, scope_guard: Optional[PredicateAtom] = None) -> Statement:
+        literals: List[Literal] = [] if scope_guard is None else [scope_guard]
+        for literal in self.literals:
+            if isinstance(literal, MatchAtom) and (scope_term[0] == "_" or scope_term[0].isupper()):
+                # Clingo indexes each constant matched along a scope variable on its own, so joining is cheaper there
+                literals.extend(literal.scoped(scope_term).to_join_literals())
+            else:
+                literals.append(literal.scoped(scope_term))
+        return RuleStatement(atom=self.atom.scoped(scope_term), literals=literals, comment=self.comment)
 
 
 class DirectiveStatement(Statement):
+    __slots__ = ("action", "statement")
+
     def __init__(self, action: str, statement: str):
         super().__init__(comment=None)
         self.action = action
@@ -35,7 +75,14 @@ class DirectiveStatement(Statement):
 
 
 class ShowStatement(DirectiveStatement):
+    __slots__ = ("predicate", "length")
+
     def __init__(self, predicate: Union[str, PredicateNames], length: int):
         if isinstance(predicate, PredicateNames):
             predicate = predicate.value
         super().__init__(action="show", statement=f"{predicate}/{length}")
+        self.predicate = predicate
+        self.length = length
+
+    def scoped(self, scope_term: str, scope_guard: Optional[PredicateAtom] = None) -> Statement:
+        return ShowStatement(predicate=self.predicate, length=self.length + 1)
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Dict, List, Set, Union
 
 from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, Literal
 from json_logic_asp.adapters.asp.asp_statements import RuleStatement
@@ -10,11 +10,17 @@ from json_logic_asp.models.json_logic_nodes import (
     JsonLogicMultiDataNode,
     JsonLogicOperationNode,
     JsonLogicSingleDataNode,
+    get_canonical_sort_key,
 )
-from json_logic_asp.utils.json_logic_helpers import value_encoder
+from json_logic_asp.utils.json_logic_helpers import EncodedValue, native_value_encoder, value_encoder
+
+# Native encoding of the value the ASP encoding assigns to a merge without primitives (the empty tuple "()")
+EMPTY_MERGE_VALUE: EncodedValue = (1, "")
 
 
 class ArrayMergeNode(JsonLogicMultiDataNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(
             accepted_child_node_types=(JsonLogicDataNode, int, float, bool, str),
@@ -62,16 +68,36 @@ class ArrayMergeNode(JsonLogicMultiDataNode):
 
         return stmts
 
+    def get_values(self, data: Dict[str, EncodedValue]) -> List[EncodedValue]:
+        values: List[EncodedValue] = []
+
+        primitives = [v for v in self.child_nodes if not isinstance(v, JsonLogicDataNode)]
+        if primitives:
+            values.extend(native_value_encoder(val) for val in primitives)
+        else:
+            values.append(EMPTY_MERGE_VALUE)
+
+        for var_node in self.child_nodes:
+            if isinstance(var_node, JsonLogicDataNode):
+                values.extend(var_node.get_values(data))
+
+        return values
+
     def __str__(self):
         return f"MERGE({self.node_id})"
 
+    def _has_unordered_child_nodes(self) -> bool:
+        return True
+
     def __hash__(self):
         return hash(
-            (PredicateNames.ARRAY_MERGE, tuple(sorted([hash(val) for val in self.child_nodes]))),
+            (PredicateNames.ARRAY_MERGE, self._get_children_hash()),
         )
 
 
 class ArrayInNode(JsonLogicOperationNode):
+    __slots__ = ("data_node", "list_node")
+
     def __init__(self, *children):
         super().__init__(operation_name=PredicateNames.ARRAY_IN, accepted_child_node_types=(JsonLogicDataNode, list))
 
@@ -113,7 +139,10 @@ class ArrayInNode(JsonLogicOperationNode):
                     t = type(list_elem).__name__
                     raise ValueError(f"ArrayInNode expects at least 1 list primitive nodes, received {t}")
 
-        for node in children:
+        # Only membership matters, so literal lists and the children are kept in a canonical order
+        if isinstance(self.list_node, list):
+            self.list_node = sorted(self.list_node, key=get_canonical_sort_key)
+        for node in (self.data_node, self.list_node):
             self.register_child(node)
 
     def get_asp_statements(self) -> List[Statement]:
@@ -126,18 +155,13 @@ class ArrayInNode(JsonLogicOperationNode):
         list_node = self.list_node
         var_name = get_comment_var_name(data_node)
 
-        literals.append(data_node.get_asp_atom_with_different_variable_name(VariableNames.IN))
         if isinstance(list_node, list):
+            # Literal lists bind the data term to the pool of values, so Clingo looks each one up instead of joining
             right_val = [value_encoder(val) for val in list_node]
-            literals.append(
-                ComparatorAtom(
-                    left_value=VariableNames.IN,
-                    comparator="=",
-                    right_value=f"({';'.join(right_val)})",
-                )
-            )
+            literals.append(data_node.get_asp_atom_matching_value(f"({';'.join(right_val)})", VariableNames.IN.value))
             comment = f"{var_name} IN ({', '.join([str(stmt) for stmt in list_node])})"
         else:
+            literals.append(data_node.get_asp_atom_with_different_variable_name(VariableNames.IN))
             literals.append(list_node.get_asp_atom_with_different_variable_name(VariableNames.IN))
             comment = f"{var_name} IN ({str(list_node)})"
 
@@ -149,6 +173,15 @@ class ArrayInNode(JsonLogicOperationNode):
             )
         ]
 
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        list_values: Set[EncodedValue]
+        if isinstance(self.list_node, list):
+            list_values = {native_value_encoder(val) for val in self.list_node}
+        else:
+            list_values = set(self.list_node.get_values(data))
+
+        return any(value in list_values for value in self.data_node.get_values(data))
+
     def __str__(self):
         return f"IN({self.node_id})"
 
@@ -159,6 +192,6 @@ class ArrayInNode(JsonLogicOperationNode):
                 hash(self.data_node),
                 hash(self.list_node)
                 if isinstance(self.list_node, JsonLogicMultiDataNode)
-                else hash(tuple(sorted(self.list_node))),
+                else hash(tuple(self.list_node)),
             ),
         )
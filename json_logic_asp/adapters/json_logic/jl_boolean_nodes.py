@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
 from json_logic_asp.adapters.asp.asp_statements import FactStatement, RuleStatement
@@ -12,9 +12,12 @@ from json_logic_asp.models.json_logic_nodes import (
     JsonLogicOperationNode,
     JsonLogicTreeNode,
 )
+from json_logic_asp.utils.json_logic_helpers import EncodedValue
 
 
 class BooleanAndOrNode(JsonLogicTreeNode, ABC):
+    __slots__ = ()
+
     def __init__(self, *children, operation_name: str):
         super().__init__(
             operation_name=operation_name,
@@ -45,6 +48,8 @@ class BooleanAndOrNode(JsonLogicTreeNode, ABC):
 
 
 class BooleanAndNode(BooleanAndOrNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(operation_name=PredicateNames.BOOLEAN_AND, *children)
 
@@ -75,8 +80,29 @@ class BooleanAndNode(BooleanAndOrNode):
             )
         ]
 
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        if self.has_false:
+            return False
+
+        # Data children atoms share their term variable in the ASP rule body, so they must agree on a common value
+        shared_values: Dict[str, Set[EncodedValue]] = {}
+        for child_node in self.child_nodes:
+            if isinstance(child_node, JsonLogicDataNode):
+                values = set(child_node.get_values(data))
+                if child_node.term_variable_name in shared_values:
+                    values &= shared_values[child_node.term_variable_name]
+                if not values:
+                    return False
+                shared_values[child_node.term_variable_name] = values
+            elif isinstance(child_node, JsonLogicNode) and not child_node.evaluate(data):
+                return False
+
+        return True
+
 
 class BooleanOrNode(BooleanAndOrNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(operation_name=PredicateNames.BOOLEAN_OR, *children)
 
@@ -104,8 +130,18 @@ class BooleanOrNode(BooleanAndOrNode):
 
         return stmts
 
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        if self.has_true:
+            return True
+
+        return any(
+            child_node.evaluate(data) for child_node in self.child_nodes if isinstance(child_node, JsonLogicNode)
+        )
+
 
 class BooleanNotNode(JsonLogicTreeNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(operation_name=PredicateNames.BOOLEAN_NOT)
 
@@ -143,3 +179,7 @@ class BooleanNotNode(JsonLogicTreeNode):
                 comment=comment,
             )
         ]
+
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        # Negated "var" nodes are "not present", which matches negating their evaluation
+        return not self.child_nodes[0].evaluate(data)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from json_logic_asp.adapters.asp.asp_literals import Literal, PredicateAtom
 from json_logic_asp.adapters.asp.asp_statements import RuleStatement
@@ -6,9 +6,12 @@ from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
 from json_logic_asp.models.asp_base import Statement
 from json_logic_asp.models.json_logic_nodes import JsonLogicOperationNode, JsonLogicSingleDataNode
 from json_logic_asp.utils.id_management import generate_constant_string
+from json_logic_asp.utils.json_logic_helpers import EncodedValue
 
 
 class DataVarNode(JsonLogicSingleDataNode):
+    __slots__ = ("var_name",)
+
     def __init__(self, *children):
         super().__init__(term_variable_name=VariableNames.VAR, operation_name=PredicateNames.DATA_VAR)
 
@@ -31,6 +34,11 @@ class DataVarNode(JsonLogicSingleDataNode):
         # return [FactStatement(atom=self.get_asp_atom())]
         return []
 
+    def get_values(self, data: Dict[str, EncodedValue]) -> List[EncodedValue]:
+        if self.var_name not in data:
+            return []
+        return [data[self.var_name]]
+
     def __str__(self):
         return f"VAR({self.var_name})"
 
@@ -44,6 +52,8 @@ class DataVarNode(JsonLogicSingleDataNode):
 
 
 class DataMissingNode(JsonLogicOperationNode):
+    __slots__ = ("var_names",)
+
     def __init__(self, *children):
         super().__init__(operation_name=PredicateNames.DATA_MISSING)
 
@@ -56,6 +66,8 @@ class DataMissingNode(JsonLogicOperationNode):
                 raise ValueError(f"DataMissingNode requires str as value, received {type(var_name).__name__}")
             if var_name not in self.var_names:
                 self.var_names.append(var_name)
+        # Only the set of names matters, so they are kept sorted
+        self.var_names.sort()
 
     def get_asp_statements(self) -> List[Statement]:
         literals: List[Literal] = []
@@ -79,6 +91,9 @@ class DataMissingNode(JsonLogicOperationNode):
             )
         ]
 
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        return all(var_name not in data for var_name in self.var_names)
+
     def __str__(self):
         return f"MISSING({','.join(self.var_names)})"
 
@@ -86,6 +101,6 @@ class DataMissingNode(JsonLogicOperationNode):
         return hash(
             (
                 PredicateNames.DATA_MISSING,
-                tuple(sorted(self.var_names)),
+                tuple(self.var_names),
             )
         )
@@ -1,12 +1,15 @@
-from typing import List
+from typing import Dict, List
 
 from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
 from json_logic_asp.constants.asp_naming import PredicateNames
 from json_logic_asp.models.asp_base import Statement
 from json_logic_asp.models.json_logic_nodes import JsonLogicNode
+from json_logic_asp.utils.json_logic_helpers import EncodedValue
 
 
 class JsonLogicHelperBoolNode(JsonLogicNode):
+    __slots__ = ("bool",)
+
     def __init__(self, *children):
         super().__init__(accepted_child_node_types=(bool,), operation_name=PredicateNames.BOOL)
 
@@ -32,6 +35,9 @@ class JsonLogicHelperBoolNode(JsonLogicNode):
     def get_asp_statements(self) -> List[Statement]:
         return []
 
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        return self.bool
+
     def __str__(self):
         return f"BOOL({self.encoded_bool})"
 
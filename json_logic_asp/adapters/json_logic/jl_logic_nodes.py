@@ -1,5 +1,7 @@
+import operator
 from abc import ABC
-from typing import Dict, List
+from itertools import product
+from typing import Any, Callable, Dict, List, Optional
 
 from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, Literal, PredicateAtom
 from json_logic_asp.adapters.asp.asp_statements import FactStatement, RuleStatement
@@ -8,16 +10,28 @@ from json_logic_asp.adapters.json_logic.jl_helper_nodes import JsonLogicHelperBo
 from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
 from json_logic_asp.models.asp_base import Statement
 from json_logic_asp.models.json_logic_nodes import (
+    JsonLogicDataNode,
     JsonLogicNode,
     JsonLogicOperationNode,
     JsonLogicSingleDataNode,
     JsonLogicTreeNode,
 )
-from json_logic_asp.utils.id_management import generate_unique_id
-from json_logic_asp.utils.json_logic_helpers import value_encoder
+from json_logic_asp.utils.id_management import generate_content_id
+from json_logic_asp.utils.json_logic_helpers import EncodedValue, native_value_encoder, value_encoder
+
+NATIVE_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
 
 
 class LogicIfNode(JsonLogicTreeNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(
             operation_name=PredicateNames.LOGIC_IF,
@@ -37,98 +51,108 @@ class LogicIfNode(JsonLogicTreeNode):
             for child_node in self.child_nodes
         ]
 
-    def get_asp_statements(self) -> List[Statement]:
-        # Evaluation happens in pairs: if(A, B, C, D, E, F, Z) gets translated to
-        #   else(nodeZ) :- not A, not C, not E, Z.
-        #   elif(node3) :- else(node4)
-        #   elif(node3) :- not A, not C, E, F
-        #   elif(node2) :- elif(node3)
-        #   elif(node2) :- not A, C, D
-        #   if(node1) :- elif(node2)
-        #   if(node1) :- A, B
+    @staticmethod
+    def __get_branch_literal(child_node: JsonLogicNode, negated: bool = False) -> PredicateAtom:
+        # Data nodes only need to be present, so their value is matched with an anonymous variable. That keeps the rules
+        # safe when they are negated, and never joins the values of different data nodes
+        if isinstance(child_node, JsonLogicDataNode):
+            return child_node.get_asp_atom_with_different_variable_name(VariableNames.ANY, negated=negated)
+        return child_node.get_negated_asp_atom() if negated else child_node.get_asp_atom()
 
-        total_nodes = len(self.child_nodes)
-        # Only generate elif's when there are more than 3 nodes
-        total_elifs = 0 if total_nodes < 4 else total_nodes // 2 - 1
-        # Only generate else when there are more than 1 node
-        has_else = total_nodes > 1 and total_nodes % 2 == 1
-
-        encoded_child_atoms = self.get_encoded_child_nodes()
+    def get_asp_statements(self) -> List[Statement]:
+        # Evaluation happens in pairs, every branch chaining to the next one when its condition does not hold, so the
+        # encoding grows linearly with the branches: if(A, B, C, D, E, F, Z) gets translated to
+        #   else(nodeZ) :- Z.
+        #   elif(node3) :- not E, else(nodeZ).
+        #   elif(node3) :- E, F.
+        #   elif(node2) :- not C, elif(node3).
+        #   elif(node2) :- C, D.
+        #   if(node1) :- not A, elif(node2).
+        #   if(node1) :- A, B.
+
+        encoded_child_nodes = self.get_encoded_child_nodes()
+        total_nodes = len(encoded_child_nodes)
 
         stmts: List[Statement] = []
-        negated_atoms: List[PredicateAtom] = []
-
-        begin_i, end_i = 0, min(total_nodes, 2)
-        # if(node1) :- A, B
-        stmts.append(
-            RuleStatement(
-                atom=self.get_asp_atom(),
-                literals=[child.get_asp_atom() for child in encoded_child_atoms[begin_i:end_i]],
-            )
-        )
-        negated_atoms.append(encoded_child_atoms[begin_i].get_negated_asp_atom())
-        prev_atom = self.get_asp_atom()
-
-        for _ in range(total_elifs):
-            new_atom = PredicateAtom(predicate_name=PredicateNames.LOGIC_IF_ELIF, terms=[generate_unique_id()])
-            # if(node1) :- elif(node2)
-            stmts.append(
-                RuleStatement(
-                    atom=prev_atom,
-                    literals=[new_atom],
+        branch_atom = self.get_asp_atom()
+        begin_i = 0
+
+        # Every branch but the last one holds when its condition and its value do, or when its condition does not and
+        # the next branch holds
+        while total_nodes - begin_i > 2:
+            condition_node, value_node = encoded_child_nodes[begin_i : begin_i + 2]
+            if total_nodes - begin_i == 3:
+                next_atom = PredicateAtom(
+                    predicate_name=PredicateNames.LOGIC_IF_ELSE,
+                    terms=[generate_content_id(f"{PredicateNames.LOGIC_IF_ELSE.value}({self.node_id})")],
                 )
-            )
-            begin_i += 2
-            end_i += 2
-            # elif(node2) :- not A, C, D
-            stmts.append(
-                RuleStatement(
-                    atom=new_atom,
-                    literals=negated_atoms + [child.get_asp_atom() for child in encoded_child_atoms[begin_i:end_i]],
+            else:
+                next_atom = PredicateAtom(
+                    predicate_name=PredicateNames.LOGIC_IF_ELIF,
+                    terms=[
+                        generate_content_id(f"{PredicateNames.LOGIC_IF_ELIF.value}({self.node_id}, {begin_i // 2})")
+                    ],
                 )
-            )
-            negated_atoms.append(encoded_child_atoms[begin_i].get_negated_asp_atom())
-            prev_atom = new_atom
 
-        if has_else:
-            new_atom = PredicateAtom(predicate_name=PredicateNames.LOGIC_IF_ELSE, terms=[generate_unique_id()])
+            # if(node1) :- A, B
             stmts.append(
                 RuleStatement(
-                    atom=prev_atom,
-                    literals=[new_atom],
+                    atom=branch_atom,
+                    literals=[self.__get_branch_literal(condition_node), self.__get_branch_literal(value_node)],
                 )
             )
-            begin_i += 2
-            end_i += 1
-            # else(nodeZ) :- not A, not C, not E, Z.
+            # if(node1) :- not A, elif(node2)
             stmts.append(
                 RuleStatement(
-                    atom=new_atom,
-                    literals=negated_atoms + [child.get_asp_atom() for child in encoded_child_atoms[begin_i:end_i]],
+                    atom=branch_atom,
+                    literals=[self.__get_branch_literal(condition_node, negated=True), next_atom],
                 )
             )
+            branch_atom = next_atom
+            begin_i += 2
 
+        # The last branch holds when its condition and its value do, or it is the else node
         stmts.append(
-            FactStatement(
-                atom=PredicateAtom(
-                    predicate_name=PredicateNames.BOOL,
-                    terms=["true"],
-                )
+            RuleStatement(
+                atom=branch_atom,
+                literals=[self.__get_branch_literal(child) for child in encoded_child_nodes[begin_i:]],
             )
         )
 
+        # Only a true child needs the fact to hold, as nothing derives a false one
+        if any(child_node is True for child_node in self.child_nodes):
+            stmts.append(
+                FactStatement(
+                    atom=PredicateAtom(
+                        predicate_name=PredicateNames.BOOL,
+                        terms=["true"],
+                    )
+                )
+            )
+
         return list(reversed(stmts))
 
-    def __hash__(self):
-        return hash(
-            (
-                self.operation_name,
-                self._get_children_hash(sort=False),
-            )
-        )
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        total_nodes = len(self.child_nodes)
+
+        # Evaluation happens in pairs: the first condition that holds decides with its value, otherwise the else node
+        for i in range(0, total_nodes - 1, 2):
+            if self._evaluate_child(self.child_nodes[i], data):
+                return self._evaluate_child(self.child_nodes[i + 1], data)
+
+        if total_nodes % 2 == 1:
+            return self._evaluate_child(self.child_nodes[-1], data)
+
+        return False
+
+    def _has_unordered_child_nodes(self) -> bool:
+        # Conditions are checked in order, and each one is followed by its value
+        return False
 
 
 class LogicEvalNode(JsonLogicOperationNode, ABC):
+    __slots__ = ("comparator", "predicate")
+
     def __init__(self, *children, comparator: str, predicate: str):
         super().__init__(
             operation_name=predicate, accepted_child_node_types=(JsonLogicSingleDataNode, str, bool, float, int)
@@ -145,7 +169,30 @@ class LogicEvalNode(JsonLogicOperationNode, ABC):
                 node = node[0]
             self.register_child(node)
 
+    def __get_constant_match_statement(self) -> Optional[Statement]:
+        if self.comparator != "==" or len(self.child_nodes) != 2:
+            return None
+
+        data_nodes = [child_node for child_node in self.child_nodes if isinstance(child_node, JsonLogicSingleDataNode)]
+        if len(data_nodes) != 1:
+            return None
+        data_node = data_nodes[0]
+        constant = self.child_nodes[1] if self.child_nodes[0] is data_node else self.child_nodes[0]
+
+        # Equality against a constant binds the data term to it, so Clingo looks the value up instead of joining
+        data_name = data_node.var_name if isinstance(data_node, DataVarNode) else str(data_node)
+        comment_parts = [data_name if child_node is data_node else str(constant) for child_node in self.child_nodes]
+        return RuleStatement(
+            atom=self.get_asp_atom(),
+            literals=[data_node.get_asp_atom_matching_value(value_encoder(constant), f"{VariableNames.VAR.value}1")],
+            comment=f" {self.predicate.upper()} ".join(comment_parts),
+        )
+
     def get_asp_statements(self) -> List[Statement]:
+        constant_match_statement = self.__get_constant_match_statement()
+        if constant_match_statement is not None:
+            return [constant_match_statement]
+
         literals: List[Literal] = []
         comment_parts: List[str] = []
 
@@ -195,50 +242,93 @@ class LogicEvalNode(JsonLogicOperationNode, ABC):
             )
         ]
 
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        if self.comparator not in NATIVE_COMPARATORS:
+            raise NotImplementedError(f"{self.__class__.__name__} does not support native evaluation")
+        comparator = NATIVE_COMPARATORS[self.comparator]
+
+        data_nodes: List[JsonLogicSingleDataNode] = []
+        operands: List[Any] = []
+        for child_node in self.child_nodes:
+            if isinstance(child_node, JsonLogicSingleDataNode):
+                if child_node not in data_nodes:
+                    data_nodes.append(child_node)
+                operands.append(data_nodes.index(child_node))
+            else:
+                operands.append(native_value_encoder(child_node))
+
+        # Same as the ASP encoding, the node holds if any combination of the data node values satisfies all comparisons
+        for combination in product(*[data_node.get_values(data) for data_node in data_nodes]):
+            values = [combination[operand] if isinstance(operand, int) else operand for operand in operands]
+            if all(comparator(values[i], values[i + 1]) for i in range(len(values) - 1)):
+                return True
+
+        return False
+
     def __str__(self):
         return f"{self.predicate.upper()}({self.node_id})"
 
+    def _has_unordered_child_nodes(self) -> bool:
+        # Only equality and inequality are symmetric, and only between two operands, as longer chains compare in pairs
+        return self.comparator in ("==", "!=") and len(self.child_nodes) == 2
+
     def __hash__(self):
-        return hash((self.predicate, tuple(sorted(hash(child) for child in self.child_nodes))))
+        return hash((self.predicate, self._get_children_hash(sort=self._has_unordered_child_nodes())))
 
 
 class LogicEqualNode(LogicEvalNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         # TODO: This is wrong
         super().__init__(comparator="==", predicate=PredicateNames.LOGIC_EQUALS, *children)
 
 
 class LogicNotEqualNode(LogicEvalNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         # TODO: This is wrong
         super().__init__(comparator="!=", predicate=PredicateNames.LOGIC_NOTEQUALS, *children)
 
 
 class LogicStrictEqualNode(LogicEvalNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(comparator="==", predicate=PredicateNames.LOGIC_STRICTEQUALS, *children)
 
 
 class LogicStrictNotEqualNode(LogicEvalNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(comparator="!=", predicate=PredicateNames.LOGIC_STRICTNOTEQUALS, *children)
 
 
 class LogicLowerThanNode(LogicEvalNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(comparator="<", predicate=PredicateNames.LOGIC_LOWER, *children)
 
 
 class LogicLowerOrEqualThanNode(LogicEvalNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(comparator="<=", predicate=PredicateNames.LOGIC_LOWEREQUAL, *children)
 
 
 class LogicGreaterThanNode(LogicEvalNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(comparator=">", predicate=PredicateNames.LOGIC_GREATER, *children)
 
 
 class LogicGreaterOrEqualThanNode(LogicEvalNode):
+    __slots__ = ()
+
     def __init__(self, *children):
         super().__init__(comparator=">=", predicate=PredicateNames.LOGIC_GREATEREQUAL, *children)
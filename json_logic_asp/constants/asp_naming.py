@@ -22,6 +22,10 @@ class PredicateNames(str, Enum):
     LOGIC_GREATEREQUAL = "gte"
 
     RULE = "rule"
+    PARAMETER = "param"
+
+    ACTIVE = "active"
+    RECORD = "record"
 
     BOOL = "bool"
 
@@ -31,3 +35,6 @@ class VariableNames(str, Enum):
     VAR = "V"
     MERGE = "M"
     IN = "I"
+    RECORD = "D"
+    NODE = "N"
+    PARAMETER = "P"
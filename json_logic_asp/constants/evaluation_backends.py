@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class EvaluationBackends(str, Enum):
+    # Translate to ASP and solve with Clingo, the reference engine
+    CLINGO = "clingo"
+    # Evaluate the parsed nodes directly in Python, for the nodes supporting it
+    NATIVE = "native"
+    # Compile every rule into a Python function, falling back to Clingo for the rules that cannot be compiled
+    COMPILED = "compiled"
@@ -1,10 +1,10 @@
 from typing import Dict, List, Optional, Type
 
+from json_logic_asp.constants.evaluation_backends import EvaluationBackends
 from json_logic_asp.invoker.run import get_matching_rules_for_asp_rules_and_data
 from json_logic_asp.models.translator_dto import DataInput, RuleInput
-from json_logic_asp.simplifier.simplify import simplify_json_logic
+from json_logic_asp.rule_set import RuleSet
 from json_logic_asp.translator.data_generator import generate_single_data_asp_definition
-from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_definition
 
 
 def evaluate_pregenerated_json_logic_rules_against_single_data(
@@ -38,6 +38,7 @@ def evaluate_multiple_json_logic_rules_against_single_data(
     json_logic_data: DataInput,
     simplify: bool = False,
     custom_nodes: Optional[Dict[str, Type]] = None,
+    backend: EvaluationBackends = EvaluationBackends.CLINGO,
 ) -> List[str]:
     """
     Given a multiple JSON Logic rules and data, evaluate it using Clingo.
@@ -45,30 +46,17 @@ def evaluate_multiple_json_logic_rules_against_single_data(
     :param json_logic_data: data input object
     :param simplify: if True, simplifies the JSON Logic definition
     :param custom_nodes: optional dictionary of custom nodes to parse
+    :param backend: backend used to evaluate the rules
     :return: list of rule ids matching the data
     """
-    if simplify:
-        new_json_logic_rules: List[RuleInput] = []
-        for json_logic_rule in json_logic_rules:
-            new_json_logic_rules.append(
-                RuleInput(
-                    rule_id=json_logic_rule.rule_id,
-                    rule_tree=simplify_json_logic(json_logic_rule.rule_tree),
-                )
-            )
-        json_logic_rules = new_json_logic_rules
-
-    asp_rules_definition, rule_id_mapping = generate_multiple_rule_asp_definition(
+    rule_set = RuleSet(
         rule_inputs=json_logic_rules,
-        with_comments=False,
+        simplify=simplify,
         custom_nodes=custom_nodes,
+        backend=backend,
     )
 
-    return evaluate_pregenerated_json_logic_rules_against_single_data(
-        json_logic_rules_in_asp_definition=asp_rules_definition,
-        json_logic_data=json_logic_data,
-        rule_id_mapping=rule_id_mapping,
-    )
+    return rule_set.evaluate(json_logic_data)
 
 
 def evaluate_single_json_logic_rule_against_single_data(
@@ -76,6 +64,7 @@ def evaluate_single_json_logic_rule_against_single_data(
     json_logic_data: DataInput,
     simplify: bool = False,
     custom_nodes: Optional[Dict[str, Type]] = None,
+    backend: EvaluationBackends = EvaluationBackends.CLINGO,
 ) -> bool:
     """
     Given a single JSON Logic rule and data, evaluate it using Clingo.
@@ -83,6 +72,7 @@ def evaluate_single_json_logic_rule_against_single_data(
     :param json_logic_data: data input object
     :param simplify: if True, simplifies the JSON Logic definition
     :param custom_nodes: optional dictionary of custom nodes to parse
+    :param backend: backend used to evaluate the rule
     :return: whether the rule matches or not the data
     """
     matching_rules = evaluate_multiple_json_logic_rules_against_single_data(
@@ -90,6 +80,35 @@ def evaluate_single_json_logic_rule_against_single_data(
         json_logic_data=json_logic_data,
         simplify=simplify,
         custom_nodes=custom_nodes,
+        backend=backend,
     )
 
     return len(matching_rules) == 1
+
+
+def evaluate_json_logic_rules_against_multiple_data(
+    json_logic_rules: List[RuleInput],
+    json_logic_data: List[DataInput],
+    simplify: bool = False,
+    custom_nodes: Optional[Dict[str, Type]] = None,
+    batch_size: int = RuleSet.DEFAULT_BATCH_SIZE,
+    backend: EvaluationBackends = EvaluationBackends.CLINGO,
+) -> Dict[str, List[str]]:
+    """
+    Given multiple JSON Logic rules and multiple data, evaluate them using Clingo, solving data in batches.
+    :param json_logic_rules: list of rule input with JSON Logic definitions
+    :param json_logic_data: list of data input objects
+    :param simplify: if True, simplifies the JSON Logic definition
+    :param custom_nodes: optional dictionary of custom nodes to parse
+    :param batch_size: maximum number of data objects to evaluate in the same Clingo call
+    :param backend: backend used to evaluate the rules
+    :return: dictionary of data id and list of rule ids matching it
+    """
+    rule_set = RuleSet(
+        rule_inputs=json_logic_rules,
+        simplify=simplify,
+        custom_nodes=custom_nodes,
+        backend=backend,
+    )
+
+    return rule_set.evaluate_many(json_logic_data, batch_size=batch_size)
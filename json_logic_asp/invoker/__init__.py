@@ -1,6 +1,22 @@
 __all__ = [
     "get_matching_rules_from_asp_problem",
     "get_matching_rules_for_asp_rules_and_data",
+    "get_matching_rules_for_asp_rules_and_multiple_data",
+    "get_matching_rules_from_clingo_engine",
+    "get_matching_rules_for_asp_program_and_data",
+    "get_matching_rules_for_asp_program_and_multiple_data",
+    "get_matching_rules_for_native_rules_and_data",
+    "get_matching_rules_for_compiled_rules_and_data",
+    "get_matching_rules_matrix_for_native_rules_and_columns",
 ]
 
-from .run import get_matching_rules_for_asp_rules_and_data, get_matching_rules_from_asp_problem
+from .native import get_matching_rules_for_compiled_rules_and_data, get_matching_rules_for_native_rules_and_data
+from .run import (
+    get_matching_rules_for_asp_program_and_data,
+    get_matching_rules_for_asp_program_and_multiple_data,
+    get_matching_rules_for_asp_rules_and_data,
+    get_matching_rules_for_asp_rules_and_multiple_data,
+    get_matching_rules_from_asp_problem,
+    get_matching_rules_from_clingo_engine,
+)
+from .vectorized import get_matching_rules_matrix_for_native_rules_and_columns
@@ -0,0 +1,48 @@
+import logging
+from typing import Callable, Dict, List, Optional
+
+from json_logic_asp.constants.loggers import INVOKER_LOGGER_NAME
+from json_logic_asp.models.json_logic_nodes import JsonLogicNode
+from json_logic_asp.utils.json_logic_helpers import EncodedValue
+
+log = logging.getLogger(INVOKER_LOGGER_NAME)
+
+
+def get_matching_rules_for_native_rules_and_data(
+    rule_nodes: Dict[str, JsonLogicNode], data_values: Dict[str, EncodedValue], mapping: Optional[Dict[str, str]] = None
+) -> List[str]:
+    """
+    Given some parsed rules and natively encoded data, evaluate them in Python and return the matching rules.
+    :param rule_nodes: dictionary of ASP rule id and its parsed root node
+    :param data_values: flattened data with natively encoded values
+    :param mapping: optional mapping for the ASP rule ids
+    :return: list of matching rules, mapped if provided
+    """
+    matching_rules = [rule_id for rule_id, rule_node in rule_nodes.items() if rule_node.evaluate(data_values)]
+    log.debug(f"Natively matched {len(matching_rules)} out of {len(rule_nodes)} rules")
+
+    if mapping:
+        return [mapping[rule_id] if rule_id in mapping else rule_id for rule_id in matching_rules]
+
+    return matching_rules
+
+
+def get_matching_rules_for_compiled_rules_and_data(
+    rule_functions: Dict[str, Callable[[Dict[str, EncodedValue]], bool]],
+    data_values: Dict[str, EncodedValue],
+    mapping: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """
+    Given some rules compiled to Python functions and natively encoded data, return the matching rules.
+    :param rule_functions: dictionary of ASP rule id and its compiled function
+    :param data_values: flattened data with natively encoded values
+    :param mapping: optional mapping for the ASP rule ids
+    :return: list of matching rules, mapped if provided
+    """
+    matching_rules = [rule_id for rule_id, rule_function in rule_functions.items() if rule_function(data_values)]
+    log.debug(f"Compiled functions matched {len(matching_rules)} out of {len(rule_functions)} rules")
+
+    if mapping:
+        return [mapping[rule_id] if rule_id in mapping else rule_id for rule_id in matching_rules]
+
+    return matching_rules
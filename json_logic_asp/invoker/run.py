@@ -1,12 +1,23 @@
 import logging
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from clingo import ast
+
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
 from json_logic_asp.adapters.asp.asp_statements import ShowStatement
+from json_logic_asp.constants.asp_naming import PredicateNames
 from json_logic_asp.constants.loggers import INVOKER_LOGGER_NAME
 from json_logic_asp.models.clingo_dto import ClingoOutput
-from json_logic_asp.sdk.clingo_sdk import run_clingo
+from json_logic_asp.sdk.clingo_engine import ClingoEngine
+from json_logic_asp.sdk.clingo_sdk import (
+    run_clingo,
+    run_clingo_ast_program,
+    run_clingo_program,
+    run_clingo_scoped_ast_program,
+    run_clingo_scoped_program,
+)
 
 log = logging.getLogger(INVOKER_LOGGER_NAME)
 
@@ -26,48 +37,207 @@ def __store_clingo_temp_file(problem: str) -> Path:
     return Path(file.name)
 
 
-def get_matching_rules_from_asp_problem(problem: str, mapping: Optional[Dict[str, str]] = None) -> List[str]:
+def __expand_rule_groups(matching_rules: List[str], rule_groups: Optional[Dict[str, List[str]]]) -> List[str]:
+    if not rule_groups:
+        return matching_rules
+    return [rule_id for group_id in matching_rules for rule_id in rule_groups.get(group_id, [group_id])]
+
+
+def __map_matching_rules(
+    status: str,
+    matching_rules: List[str],
+    mapping: Optional[Dict[str, str]],
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+) -> List[str]:
+    output = ClingoOutput(
+        success=status == "SAT",
+        matching_rules=__expand_rule_groups(matching_rules, rule_groups),
+    )
+
+    if output.success and mapping:
+        return [mapping[rule_id] if rule_id in mapping else rule_id for rule_id in output.matching_rules]
+
+    return output.matching_rules
+
+
+def __map_scoped_matching_rules(
+    status: str,
+    matching_rules: List[Tuple[str, str]],
+    data_mapping: Dict[str, str],
+    mapping: Optional[Dict[str, str]],
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, List[str]]:
+    result: Dict[str, List[str]] = {data_id: [] for data_id in data_mapping.values()}
+    if status != "SAT":
+        return result
+
+    for hashed_data_id, group_id in matching_rules:
+        data_id = data_mapping.get(hashed_data_id, hashed_data_id)
+        for rule_id in __expand_rule_groups([group_id], rule_groups):
+            result.setdefault(data_id, []).append(mapping.get(rule_id, rule_id) if mapping else rule_id)
+
+    return result
+
+
+def get_matching_rules_from_asp_problem(
+    problem: str,
+    mapping: Optional[Dict[str, str]] = None,
+    debug_dump: bool = False,
+    stratified: bool = False,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+) -> List[str]:
     """
     Given an ASP problem, return the matching rules.
     :param problem: ASP problem with data, rules and show statement.
     :param mapping: optional mapping for the ASP rule ids
+    :param debug_dump: if True, dump the problem to a temp file (kept for inspection) and load it from there
+    :param stratified: if True, the problem is known to be stratified, so the rules are read after grounding
+    :param rule_groups: optional mapping of every ASP group id to the ASP rule ids sharing its definition
     :return: list of matching rules, mapped if provided
     """
-    file_path = __store_clingo_temp_file(problem)
-    log.debug(f"Temp File Path: {file_path}")
+    if debug_dump:
+        file_path = __store_clingo_temp_file(problem)
+        log.info(f"Dumped ASP problem to: {file_path}")
+
+        status, matching_rules, stats = run_clingo(
+            absolute_file_path=str(file_path.absolute()),
+            stratified=stratified,
+        )
+    else:
+        status, matching_rules, stats = run_clingo_program(program=problem, stratified=stratified)
+    log.debug(stats)
+
+    return __map_matching_rules(status, matching_rules, mapping, rule_groups)
 
-    status, matching_rules, stats = run_clingo(absolute_file_path=str(file_path.absolute()))
+
+def get_matching_rules_for_asp_rules_and_multiple_data(
+    asp_data_definition: str,
+    asp_rules_definition: str,
+    data_mapping: Dict[str, str],
+    mapping: Optional[Dict[str, str]] = None,
+    stratified: bool = False,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, List[str]]:
+    """
+    Given some data records definition and scoped rule definition, evaluate all of them with a single Clingo solve.
+    :param asp_data_definition: encoded data records in ASP language, scoped by record
+    :param asp_rules_definition: encoded rules in ASP language, scoped by record
+    :param data_mapping: mapping for the ASP record ids
+    :param mapping: optional mapping for the ASP rule ids
+    :param stratified: if True, the problem is known to be stratified, so the rules are read after grounding
+    :param rule_groups: optional mapping of every ASP group id to the ASP rule ids sharing its definition
+    :return: dictionary of data id and list of matching rules, mapped if provided
+    """
+    asp_definition_parts = [
+        asp_data_definition,
+        asp_rules_definition,
+        ShowStatement(PredicateNames.RULE, 2).to_asp_statement(),
+    ]
+    asp_definition = "\n\n\n".join(asp_definition_parts)
+
+    status, matching_rules, stats = run_clingo_scoped_program(program=asp_definition, stratified=stratified)
     log.debug(stats)
 
-    file_path.unlink()
-    log.debug("Removed Temp File")
+    return __map_scoped_matching_rules(status, matching_rules, data_mapping, mapping, rule_groups)
 
-    output = ClingoOutput(
-        success=status == "SAT",
-        matching_rules=matching_rules,
+
+def get_matching_rules_for_asp_program_and_data(
+    asp_program: Sequence[ast.AST],
+    facts: Sequence[PredicateAtom],
+    mapping: Optional[Dict[str, str]] = None,
+    stratified: bool = False,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+) -> List[str]:
+    """
+    Given some data facts and an already built Clingo AST program, evaluate it and return the matching rules.
+    :param asp_program: Clingo AST statements with the rules and the show statement
+    :param facts: data atoms to be added as facts
+    :param mapping: optional mapping for the ASP rule ids
+    :param stratified: if True, the problem is known to be stratified, so the rules are read after grounding
+    :param rule_groups: optional mapping of every ASP group id to the ASP rule ids sharing its definition
+    :return: list of matching rules, mapped if provided
+    """
+    status, matching_rules, stats = run_clingo_ast_program(program=asp_program, facts=facts, stratified=stratified)
+    log.debug(stats)
+
+    return __map_matching_rules(status, matching_rules, mapping, rule_groups)
+
+
+def get_matching_rules_for_asp_program_and_multiple_data(
+    asp_program: Sequence[ast.AST],
+    facts: Sequence[PredicateAtom],
+    data_mapping: Dict[str, str],
+    mapping: Optional[Dict[str, str]] = None,
+    stratified: bool = False,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, List[str]]:
+    """
+    Given some data records facts and an already built scoped Clingo AST program, evaluate all of them at once.
+    :param asp_program: Clingo AST statements with the rules scoped by record and the show statement
+    :param facts: data atoms to be added as facts, scoped by record
+    :param data_mapping: mapping for the ASP record ids
+    :param mapping: optional mapping for the ASP rule ids
+    :param stratified: if True, the problem is known to be stratified, so the rules are read after grounding
+    :param rule_groups: optional mapping of every ASP group id to the ASP rule ids sharing its definition
+    :return: dictionary of data id and list of matching rules, mapped if provided
+    """
+    status, matching_rules, stats = run_clingo_scoped_ast_program(
+        program=asp_program, facts=facts, stratified=stratified
     )
+    log.debug(stats)
 
-    if output.success and mapping:
-        return [mapping[rule_id] if rule_id in mapping else rule_id for rule_id in output.matching_rules]
+    return __map_scoped_matching_rules(status, matching_rules, data_mapping, mapping, rule_groups)
 
-    return output.matching_rules
+
+def get_matching_rules_from_clingo_engine(
+    engine: ClingoEngine,
+    facts: Sequence[PredicateAtom],
+    mapping: Optional[Dict[str, str]] = None,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+) -> List[str]:
+    """
+    Given a persistent Clingo engine with the rules already loaded, return the matching rules for some data facts.
+    :param engine: Clingo engine with the scoped rules program
+    :param facts: data atoms to be added as facts
+    :param mapping: optional mapping for the ASP rule ids
+    :param rule_groups: optional mapping of every ASP group id to the ASP rule ids sharing its definition
+    :return: list of matching rules, mapped if provided
+    """
+    status, matching_rules, stats = engine.run(facts)
+    log.debug(stats)
+
+    return __map_matching_rules(status, matching_rules, mapping, rule_groups)
 
 
 def get_matching_rules_for_asp_rules_and_data(
-    asp_data_definition: str, asp_rules_definition: str, mapping: Optional[Dict[str, str]] = None
+    asp_data_definition: str,
+    asp_rules_definition: str,
+    mapping: Optional[Dict[str, str]] = None,
+    debug_dump: bool = False,
+    stratified: bool = False,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
 ) -> List[str]:
     """
     Given some data definition and rule definition, evaluate it with Clingo and return the matching rules.
     :param asp_data_definition: encoded data in ASP language
     :param asp_rules_definition: encoded rules in ASP language
     :param mapping: optional mapping for the ASP rule ids
+    :param debug_dump: if True, dump the generated problem to a temp file before evaluating it
+    :param stratified: if True, the problem is known to be stratified, so the rules are read after grounding
+    :param rule_groups: optional mapping of every ASP group id to the ASP rule ids sharing its definition
     :return: list of matching rules, mapped if provided
     """
     asp_definition_parts = [
         asp_data_definition,
         asp_rules_definition,
-        ShowStatement("rule", 1).to_asp_statement(),
+        ShowStatement(PredicateNames.RULE, 1).to_asp_statement(),
     ]
     asp_definition = "\n\n\n".join(asp_definition_parts)
 
-    return get_matching_rules_from_asp_problem(problem=asp_definition, mapping=mapping)
+    return get_matching_rules_from_asp_problem(
+        problem=asp_definition,
+        mapping=mapping,
+        debug_dump=debug_dump,
+        stratified=stratified,
+        rule_groups=rule_groups,
+    )
@@ -0,0 +1,297 @@
+import logging
+from itertools import product
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from json_logic_asp.adapters.json_logic.jl_array_nodes import EMPTY_MERGE_VALUE, ArrayInNode, ArrayMergeNode
+from json_logic_asp.adapters.json_logic.jl_boolean_nodes import BooleanAndNode, BooleanNotNode, BooleanOrNode
+from json_logic_asp.adapters.json_logic.jl_data_nodes import DataMissingNode, DataVarNode
+from json_logic_asp.adapters.json_logic.jl_logic_nodes import NATIVE_COMPARATORS, LogicEvalNode, LogicIfNode
+from json_logic_asp.constants.loggers import INVOKER_LOGGER_NAME
+from json_logic_asp.models.json_logic_nodes import JsonLogicDataNode, JsonLogicNode
+from json_logic_asp.utils.json_logic_helpers import EncodedValue, native_value_encoder
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+log = logging.getLogger(INVOKER_LOGGER_NAME)
+
+# Values a data node takes on every record, as pairs of dictionary codes and presence masks
+DataColumns = List[Tuple[Any, Any]]
+
+
+class ColumnarBatch:
+    """
+    Batch of records stored by columns, one NumPy array per flattened variable path.
+
+    Missing values are represented either with masked entries (`numpy.ma.MaskedArray`) or with `None` entries. Every
+    value, from the data and from the rule constants, is dictionary encoded once per batch into its rank within the
+    Clingo term ordering, so all the comparisons become vectorized integer comparisons.
+    """
+
+    def __init__(self, columns: Dict[str, Any], constants: Set[EncodedValue]):
+        """
+        :param columns: dictionary of flattened variable path and its array of values
+        :param constants: natively encoded constants used by the rules
+        """
+        if np is None:  # pragma: no cover
+            raise ImportError("NumPy is required for the vectorized evaluation, install json-logic-asp[numpy]")
+
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, received lengths {sorted(lengths)}")
+        self.n_records: int = lengths.pop() if lengths else 0
+
+        unique_columns: Dict[str, Tuple[List[EncodedValue], Any, Any]] = {}
+        vocabulary = {EMPTY_MERGE_VALUE, *constants}
+        for var_name, column in columns.items():
+            unique_columns[var_name] = self.__unique_column(column)
+            vocabulary.update(unique_columns[var_name][0])
+
+        self.__codes = {value: code for code, value in enumerate(sorted(vocabulary))}
+
+        self.__columns: Dict[str, Tuple[Any, Any]] = {}
+        for var_name, (unique_values, inverse, present) in unique_columns.items():
+            codes = np.full(self.n_records, -1, dtype=np.int64)
+            codes[present] = np.array([self.__codes[value] for value in unique_values], dtype=np.int64)[inverse]
+            self.__columns[var_name] = (codes, present)
+
+        # Nodes are shared between rules, so their masks are computed once per batch
+        self.node_masks: Dict[int, Any] = {}
+
+    @staticmethod
+    def __unique_column(column: Any) -> Tuple[List[EncodedValue], Any, Any]:
+        present = ~np.ma.getmaskarray(column)
+        values = np.ma.getdata(column)
+
+        if values.dtype == object:
+            present &= np.array([value is not None for value in values], dtype=bool)
+            # Values are deduplicated by their encoding, as True and 1 (or False and 0) are equal dictionary keys
+            positions: Dict[EncodedValue, int] = {}
+            inverse = np.array(
+                [positions.setdefault(native_value_encoder(value), len(positions)) for value in values[present]],
+                dtype=np.int64,
+            )
+            return list(positions), inverse.reshape(-1), present
+
+        unique_array, inverse = np.unique(values[present], return_inverse=True)
+        return [native_value_encoder(value) for value in unique_array.tolist()], inverse.reshape(-1), present
+
+    def encode(self, value: Any) -> int:
+        return self.__codes[native_value_encoder(value)]
+
+    def constant(self, encoded_value: EncodedValue) -> Tuple[Any, Any]:
+        return np.full(self.n_records, self.__codes[encoded_value], dtype=np.int64), self.full(True)
+
+    def column(self, var_name: str) -> Tuple[Any, Any]:
+        if var_name not in self.__columns:
+            return np.full(self.n_records, -1, dtype=np.int64), self.full(False)
+        return self.__columns[var_name]
+
+    def full(self, value: bool) -> Any:
+        return np.full(self.n_records, value, dtype=bool)
+
+
+def __collect_constants(node: JsonLogicNode, constants: Set[EncodedValue]):
+    # Nodes are walked with an explicit stack, so deeply nested rules never hit the recursion limit, and shared nodes
+    # are only visited once
+    pending: List[JsonLogicNode] = [node]
+    visited_node_ids: Set[int] = set()
+    while pending:
+        current_node = pending.pop()
+        if id(current_node) in visited_node_ids:
+            continue
+        visited_node_ids.add(id(current_node))
+
+        for child_node in current_node.child_nodes:
+            if isinstance(child_node, JsonLogicNode):
+                pending.append(child_node)
+            elif isinstance(child_node, list):
+                constants.update(native_value_encoder(value) for value in child_node)
+            else:
+                constants.add(native_value_encoder(child_node))
+
+
+def __get_data_columns(node: JsonLogicDataNode, batch: ColumnarBatch) -> DataColumns:
+    if isinstance(node, DataVarNode):
+        return [batch.column(node.var_name)]
+
+    if isinstance(node, ArrayMergeNode):
+        primitives = [v for v in node.child_nodes if not isinstance(v, JsonLogicDataNode)]
+        columns = [batch.constant(native_value_encoder(value)) for value in primitives]
+        if not primitives:
+            columns.append(batch.constant(EMPTY_MERGE_VALUE))
+        for var_node in node.child_nodes:
+            if isinstance(var_node, JsonLogicDataNode):
+                columns.extend(__get_data_columns(var_node, batch))
+        return columns
+
+    raise NotImplementedError(f"{node.__class__.__name__} does not support vectorized evaluation")
+
+
+def __any_common_value(data_nodes: List[JsonLogicDataNode], batch: ColumnarBatch) -> Any:
+    mask = batch.full(False)
+    for combination in product(*[__get_data_columns(data_node, batch) for data_node in data_nodes]):
+        combination_mask = batch.full(True)
+        for codes, present in combination:
+            combination_mask &= present & (codes == combination[0][0])
+        mask |= combination_mask
+    return mask
+
+
+def __evaluate_data_node(node: JsonLogicDataNode, batch: ColumnarBatch) -> Any:
+    return __any_common_value([node], batch)
+
+
+def __evaluate_missing_node(node: DataMissingNode, batch: ColumnarBatch) -> Any:
+    mask = batch.full(True)
+    for var_name in node.var_names:
+        mask &= ~batch.column(var_name)[1]
+    return mask
+
+
+def __evaluate_and_node(node: BooleanAndNode, batch: ColumnarBatch) -> Any:
+    if node.has_false:
+        return batch.full(False)
+
+    # Data children atoms share their term variable in the ASP rule body, so they must agree on a common value
+    shared_data_nodes: Dict[str, List[JsonLogicDataNode]] = {}
+    mask = batch.full(True)
+    for child_node in node.child_nodes:
+        if isinstance(child_node, JsonLogicDataNode):
+            shared_data_nodes.setdefault(child_node.term_variable_name, []).append(child_node)
+        elif isinstance(child_node, JsonLogicNode):
+            mask &= __evaluate_node(child_node, batch)
+
+    for data_nodes in shared_data_nodes.values():
+        mask &= __any_common_value(data_nodes, batch)
+
+    return mask
+
+
+def __evaluate_or_node(node: BooleanOrNode, batch: ColumnarBatch) -> Any:
+    if node.has_true:
+        return batch.full(True)
+
+    mask = batch.full(False)
+    for child_node in node.child_nodes:
+        if isinstance(child_node, JsonLogicNode):
+            mask |= __evaluate_node(child_node, batch)
+    return mask
+
+
+def __evaluate_not_node(node: BooleanNotNode, batch: ColumnarBatch) -> Any:
+    return ~__evaluate_node(node.child_nodes[0], batch)
+
+
+def __evaluate_if_node(node: LogicIfNode, batch: ColumnarBatch) -> Any:
+    total_nodes = len(node.child_nodes)
+
+    # Evaluation happens in pairs: the first condition that holds decides with its value, otherwise the else node
+    mask = batch.full(False)
+    undecided = batch.full(True)
+    for i in range(0, total_nodes - 1, 2):
+        condition = __evaluate_node(node.child_nodes[i], batch)
+        mask |= undecided & condition & __evaluate_node(node.child_nodes[i + 1], batch)
+        undecided &= ~condition
+
+    if total_nodes % 2 == 1:
+        mask |= undecided & __evaluate_node(node.child_nodes[-1], batch)
+
+    return mask
+
+
+def __evaluate_eval_node(node: LogicEvalNode, batch: ColumnarBatch) -> Any:
+    if node.comparator not in NATIVE_COMPARATORS:
+        raise NotImplementedError(f"{node.__class__.__name__} does not support vectorized evaluation")
+    comparator = NATIVE_COMPARATORS[node.comparator]
+
+    data_nodes: List[JsonLogicDataNode] = []
+    operands: List[Tuple[bool, int]] = []
+    for child_node in node.child_nodes:
+        if isinstance(child_node, JsonLogicDataNode):
+            if child_node not in data_nodes:
+                data_nodes.append(child_node)
+            operands.append((True, data_nodes.index(child_node)))
+        else:
+            operands.append((False, batch.encode(child_node)))
+
+    # Same as the ASP encoding, the node holds if any combination of the data node values satisfies all comparisons
+    mask = batch.full(False)
+    for combination in product(*[__get_data_columns(data_node, batch) for data_node in data_nodes]):
+        combination_mask = batch.full(True)
+        for _, present in combination:
+            combination_mask &= present
+        values = [combination[value][0] if is_data else value for is_data, value in operands]
+        for i in range(len(values) - 1):
+            combination_mask &= comparator(values[i], values[i + 1])
+        mask |= combination_mask
+    return mask
+
+
+def __evaluate_in_node(node: ArrayInNode, batch: ColumnarBatch) -> Any:
+    mask = batch.full(False)
+
+    if isinstance(node.list_node, list):
+        list_codes = np.array([batch.encode(value) for value in node.list_node], dtype=np.int64)
+        for codes, present in __get_data_columns(node.data_node, batch):
+            mask |= present & np.isin(codes, list_codes)
+        return mask
+
+    for (codes, present), (list_codes, list_present) in product(
+        __get_data_columns(node.data_node, batch), __get_data_columns(node.list_node, batch)
+    ):
+        mask |= present & list_present & (codes == list_codes)
+    return mask
+
+
+VECTORIZED_EVALUATORS: Dict[Type, Callable[[Any, ColumnarBatch], Any]] = {
+    JsonLogicDataNode: __evaluate_data_node,
+    DataMissingNode: __evaluate_missing_node,
+    BooleanAndNode: __evaluate_and_node,
+    BooleanOrNode: __evaluate_or_node,
+    BooleanNotNode: __evaluate_not_node,
+    LogicIfNode: __evaluate_if_node,
+    LogicEvalNode: __evaluate_eval_node,
+    ArrayInNode: __evaluate_in_node,
+}
+
+
+def __evaluate_node(node: Any, batch: ColumnarBatch) -> Any:
+    if isinstance(node, bool):
+        return batch.full(node)
+
+    node_key = id(node)
+    if node_key not in batch.node_masks:
+        node_evaluator: Optional[Callable[[Any, ColumnarBatch], Any]] = next(
+            (VECTORIZED_EVALUATORS[t] for t in type(node).__mro__ if t in VECTORIZED_EVALUATORS), None
+        )
+        if node_evaluator is None:
+            raise NotImplementedError(f"{node.__class__.__name__} does not support vectorized evaluation")
+        batch.node_masks[node_key] = node_evaluator(node, batch)
+
+    return batch.node_masks[node_key]
+
+
+def get_matching_rules_matrix_for_native_rules_and_columns(
+    rule_nodes: Dict[str, JsonLogicNode], columns: Dict[str, Any]
+) -> Any:
+    """
+    Given some parsed rules and a columnar batch of data, evaluate them with vectorized NumPy operations.
+    :param rule_nodes: dictionary of ASP rule id and its parsed root node
+    :param columns: dictionary of flattened variable path and its NumPy array of values, one entry per record
+    :return: boolean matrix of shape (records, rules), with the rules in the same order as the given dictionary
+    """
+    constants: Set[EncodedValue] = set()
+    for rule_node in rule_nodes.values():
+        __collect_constants(rule_node, constants)
+
+    batch = ColumnarBatch(columns=columns, constants=constants)
+
+    matrix = np.zeros((batch.n_records, len(rule_nodes)), dtype=bool)
+    for i, rule_node in enumerate(rule_nodes.values()):
+        matrix[:, i] = __evaluate_node(rule_node, batch)
+    log.debug(f"Vectorized evaluation of {len(rule_nodes)} rules over {batch.n_records} records")
+
+    return matrix
@@ -1,8 +1,15 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
 
 
 class Statement(ABC):
+    __slots__ = ("comment",)
+
     def __init__(self, comment: Optional[str] = None):
         self.comment = comment
 
@@ -15,8 +22,19 @@ class Statement(ABC):
     def to_asp_statement(self) -> str:
         raise NotImplementedError()  # pragma: no cover
 
+    def scoped(self, scope_term: str, scope_guard: Optional[PredicateAtom] = None) -> Statement:
+        """
+        Lift the statement into a scope, prepending the scope term to every predicate.
+        :param scope_term: term (constant, program parameter or variable) identifying the scope
+        :param scope_guard: optional atom added to the body to bind or guard the scope term
+        :return: lifted statement
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} cannot be scoped")
+
 
 class Atom(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def to_asp_atom(self):
         raise NotImplementedError()  # pragma: no cover
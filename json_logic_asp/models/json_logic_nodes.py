@@ -1,27 +1,169 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Tuple, Type, final
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Type, final
 
-from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.adapters.asp.asp_literals import MatchAtom, PredicateAtom
 from json_logic_asp.models.asp_base import Statement
-from json_logic_asp.utils.id_management import generate_unique_id
+from json_logic_asp.utils.id_management import generate_content_id
+from json_logic_asp.utils.json_logic_helpers import EncodedValue
+
+
+def _memoize_node_value(method: Callable[[Any], Any], attribute_name: str) -> Callable[[Any], Any]:
+    @wraps(method)
+    def memoized_method(self) -> Any:
+        value = getattr(self, attribute_name)
+        if value is None:
+            value = method(self)
+            # Only the most derived implementation stores the value, in case it builds on top of a parent one
+            if getattr(type(self), method.__name__) is not memoized_method:
+                return value
+            setattr(self, attribute_name, value)
+        return value
+
+    return memoized_method
+
+
+# Number of children from which a node looks up its registered children in a set instead of its list
+HASHED_CHILD_NODES_THRESHOLD = 8
+
+
+def get_canonical_sort_key(value: Any) -> Tuple[int, str]:
+    """
+    Get a key to sort nodes and constants in a canonical order, stable across runs and mixed value types.
+    :param value: node or constant value
+    :return: sort key, placing nodes by their id before constants by their type and value
+    """
+    if isinstance(value, JsonLogicNode):
+        return 0, value.node_id
+    return 1, f"{type(value).__name__}:{value!r}"
+
+
+def _get_public_slot_names(cls: Type) -> Tuple[str, ...]:
+    slot_names: Set[str] = set()
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        slot_names.update([slots] if isinstance(slots, str) else slots)
+    return tuple(sorted(name for name in slot_names if not name.startswith("_")))
 
 
 class JsonLogicNode(ABC):
+    # A node is kept for every distinct subtree of the parsed rules, so nodes store their attributes in slots instead
+    # of a dictionary. Subclasses declare their own slots, or get a dictionary as usual.
+    __slots__ = (
+        "operation_name",
+        "child_nodes",
+        "_structural_hash",
+        "__accepted_child_node_types",
+        "__allow_duplicated_children",
+        "__node_id",
+        "__hashable_child_nodes",
+        "_asp_atom",
+        "_negated_asp_atom",
+        "_renamed_asp_atoms",
+        "_asp_statements",
+        "_emitted",
+    )
+
+    _public_slot_names: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subtree hashes are computed once and reused, so hashing a parent does not walk its whole subtree again
+        if cls.__dict__.get("__hash__") is not None:
+            cls.__hash__ = _memoize_node_value(cls.__dict__["__hash__"], "_structural_hash")  # type: ignore
+        # And so are node atoms, referenced by the statements of the node and of all its parents
+        if "get_asp_atom" in cls.__dict__:
+            cls.get_asp_atom = _memoize_node_value(cls.__dict__["get_asp_atom"], "_asp_atom")  # type: ignore
+        cls._public_slot_names = _get_public_slot_names(cls)
+
     def __init__(
         self, operation_name: str, accepted_child_node_types: Tuple[Type, ...], allow_duplicated_children: bool = False
     ):
+        self._structural_hash: Optional[int] = None
+        self._asp_atom: Optional[PredicateAtom] = None
+        self._negated_asp_atom: Optional[PredicateAtom] = None
+        self._renamed_asp_atoms: Optional[Dict[Tuple[str, bool], PredicateAtom]] = None
+        self._asp_statements: Optional[Tuple[Statement, ...]] = None
+        self._emitted = False
         self.operation_name: str = operation_name
         self.__accepted_child_node_types = accepted_child_node_types
         self.__allow_duplicated_children = allow_duplicated_children
 
-        self.node_id: str = generate_unique_id()
+        self.__node_id: Optional[str] = None
         self.child_nodes: List[Any] = []
+        # Most nodes have a few children, so the set to look them up is only built for wide nodes
+        self.__hashable_child_nodes: Optional[Set[Any]] = None
+
+    @property
+    def node_id(self) -> str:
+        """
+        Id of the node, derived from its content so identical subtrees get identical ids across runs.
+
+        It is computed once the node is first used, after all its children have been registered. Nodes whose children
+        order does not matter sort them canonically first, so they get the same id and statements in any order.
+        """
+        if self.__node_id is not None:
+            return self.__node_id
+
+        # Children ids are computed first, bottom-up with an explicit stack, so deep subtrees never hit the recursion
+        # limit. Every entry tells whether the ids of its children were already computed.
+        node_id = ""
+        pending: List[Tuple[JsonLogicNode, bool]] = [(self, False)]
+        while pending:
+            node, children_identified = pending.pop()
+            if node.__node_id is not None:
+                continue
+            if children_identified:
+                # The node itself is the last one to be identified
+                if node._has_unordered_child_nodes():
+                    node.child_nodes.sort(key=get_canonical_sort_key)
+                node_id = node.__node_id = generate_content_id(node.__get_structural_content())
+                continue
+            pending.append((node, True))
+            pending.extend(
+                (child_node, False)
+                for child_node in reversed(node.child_nodes)
+                if isinstance(child_node, JsonLogicNode) and child_node.__node_id is None
+            )
+        return node_id
+
+    @staticmethod
+    def __get_content_value(value: Any) -> str:
+        if isinstance(value, JsonLogicNode):
+            return value.node_id
+        if isinstance(value, (list, tuple)):
+            return f"[{', '.join(JsonLogicNode.__get_content_value(item) for item in value)}]"
+        return repr(value)
+
+    def __get_structural_content(self) -> str:
+        # Public attributes hold everything defining the node: operation, children and node specific values
+        values = {name: getattr(self, name) for name in self._public_slot_names if hasattr(self, name)}
+        if hasattr(self, "__dict__"):
+            values.update((name, value) for name, value in vars(self).items() if not name.startswith("_"))
+        attributes = [f"{name}={self.__get_content_value(value)}" for name, value in sorted(values.items())]
+        return f"{self.__class__.__module__}.{self.__class__.__qualname__}({', '.join(attributes)})"
+
+    def __is_registered_child(self, child_node: Any) -> bool:
+        if self.__hashable_child_nodes is None:
+            return child_node in self.child_nodes
+        try:
+            return child_node in self.__hashable_child_nodes
+        except TypeError:
+            return child_node in self.child_nodes
+
+    @staticmethod
+    def __add_hashable_child_nodes(hashable_child_nodes: Set[Any], child_nodes: List[Any]):
+        for child_node in child_nodes:
+            try:
+                hashable_child_nodes.add(child_node)
+            except TypeError:
+                pass
 
     @final
     def register_child(self, child_node: Any):
-        if child_node in self.child_nodes and not self.__allow_duplicated_children:
+        if not self.__allow_duplicated_children and self.__is_registered_child(child_node):
             return
 
         if not isinstance(child_node, self.__accepted_child_node_types):
@@ -30,6 +172,21 @@ class JsonLogicNode(ABC):
             raise ValueError(f"Found unexpected child_node type {t} for {c}")
 
         self.child_nodes.append(child_node)
+        if self.__hashable_child_nodes is not None:
+            self.__add_hashable_child_nodes(self.__hashable_child_nodes, [child_node])
+        elif len(self.child_nodes) >= HASHED_CHILD_NODES_THRESHOLD:
+            self.__hashable_child_nodes = set()
+            self.__add_hashable_child_nodes(self.__hashable_child_nodes, self.child_nodes)
+        self.__reset_memoized_values()
+
+    def __reset_memoized_values(self):
+        self.__node_id = None
+        self._structural_hash = None
+        self._asp_atom = None
+        self._negated_asp_atom = None
+        self._renamed_asp_atoms = None
+        self._asp_statements = None
+        self._emitted = False
 
     @abstractmethod
     def get_asp_atom(self) -> PredicateAtom:
@@ -37,33 +194,99 @@ class JsonLogicNode(ABC):
 
     @final
     def get_negated_asp_atom(self) -> PredicateAtom:
-        atom = self.get_asp_atom()
-        return PredicateAtom(
-            predicate_name=atom.predicate_name,
-            terms=atom.terms,
-            negated=not atom.negated,
-        )
+        if self._negated_asp_atom is None:
+            atom = self.get_asp_atom()
+            self._negated_asp_atom = PredicateAtom(
+                predicate_name=atom.predicate_name,
+                terms=atom.terms,
+                negated=not atom.negated,
+            )
+        return self._negated_asp_atom
 
     @abstractmethod
     def get_asp_statements(self) -> List[Statement]:
         raise NotImplementedError()  # pragma: no cover
 
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        """
+        Evaluate the node natively, with the same semantics as its ASP encoding.
+        :param data: flattened data, with the variable names as keys and natively encoded values
+        :return: whether the node atom would be derived for the data
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support native evaluation")
+
+    @staticmethod
+    def _evaluate_child(child_node: Any, data: Dict[str, EncodedValue]) -> bool:
+        if isinstance(child_node, bool):
+            return child_node
+        return child_node.evaluate(data)
+
     @final
-    def to_asp(self, with_comment: bool = False) -> List[str]:
-        stmts: List[str] = []
+    def iter_asp_statements(self, emitted_node_ids: Optional[Set[str]] = None) -> Iterator[Statement]:
+        """
+        Lazily emit the ASP statements of the node subtree, children before their parents.
+
+        Every node is emitted once, even if it is shared by several parents, so a subtree is never emitted again. Nodes
+        emitted again by later calls keep their statements, so a subtree shared by several rules is only built once.
+
+        :param emitted_node_ids: optional set of already emitted node ids to skip (and fill), to share across trees
+        :return: iterator of ASP statements
+        """
+        if emitted_node_ids is None:
+            emitted_node_ids = set()
+
+        # Nodes are visited with an explicit stack instead of recursion, so deeply nested rules never hit the recursion
+        # limit. Every entry tells whether the children of the node were already emitted.
+        pending: List[Tuple[JsonLogicNode, bool]] = [(self, False)]
+        while pending:
+            node, children_emitted = pending.pop()
+            if children_emitted:
+                yield from node.__get_emitted_asp_statements()
+                continue
 
-        for child_node in self.child_nodes:
-            if not isinstance(child_node, JsonLogicNode):
+            if node.node_id in emitted_node_ids:
                 continue
-            stmts.extend(child_node.to_asp(with_comment=with_comment))
+            emitted_node_ids.add(node.node_id)
 
-        for statement in self.get_asp_statements():
+            pending.append((node, True))
+            pending.extend(
+                (child_node, False)
+                for child_node in reversed(node.child_nodes)
+                if isinstance(child_node, JsonLogicNode)
+            )
+
+    def __get_emitted_asp_statements(self) -> Sequence[Statement]:
+        if self._asp_statements is not None:
+            return self._asp_statements
+        # Statements are only kept once the node is emitted again, as a shared subtree, so the nodes emitted once do
+        # not keep them in memory
+        if not self._emitted:
+            self._emitted = True
+            return self.get_asp_statements()
+        self._asp_statements = tuple(self.get_asp_statements())
+        return self._asp_statements
+
+    @final
+    def to_asp_statements(self) -> List[Statement]:
+        return list(self.iter_asp_statements())
+
+    @final
+    def to_asp(self, with_comment: bool = False) -> List[str]:
+        stmts: List[str] = []
+
+        for statement in self.to_asp_statements():
             if with_comment and statement.to_asp_comment():
                 stmts.append(statement.to_asp_comment())
             stmts.append(statement.to_asp_statement())
 
         return stmts
 
+    def _has_unordered_child_nodes(self) -> bool:
+        """
+        Whether the order of the children does not change the node meaning, so it is hashed and identified regardless.
+        """
+        return False
+
     def _get_children_hash(self, sort: bool = True):
         child_hashes = [hash(child) for child in self.child_nodes]
         child_hashes = sorted(child_hashes) if sort else child_hashes
@@ -85,6 +308,8 @@ class JsonLogicNode(ABC):
 
 
 class JsonLogicTreeNode(JsonLogicNode, ABC):
+    __slots__ = ()
+
     def __init__(
         self,
         operation_name: str,
@@ -112,16 +337,21 @@ class JsonLogicTreeNode(JsonLogicNode, ABC):
     def __str__(self):
         return f"{self.operation_name.upper()}({self.node_id})"
 
+    def _has_unordered_child_nodes(self) -> bool:
+        return True
+
     def __hash__(self):
         return hash(
             (
                 self.operation_name,
-                self._get_children_hash(),
+                self._get_children_hash(sort=self._has_unordered_child_nodes()),
             )
         )
 
 
 class JsonLogicOperationNode(JsonLogicNode, ABC):
+    __slots__ = ()
+
     def __init__(self, operation_name: str, accepted_child_node_types: Optional[Tuple[Type, ...]] = None):
         if accepted_child_node_types is None:
             accepted_child_node_types = (JsonLogicDataNode,)
@@ -135,6 +365,8 @@ class JsonLogicOperationNode(JsonLogicNode, ABC):
 
 
 class JsonLogicDataNode(JsonLogicOperationNode, ABC):
+    __slots__ = ("term_variable_name",)
+
     def __init__(
         self, term_variable_name: str, operation_name: str, accepted_child_node_types: Optional[Tuple[Type, ...]] = None
     ):
@@ -149,20 +381,49 @@ class JsonLogicDataNode(JsonLogicOperationNode, ABC):
             terms=[self.node_id, self.term_variable_name],
         )
 
+    def get_values(self, data: Dict[str, EncodedValue]) -> List[EncodedValue]:
+        """
+        Get natively the values the node term variable can take for the given data.
+        :param data: flattened data, with the variable names as keys and natively encoded values
+        :return: list of natively encoded values, empty if the node atom would not be derived
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support native evaluation")
+
+    def evaluate(self, data: Dict[str, EncodedValue]) -> bool:
+        return len(self.get_values(data)) > 0
+
     @final
     def get_asp_atom_with_different_variable_name(self, var_name: str, negated: bool = False) -> PredicateAtom:
+        if self._renamed_asp_atoms is None:
+            self._renamed_asp_atoms = {}
+        renamed_atom = self._renamed_asp_atoms.get((var_name, negated))
+        if renamed_atom is None:
+            atom = self.get_asp_atom()
+            renamed_atom = self._renamed_asp_atoms[(var_name, negated)] = PredicateAtom(
+                predicate_name=atom.predicate_name,
+                terms=[
+                    atom.terms[0],
+                    var_name,
+                ],
+                negated=negated,
+            )
+        return renamed_atom
+
+    @final
+    def get_asp_atom_matching_value(self, value: str, var_name: str) -> MatchAtom:
+        """
+        Get the node atom with its term variable bound to a constant, to match the value without a comparison.
+        :param value: ASP encoded constant, or pool of constants
+        :param var_name: variable to use instead if the match is joined (see `MatchAtom.to_join_literals`)
+        :return: match atom
+        """
         atom = self.get_asp_atom()
-        return PredicateAtom(
-            predicate_name=atom.predicate_name,
-            terms=[
-                atom.terms[0],
-                var_name,
-            ],
-            negated=negated,
-        )
+        return MatchAtom(predicate_name=atom.predicate_name, terms=[atom.terms[0], value], variable_name=var_name)
 
 
 class JsonLogicSingleDataNode(JsonLogicDataNode, ABC):
+    __slots__ = ()
+
     def __init__(
         self, term_variable_name: str, operation_name: str, accepted_child_node_types: Optional[Tuple[Type, ...]] = None
     ):
@@ -174,6 +435,8 @@ class JsonLogicSingleDataNode(JsonLogicDataNode, ABC):
 
 
 class JsonLogicMultiDataNode(JsonLogicDataNode, ABC):
+    __slots__ = ()
+
     def __init__(
         self, term_variable_name: str, operation_name: str, accepted_child_node_types: Optional[Tuple[Type, ...]] = None
     ):
@@ -0,0 +1,31 @@
+from typing import Dict, List, Optional
+
+from json_logic_asp.models.translator_dto import RuleInput
+
+
+class RuleSetArtifact:
+    def __init__(
+        self,
+        content_hash: str,
+        rule_inputs: List[RuleInput],
+        rule_id_mapping: Dict[str, str],
+        rule_groups: Dict[str, List[str]],
+        stratified: bool,
+        asp_definition: str,
+        scoped_asp_definition: str,
+        multi_shot_asp_definition: str,
+        simplify: bool = False,
+        parameterize: bool = False,
+        source_rule_inputs: Optional[List[RuleInput]] = None,
+    ):
+        self.content_hash: str = content_hash
+        self.rule_inputs: List[RuleInput] = rule_inputs
+        self.rule_id_mapping: Dict[str, str] = rule_id_mapping
+        self.rule_groups: Dict[str, List[str]] = rule_groups
+        self.stratified: bool = stratified
+        self.asp_definition: str = asp_definition
+        self.scoped_asp_definition: str = scoped_asp_definition
+        self.multi_shot_asp_definition: str = multi_shot_asp_definition
+        self.simplify: bool = simplify
+        self.parameterize: bool = parameterize
+        self.source_rule_inputs: Optional[List[RuleInput]] = source_rule_inputs
@@ -0,0 +1,743 @@
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Type, Union
+
+from clingo import ast
+
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.adapters.asp.asp_statements import ShowStatement
+from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
+from json_logic_asp.constants.evaluation_backends import EvaluationBackends
+from json_logic_asp.invoker.native import (
+    get_matching_rules_for_compiled_rules_and_data,
+    get_matching_rules_for_native_rules_and_data,
+)
+from json_logic_asp.invoker.run import (
+    get_matching_rules_for_asp_program_and_data,
+    get_matching_rules_for_asp_program_and_multiple_data,
+    get_matching_rules_from_clingo_engine,
+)
+from json_logic_asp.invoker.vectorized import get_matching_rules_matrix_for_native_rules_and_columns
+from json_logic_asp.models.asp_base import Statement
+from json_logic_asp.models.json_logic_nodes import JsonLogicNode
+from json_logic_asp.models.rule_set_artifact import RuleSetArtifact
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.sdk.clingo_builder import parse_asp_program
+from json_logic_asp.sdk.clingo_engine import ClingoEngine
+from json_logic_asp.simplifier.simplify import simplify_json_logic
+from json_logic_asp.translator.data_generator import (
+    generate_multiple_data_asp_atoms,
+    generate_single_data_asp_atoms,
+    generate_single_data_native_values,
+)
+from json_logic_asp.translator.function_generator import RuleFunction, generate_rule_function
+from json_logic_asp.translator.rule_compiler import RuleCompiler
+from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_statements, render_asp_statements
+from json_logic_asp.translator.translation_cache import TranslationCache
+from json_logic_asp.utils.artifact_storage import (
+    combine_rule_input_content_hashes,
+    generate_rule_input_content_hash,
+    load_rule_set_artifact,
+    save_rule_set_artifact,
+)
+from json_logic_asp.utils.id_management import generate_constant_string
+
+
+class RuleSet:
+    """
+    Set of JSON Logic rules translated once to ASP and evaluated many times against different data.
+
+    Evaluating never mutates the compiled rules, and the parts built lazily on first use are built under a lock, so a
+    single instance can be shared and evaluated concurrently from multiple threads. Editing the rules is not thread
+    safe, so it must not run concurrently with evaluations or other edits.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        rule_inputs: List[RuleInput],
+        simplify: bool = False,
+        custom_nodes: Optional[Dict[str, Type]] = None,
+        multi_shot: bool = False,
+        backend: EvaluationBackends = EvaluationBackends.CLINGO,
+        translation_cache: Optional[TranslationCache] = None,
+        parameterize: bool = False,
+    ):
+        """
+        Compile the given rules into their ASP program.
+        :param rule_inputs: list of rule input with JSON Logic definitions
+        :param simplify: if True, simplifies the JSON Logic definitions before translating them
+        :param custom_nodes: optional dictionary of custom nodes to parse
+        :param multi_shot: if True, load the rules once in a persistent Clingo engine and feed data to it
+        :param backend: default backend used to evaluate the rules
+        :param translation_cache: optional cache of translated rules, shared across rule sets
+        :param parameterize: if True, compile rules differing only in their constants into a single generic rule
+        """
+        source_rule_inputs = rule_inputs
+        rule_inputs = self.__simplify_rule_inputs(rule_inputs, simplify)
+
+        rule_compiler = RuleCompiler(custom_nodes=custom_nodes)
+        root_nodes: Dict[str, JsonLogicNode] = {}
+        rule_statements: Dict[str, List[Statement]] = {}
+        rule_groups: Dict[str, List[str]] = {}
+        statements, rule_id_mapping = generate_multiple_rule_asp_statements(
+            rule_inputs=rule_inputs,
+            rule_compiler=rule_compiler,
+            rule_root_nodes=root_nodes,
+            translation_cache=translation_cache,
+            rule_statements=rule_statements,
+            rule_groups=rule_groups,
+            parameterize=parameterize,
+        )
+
+        self.__setup(
+            rule_inputs=rule_inputs,
+            source_rule_inputs=source_rule_inputs,
+            simplify=simplify,
+            parameterize=parameterize,
+            rule_compiler=rule_compiler,
+            translation_cache=translation_cache,
+            rule_id_mapping=rule_id_mapping,
+            rule_groups=rule_groups,
+            # Built-in nodes only negate data facts or lower level nodes, so the translation is stratified by construction
+            stratified=not custom_nodes,
+            multi_shot=multi_shot,
+            backend=backend,
+            statements=statements,
+            rule_statements=rule_statements,
+            # Cached rules are not parsed, so the nodes are only complete if every rule was translated
+            root_nodes=root_nodes if len(root_nodes) == len(rule_inputs) else None,
+        )
+
+    def __setup(
+        self,
+        rule_inputs: List[RuleInput],
+        source_rule_inputs: List[RuleInput],
+        simplify: bool,
+        parameterize: bool,
+        rule_compiler: RuleCompiler,
+        translation_cache: Optional[TranslationCache],
+        rule_id_mapping: Dict[str, str],
+        rule_groups: Dict[str, List[str]],
+        stratified: bool,
+        multi_shot: bool,
+        backend: EvaluationBackends,
+        statements: Optional[List[Statement]] = None,
+        rule_statements: Optional[Dict[str, List[Statement]]] = None,
+        root_nodes: Optional[Dict[str, JsonLogicNode]] = None,
+        artifact: Optional[RuleSetArtifact] = None,
+    ):
+        # Parsing and emitting statements memoize them on the shared nodes and compiler, so the parts of the rule set
+        # built lazily on first use are built under this lock. It is reentrant, as some of them are built from others
+        self.__lock = threading.RLock()
+        self.__rule_inputs: List[RuleInput] = list(rule_inputs)
+        self.__source_rule_inputs: List[RuleInput] = list(source_rule_inputs)
+        self.__simplify = simplify
+        self.__parameterize = parameterize
+        # The compiler is kept for edits and lazy parsing, so the custom nodes are only validated once
+        self.__rule_compiler = rule_compiler
+        self.__translation_cache = translation_cache
+        # Rules are hashed one by one, so editing them only hashes the new ones
+        self.__rule_content_hashes = [generate_rule_input_content_hash(rule_input) for rule_input in source_rule_inputs]
+        self.__content_hash = combine_rule_input_content_hashes(self.__rule_content_hashes, simplify=simplify)
+        self.__stratified = stratified
+        self.__backend = EvaluationBackends(backend)
+        self.__rule_id_mapping = rule_id_mapping
+        # Identical rules share a single ASP rule, identified by a group id, and its result is fanned out to all of them
+        self.__set_rule_groups(rule_groups)
+        # Parsed nodes are only needed by the native backends, so loaded rule sets parse them on first use
+        self.__root_nodes: Optional[Dict[str, JsonLogicNode]] = root_nodes
+
+        # Statements are indexed by their rendered form and reference counted across rules, so editing the rules only
+        # adds or drops the statements not shared with the remaining ones
+        self.__statements: Optional[Dict[str, Statement]] = None
+        self.__statement_counts: Dict[str, int] = {}
+        self.__rule_statement_keys: Dict[str, List[str]] = {}
+        if statements is not None and rule_statements is not None:
+            self.__statements = self.__index_statements(statements, rule_statements)
+
+        # Loaded rule sets come with their definitions already rendered, otherwise they are rendered when needed
+        self.__asp_definition = artifact.asp_definition if artifact else None
+        self.__scoped_asp_definition = artifact.scoped_asp_definition if artifact else None
+        self.__multi_shot_asp_definition = artifact.multi_shot_asp_definition if artifact else None
+
+        # The program is parsed into Clingo AST once, so evaluating only feeds the data facts to it. Parsed statements
+        # are indexed by their rendered form, so editing the rules never parses the remaining ones again
+        self.__program_statements = self.__parse_statements(
+            self.asp_definition.split("\n") if self.asp_definition else []
+        )
+        self.__show_program = parse_asp_program(ShowStatement(PredicateNames.RULE, 1).to_asp_statement())
+        self.__asp_program = self.__build_asp_program()
+        self.__scoped_asp_program: Optional[List[ast.AST]] = None
+
+        self.__rule_functions: Optional[Dict[str, RuleFunction]] = None
+        self.__fallback_rule_inputs: List[RuleInput] = []
+        self.__fallback_asp_program: Optional[List[ast.AST]] = None
+
+        self.__engine: Optional[ClingoEngine] = None
+        if multi_shot:
+            self.__engine = ClingoEngine(program=self.__get_multi_shot_asp_definition())
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        custom_nodes: Optional[Dict[str, Type]] = None,
+        multi_shot: bool = False,
+        backend: EvaluationBackends = EvaluationBackends.CLINGO,
+        content_hash: Optional[str] = None,
+    ) -> "RuleSet":
+        """
+        Load a rule set previously stored with `save`, without parsing nor translating its rules again.
+        :param path: file path to read
+        :param custom_nodes: optional dictionary of custom nodes, only needed to evaluate them with the native backends
+        :param multi_shot: if True, load the rules once in a persistent Clingo engine and feed data to it
+        :param backend: default backend used to evaluate the rules
+        :param content_hash: optional expected `content_hash`, to make sure the stored rules are the expected ones
+        :return: loaded rule set
+        """
+        artifact = load_rule_set_artifact(path)
+        if content_hash is not None and artifact.content_hash != content_hash:
+            raise ValueError(f"Stored rule set content hash {artifact.content_hash} does not match {content_hash}")
+
+        rule_set = cls.__new__(cls)
+        rule_set.__setup(
+            rule_inputs=artifact.rule_inputs,
+            source_rule_inputs=artifact.source_rule_inputs or artifact.rule_inputs,
+            simplify=artifact.simplify,
+            parameterize=artifact.parameterize,
+            rule_compiler=RuleCompiler(custom_nodes=custom_nodes),
+            translation_cache=None,
+            rule_id_mapping=artifact.rule_id_mapping,
+            rule_groups=artifact.rule_groups,
+            stratified=artifact.stratified,
+            multi_shot=multi_shot,
+            backend=backend,
+            artifact=artifact,
+        )
+        return rule_set
+
+    def save(self, path: Union[str, Path]):
+        """
+        Store the compiled rule set, so it can be loaded later on without translating the rules again.
+        :param path: file path to write
+        """
+        save_rule_set_artifact(
+            RuleSetArtifact(
+                content_hash=self.__content_hash,
+                rule_inputs=self.__rule_inputs,
+                rule_id_mapping=self.__rule_id_mapping,
+                rule_groups=self.__rule_groups,
+                simplify=self.__simplify,
+                parameterize=self.__parameterize,
+                # Simplified rules are stored as well, so the content hash can be computed again after editing them
+                source_rule_inputs=self.__source_rule_inputs if self.__simplify else None,
+                stratified=self.__stratified,
+                asp_definition=self.asp_definition,
+                scoped_asp_definition=self.__get_scoped_asp_definition(),
+                multi_shot_asp_definition=self.__get_multi_shot_asp_definition(),
+            ),
+            path,
+        )
+
+    def __get_root_nodes(self) -> Dict[str, JsonLogicNode]:
+        root_nodes = self.__root_nodes
+        if root_nodes is None:
+            with self.__lock:
+                root_nodes = self.__root_nodes
+                if root_nodes is None:
+                    root_nodes = self.__root_nodes = {
+                        generate_constant_string(rule_input.rule_id): self.__rule_compiler.parse(rule_input.rule_tree)
+                        for rule_input in self.__rule_inputs
+                    }
+        return root_nodes
+
+    @staticmethod
+    def __simplify_rule_inputs(rule_inputs: List[RuleInput], simplify: bool) -> List[RuleInput]:
+        if not simplify:
+            return list(rule_inputs)
+        return [
+            RuleInput(
+                rule_id=rule_input.rule_id,
+                rule_tree=simplify_json_logic(rule_input.rule_tree),
+            )
+            for rule_input in rule_inputs
+        ]
+
+    def __index_statements(
+        self, statements: List[Statement], rule_statements: Dict[str, List[Statement]]
+    ) -> Dict[str, Statement]:
+        # Statements are shared between the list and the rules, so every one of them is only rendered once
+        statement_keys = {id(statement): statement.to_asp_statement() for statement in statements}
+        indexed_statements = {statement_keys[id(statement)]: statement for statement in statements}
+
+        for hashed_id, statements_of_rule in rule_statements.items():
+            rule_keys = list(dict.fromkeys(statement_keys[id(statement)] for statement in statements_of_rule))
+            self.__rule_statement_keys[hashed_id] = rule_keys
+            for key in rule_keys:
+                self.__statement_counts[key] = self.__statement_counts.get(key, 0) + 1
+
+        return indexed_statements
+
+    def __get_statements(self) -> Dict[str, Statement]:
+        if self.__statements is None:
+            # Loaded rule sets only keep their rendered definitions, so their statements are translated on first edit
+            rule_statements: Dict[str, List[Statement]] = {}
+            rule_groups: Dict[str, List[str]] = {}
+            statements, _ = generate_multiple_rule_asp_statements(
+                rule_inputs=self.__rule_inputs,
+                rule_compiler=self.__rule_compiler,
+                translation_cache=self.__translation_cache,
+                rule_statements=rule_statements,
+                rule_groups=rule_groups,
+                parameterize=self.__parameterize,
+            )
+            self.__statements = self.__index_statements(statements, rule_statements)
+            self.__rebuild_programs(rule_groups)
+        return self.__statements
+
+    def __rebuild_programs(self, rule_groups: Dict[str, List[str]]):
+        # Node and group ids depend on the translation history, so a translation made again may not match the loaded
+        # definitions, and every program and rule group is rebuilt from it
+        self.__set_rule_groups(rule_groups)
+        self.__asp_definition = None
+        self.__scoped_asp_definition = None
+        self.__multi_shot_asp_definition = None
+        self.__program_statements = self.__parse_statements(list(self.__get_statements()))
+        self.__asp_program = self.__build_asp_program()
+        self.__scoped_asp_program = None
+        if self.__engine is not None:
+            self.__engine.replace_program(self.__get_multi_shot_asp_definition())
+
+    def __set_rule_groups(self, rule_groups: Dict[str, List[str]]):
+        self.__rule_groups = rule_groups
+        self.__rule_group_ids = {
+            hashed_id: group_id for group_id, hashed_ids in rule_groups.items() for hashed_id in hashed_ids
+        }
+
+    @staticmethod
+    def __render_scoped(statements: List[Statement]) -> str:
+        return render_asp_statements(
+            statements=statements,
+            scope_term=VariableNames.RECORD.value,
+            scope_guard=PredicateAtom(predicate_name=PredicateNames.RECORD, terms=[VariableNames.RECORD]),
+        )
+
+    @staticmethod
+    def __render_multi_shot(statements: List[Statement]) -> str:
+        scope = ClingoEngine.SCOPE_PARAMETER
+        return render_asp_statements(
+            statements=statements,
+            scope_term=scope,
+            scope_guard=PredicateAtom(predicate_name=PredicateNames.ACTIVE, terms=[scope]),
+        )
+
+    def __get_scoped_asp_definition(self) -> str:
+        scoped_asp_definition = self.__scoped_asp_definition
+        if scoped_asp_definition is None:
+            with self.__lock:
+                scoped_asp_definition = self.__scoped_asp_definition
+                if scoped_asp_definition is None:
+                    scoped_asp_definition = self.__scoped_asp_definition = self.__render_scoped(
+                        [*self.__get_statements().values(), ShowStatement(PredicateNames.RULE, 1)]
+                    )
+        return scoped_asp_definition
+
+    def __get_multi_shot_asp_definition(self) -> str:
+        multi_shot_asp_definition = self.__multi_shot_asp_definition
+        if multi_shot_asp_definition is None:
+            with self.__lock:
+                multi_shot_asp_definition = self.__multi_shot_asp_definition
+                if multi_shot_asp_definition is None:
+                    multi_shot_asp_definition = self.__multi_shot_asp_definition = self.__render_multi_shot(
+                        [*self.__get_statements().values(), ShowStatement(PredicateNames.RULE, 1)]
+                    )
+        return multi_shot_asp_definition
+
+    def add_rules(self, rule_inputs: List[RuleInput]):
+        """
+        Add new rules to the compiled rule set, translating only them and adding only the statements not present yet.
+        :param rule_inputs: list of rule input with JSON Logic definitions, with ids not present in the rule set
+        """
+        self.__update_rules(removed_rule_ids=[], added_rule_inputs=rule_inputs)
+
+    def remove_rules(self, rule_ids: List[str]):
+        """
+        Remove rules from the compiled rule set, dropping only the statements not shared with the remaining rules.
+        :param rule_ids: list of ids of rules present in the rule set
+        """
+        self.__update_rules(removed_rule_ids=rule_ids, added_rule_inputs=[])
+
+    def replace_rules(self, rule_inputs: List[RuleInput]):
+        """
+        Replace rules of the compiled rule set with new definitions, keeping the statements shared with them.
+        :param rule_inputs: list of rule input with JSON Logic definitions, with ids present in the rule set
+        """
+        self.__update_rules(
+            removed_rule_ids=[rule_input.rule_id for rule_input in rule_inputs], added_rule_inputs=rule_inputs
+        )
+
+    def __update_rules(self, removed_rule_ids: List[str], added_rule_inputs: List[RuleInput]):
+        rule_ids = {rule_input.rule_id for rule_input in self.__rule_inputs}
+        missing_rule_ids = [rule_id for rule_id in removed_rule_ids if rule_id not in rule_ids]
+        if missing_rule_ids:
+            raise ValueError(f"Rules {', '.join(missing_rule_ids)} are not in the rule set")
+
+        removed_ids = set(removed_rule_ids)
+        added_rule_ids = [rule_input.rule_id for rule_input in added_rule_inputs]
+        existing_rule_ids = [
+            rule_id for rule_id in added_rule_ids if rule_id in rule_ids and rule_id not in removed_ids
+        ]
+        if existing_rule_ids or len(set(added_rule_ids)) != len(added_rule_ids):
+            raise ValueError(f"Rules {', '.join(existing_rule_ids or added_rule_ids)} are already in the rule set")
+
+        statements = dict(self.__get_statements())
+        removed_hashed_ids = {generate_constant_string(rule_id) for rule_id in removed_ids}
+
+        removed_keys: Set[str] = set()
+        for hashed_id in removed_hashed_ids:
+            for key in self.__rule_statement_keys.pop(hashed_id):
+                self.__statement_counts[key] -= 1
+                if self.__statement_counts[key] == 0:
+                    del self.__statement_counts[key]
+                    del statements[key]
+                    removed_keys.add(key)
+
+        simplified_rule_inputs = self.__simplify_rule_inputs(added_rule_inputs, self.__simplify)
+        root_nodes = {
+            hashed_id: node
+            for hashed_id, node in (self.__root_nodes or {}).items()
+            if hashed_id not in removed_hashed_ids
+        }
+        rule_statements: Dict[str, List[Statement]] = {}
+        added_rule_groups: Dict[str, List[str]] = {}
+        _, added_mapping = generate_multiple_rule_asp_statements(
+            rule_inputs=simplified_rule_inputs,
+            rule_compiler=self.__rule_compiler,
+            rule_root_nodes=root_nodes,
+            # Parsed nodes must be kept complete, so cached translations are only used while they are not parsed
+            translation_cache=self.__translation_cache if self.__root_nodes is None else None,
+            rule_statements=rule_statements,
+            rule_groups=added_rule_groups,
+            parameterize=self.__parameterize,
+        )
+
+        added_statements: Dict[str, Statement] = {}
+        for hashed_id, statements_of_rule in rule_statements.items():
+            rule_keys: Dict[str, Statement] = {}
+            for statement in statements_of_rule:
+                rule_keys.setdefault(statement.to_asp_statement(), statement)
+            self.__rule_statement_keys[hashed_id] = list(rule_keys)
+            for key, statement in rule_keys.items():
+                if key not in self.__statement_counts:
+                    statements[key] = statement
+                    added_statements[key] = statement
+                self.__statement_counts[key] = self.__statement_counts.get(key, 0) + 1
+
+        self.__rule_inputs = [
+            *[rule_input for rule_input in self.__rule_inputs if rule_input.rule_id not in removed_ids],
+            *simplified_rule_inputs,
+        ]
+        self.__rule_content_hashes = [
+            *[
+                rule_content_hash
+                for rule_input, rule_content_hash in zip(self.__source_rule_inputs, self.__rule_content_hashes)
+                if rule_input.rule_id not in removed_ids
+            ],
+            *[generate_rule_input_content_hash(rule_input) for rule_input in added_rule_inputs],
+        ]
+        self.__source_rule_inputs = [
+            *[rule_input for rule_input in self.__source_rule_inputs if rule_input.rule_id not in removed_ids],
+            *added_rule_inputs,
+        ]
+        self.__content_hash = combine_rule_input_content_hashes(self.__rule_content_hashes, simplify=self.__simplify)
+        self.__rule_id_mapping = {
+            **{
+                hashed_id: rule_id
+                for hashed_id, rule_id in self.__rule_id_mapping.items()
+                if rule_id not in removed_ids
+            },
+            **added_mapping,
+        }
+        self.__update_rule_groups(removed_hashed_ids, added_rule_groups)
+        self.__statements = statements
+        if self.__root_nodes is not None:
+            self.__root_nodes = root_nodes
+
+        # Statements dropped and added back by the same edit, like replacing a rule with itself, are left untouched
+        self.__update_programs(
+            removed_keys={key for key in removed_keys if key not in self.__statement_counts},
+            statements=[statement for key, statement in added_statements.items() if key not in removed_keys],
+        )
+
+        if self.__rule_functions is not None:
+            self.__update_rule_functions(removed_hashed_ids, simplified_rule_inputs)
+
+    @staticmethod
+    def __parse_statements(keys: List[str]) -> Dict[str, List[ast.AST]]:
+        statements = parse_asp_program("\n".join(keys))
+        if len(statements) == len(keys):
+            return {key: [statement] for key, statement in zip(keys, statements)}
+        # Some statements are not parsed into a single AST statement, so every one of them is parsed on its own
+        return {key: parse_asp_program(key) for key in keys}
+
+    def __build_asp_program(self) -> List[ast.AST]:
+        return [
+            *[statement for statements in self.__program_statements.values() for statement in statements],
+            *self.__show_program,
+        ]
+
+    def __update_programs(self, removed_keys: Set[str], statements: List[Statement]):
+        if not removed_keys and not statements:
+            return
+
+        # Only the new statements are rendered and parsed, and the programs are replaced at once for running evaluations
+        keys = [statement.to_asp_statement() for statement in statements]
+        program_statements = {
+            key: statements for key, statements in self.__program_statements.items() if key not in removed_keys
+        }
+        program_statements.update(self.__parse_statements(keys))
+        self.__program_statements = program_statements
+        self.__asp_program = self.__build_asp_program()
+
+        if removed_keys:
+            # Statements cannot be retracted from a Clingo program, so the other programs are rebuilt without them
+            self.__asp_definition = None
+            self.__scoped_asp_definition = None
+            self.__multi_shot_asp_definition = None
+            self.__scoped_asp_program = None
+            if self.__engine is not None:
+                self.__engine.replace_program(self.__get_multi_shot_asp_definition())
+            return
+
+        if self.__asp_definition is not None:
+            self.__asp_definition = "\n".join([*filter(None, [self.__asp_definition]), *keys])
+
+        if self.__scoped_asp_definition is not None:
+            scoped_definition = self.__render_scoped(statements)
+            self.__scoped_asp_definition = f"{self.__scoped_asp_definition}\n{scoped_definition}"
+            if self.__scoped_asp_program is not None:
+                self.__scoped_asp_program = [*self.__scoped_asp_program, *parse_asp_program(scoped_definition)]
+
+        if self.__multi_shot_asp_definition is not None:
+            multi_shot_definition = self.__render_multi_shot(statements)
+            self.__multi_shot_asp_definition = f"{self.__multi_shot_asp_definition}\n{multi_shot_definition}"
+            if self.__engine is not None:
+                self.__engine.add_program(multi_shot_definition)
+
+    def __update_rule_groups(self, removed_hashed_ids: Set[str], added_rule_groups: Dict[str, List[str]]):
+        rule_groups = {group_id: list(hashed_ids) for group_id, hashed_ids in self.__rule_groups.items()}
+        for hashed_id in removed_hashed_ids:
+            group_id = self.__rule_group_ids.pop(hashed_id)
+            rule_groups[group_id].remove(hashed_id)
+            if not rule_groups[group_id]:
+                del rule_groups[group_id]
+
+        for group_id, hashed_ids in added_rule_groups.items():
+            rule_groups.setdefault(group_id, []).extend(hashed_ids)
+            self.__rule_group_ids.update((hashed_id, group_id) for hashed_id in hashed_ids)
+
+        self.__rule_groups = rule_groups
+
+    def __update_rule_functions(self, removed_hashed_ids: Set[str], rule_inputs: List[RuleInput]):
+        rule_functions = {
+            hashed_id: rule_function
+            for hashed_id, rule_function in (self.__rule_functions or {}).items()
+            if hashed_id not in removed_hashed_ids
+        }
+        fallback_rule_inputs = [
+            rule_input
+            for rule_input in self.__fallback_rule_inputs
+            if generate_constant_string(rule_input.rule_id) not in removed_hashed_ids
+        ]
+
+        new_fallback_rule_inputs = self.__compile_rules(rule_inputs, rule_functions)
+        if new_fallback_rule_inputs or len(fallback_rule_inputs) != len(self.__fallback_rule_inputs):
+            self.__set_fallback_rule_inputs([*fallback_rule_inputs, *new_fallback_rule_inputs])
+        self.__rule_functions = rule_functions
+
+    @property
+    def rule_inputs(self) -> List[RuleInput]:
+        return list(self.__rule_inputs)
+
+    @property
+    def asp_definition(self) -> str:
+        asp_definition = self.__asp_definition
+        if asp_definition is None:
+            with self.__lock:
+                asp_definition = self.__asp_definition
+                if asp_definition is None:
+                    asp_definition = self.__asp_definition = "\n".join(self.__get_statements())
+        return asp_definition
+
+    @property
+    def rule_id_mapping(self) -> Dict[str, str]:
+        return dict(self.__rule_id_mapping)
+
+    @property
+    def node_cache(self) -> Dict[str, JsonLogicNode]:
+        self.__get_root_nodes()
+        return dict(self.__rule_compiler.node_cache)
+
+    @property
+    def content_hash(self) -> str:
+        return self.__content_hash
+
+    @property
+    def multi_shot(self) -> bool:
+        return self.__engine is not None
+
+    @property
+    def backend(self) -> EvaluationBackends:
+        return self.__backend
+
+    @property
+    def rule_functions(self) -> Dict[str, RuleFunction]:
+        return dict(self.__compile_rule_functions())
+
+    def __compile_rule_functions(self) -> Dict[str, RuleFunction]:
+        rule_functions = self.__rule_functions
+        if rule_functions is not None:
+            return rule_functions
+
+        with self.__lock:
+            rule_functions = self.__rule_functions
+            if rule_functions is None:
+                rule_functions = {}
+                self.__set_fallback_rule_inputs(self.__compile_rules(self.__rule_inputs, rule_functions))
+                # Functions are published last, so evaluations never see them without their fallback program
+                self.__rule_functions = rule_functions
+        return rule_functions
+
+    def __compile_rules(self, rule_inputs: List[RuleInput], rule_functions: Dict[str, RuleFunction]) -> List[RuleInput]:
+        function_cache: Dict[int, RuleFunction] = {}
+        fallback_rule_inputs: List[RuleInput] = []
+        for rule_input in rule_inputs:
+            hashed_id = generate_constant_string(rule_input.rule_id)
+            try:
+                rule_functions[hashed_id] = generate_rule_function(self.__get_root_nodes()[hashed_id], function_cache)
+            except NotImplementedError:
+                fallback_rule_inputs.append(rule_input)
+        return fallback_rule_inputs
+
+    def __set_fallback_rule_inputs(self, fallback_rule_inputs: List[RuleInput]):
+        fallback_asp_program = None
+        if fallback_rule_inputs:
+            fallback_statements, _ = generate_multiple_rule_asp_statements(
+                rule_inputs=fallback_rule_inputs,
+                rule_compiler=self.__rule_compiler,
+            )
+            fallback_asp_program = parse_asp_program(
+                render_asp_statements(statements=[*fallback_statements, ShowStatement(PredicateNames.RULE, 1)])
+            )
+
+        self.__fallback_rule_inputs = fallback_rule_inputs
+        self.__fallback_asp_program = fallback_asp_program
+
+    def evaluate(self, data: DataInput, backend: Optional[EvaluationBackends] = None) -> List[str]:
+        """
+        Evaluate the compiled rules against the given data.
+        :param data: data input object
+        :param backend: optional backend to use instead of the rule set default one
+        :return: list of rule ids matching the data
+        """
+        backend = EvaluationBackends(backend or self.__backend)
+
+        if backend == EvaluationBackends.NATIVE:
+            return get_matching_rules_for_native_rules_and_data(
+                rule_nodes=self.__get_root_nodes(),
+                data_values=generate_single_data_native_values(data_input=data),
+                mapping=self.__rule_id_mapping,
+            )
+
+        if backend == EvaluationBackends.COMPILED:
+            matching_rules = get_matching_rules_for_compiled_rules_and_data(
+                rule_functions=self.__compile_rule_functions(),
+                data_values=generate_single_data_native_values(data_input=data),
+                mapping=self.__rule_id_mapping,
+            )
+            if self.__fallback_asp_program is not None:
+                matching_rules.extend(
+                    get_matching_rules_for_asp_program_and_data(
+                        asp_program=self.__fallback_asp_program,
+                        facts=generate_single_data_asp_atoms(data_input=data),
+                        mapping=self.__rule_id_mapping,
+                    )
+                )
+            return matching_rules
+
+        if self.__engine is not None:
+            return get_matching_rules_from_clingo_engine(
+                engine=self.__engine,
+                facts=generate_single_data_asp_atoms(data_input=data),
+                mapping=self.__rule_id_mapping,
+                rule_groups=self.__rule_groups,
+            )
+
+        return get_matching_rules_for_asp_program_and_data(
+            asp_program=self.__asp_program,
+            facts=generate_single_data_asp_atoms(data_input=data),
+            mapping=self.__rule_id_mapping,
+            stratified=self.__stratified,
+            rule_groups=self.__rule_groups,
+        )
+
+    def evaluate_many(
+        self,
+        data: List[DataInput],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        backend: Optional[EvaluationBackends] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Evaluate the compiled rules against multiple data objects, solving each batch of them in a single Clingo call.
+        :param data: list of data input objects
+        :param batch_size: maximum number of data objects to evaluate in the same Clingo call
+        :param backend: optional backend to use instead of the rule set default one
+        :return: dictionary of data id and list of rule ids matching it
+        """
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be a positive number, received {batch_size}")
+
+        backend = EvaluationBackends(backend or self.__backend)
+        if backend in (EvaluationBackends.NATIVE, EvaluationBackends.COMPILED):
+            return {data_input.data_id: self.evaluate(data_input, backend=backend) for data_input in data}
+
+        scoped_asp_program = self.__scoped_asp_program
+        if scoped_asp_program is None:
+            with self.__lock:
+                scoped_asp_program = self.__scoped_asp_program
+                if scoped_asp_program is None:
+                    scoped_asp_program = self.__scoped_asp_program = parse_asp_program(
+                        self.__get_scoped_asp_definition()
+                    )
+
+        matching_rules: Dict[str, List[str]] = {}
+        for i in range(0, len(data), batch_size):
+            facts, data_mapping = generate_multiple_data_asp_atoms(data_inputs=data[i : i + batch_size])
+            matching_rules.update(
+                get_matching_rules_for_asp_program_and_multiple_data(
+                    asp_program=scoped_asp_program,
+                    facts=facts,
+                    data_mapping=data_mapping,
+                    mapping=self.__rule_id_mapping,
+                    stratified=self.__stratified,
+                    rule_groups=self.__rule_groups,
+                )
+            )
+
+        return matching_rules
+
+    def evaluate_columns(self, columns: Dict[str, Any]) -> Any:
+        """
+        Evaluate the compiled rules natively against a columnar batch of records, using vectorized NumPy operations.
+        :param columns: dictionary of flattened variable path and its NumPy array of values, one entry per record
+        :return: boolean matrix of shape (records, rules), with the rules in the same order as `rule_id_mapping`
+        """
+        return get_matching_rules_matrix_for_native_rules_and_columns(
+            rule_nodes=self.__get_root_nodes(),
+            columns=columns,
+        )
+
+    def __len__(self):
+        return len(self.__rule_inputs)
@@ -0,0 +1,121 @@
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from clingo import Control, Function, Number
+
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.constants.asp_naming import PredicateNames
+from json_logic_asp.sdk.clingo_builder import term_to_symbol
+
+
+class ClingoEngine:
+    """
+    Persistent clingo control using multi-shot solving, so a rules program is parsed once and solved many times.
+
+    The rules program must be scoped with the `SCOPE_PARAMETER` program parameter, and guarded with the
+    `active(SCOPE_PARAMETER)` external atom. Each run adds the facts under a fresh scope, grounds the rules part for
+    it and solves; afterwards the scope is released, so previous runs never affect the following ones.
+
+    Clingo cannot retract the facts nor the rules grounded for a released scope, so memory and solving time grow with
+    every run. The control is recreated every `max_runs` runs to release them, which only costs parsing the program
+    again.
+    """
+
+    PROGRAM_NAME = "rules"
+    SCOPE_PARAMETER = "scope"
+    DEFAULT_MAX_RUNS = 100
+
+    def __init__(self, program: str, max_runs: int = DEFAULT_MAX_RUNS):
+        """
+        :param program: scoped rules program
+        :param max_runs: number of runs after which the control is recreated, to release grounded runs from memory
+        """
+        self.__program = program
+        self.__max_runs = max_runs
+
+        self.__lock = threading.Lock()
+        self.__control: Optional[Control] = None
+        self.__runs = 0
+
+    def __reset(self) -> Control:
+        control = Control(["--stats"])
+        control.add(
+            self.PROGRAM_NAME,
+            [self.SCOPE_PARAMETER],
+            f"#external {PredicateNames.ACTIVE.value}({self.SCOPE_PARAMETER}).\n{self.__program}",
+        )
+
+        self.__control = control
+        self.__runs = 0
+
+        return control
+
+    def add_program(self, program: str):
+        """
+        Extend the rules program, adding the new statements to the live control so the following runs ground them.
+        :param program: scoped rules program to add
+        """
+        with self.__lock:
+            self.__program = f"{self.__program}\n{program}"
+            if self.__control is not None:
+                try:
+                    self.__control.add(self.PROGRAM_NAME, [self.SCOPE_PARAMETER], program)
+                except (RuntimeError, MemoryError):
+                    # Control state is unknown after a failed addition, recreate it on next run
+                    self.__control = None
+
+    def replace_program(self, program: str):
+        """
+        Replace the rules program. Clingo cannot retract statements, so the control is recreated on next run.
+        :param program: scoped rules program
+        """
+        with self.__lock:
+            self.__program = program
+            self.__control = None
+
+    def run(self, facts: Sequence[PredicateAtom]) -> Tuple[str, List[str], Dict]:
+        """
+        Solve the rules program against the given facts.
+        :param facts: atoms to be added as facts for this run only
+        :return: tuple of status, matching rules and statistics
+        """
+        with self.__lock:
+            control = self.__control
+            if control is None or self.__runs >= self.__max_runs:
+                try:
+                    control = self.__reset()
+                except (RuntimeError, MemoryError):
+                    return "ERROR", [], {}
+
+            self.__runs += 1
+            scope = Number(self.__runs)
+            active = Function(PredicateNames.ACTIVE.value, [scope])
+
+            with control.backend() as backend:
+                for fact in facts:
+                    symbol = Function(fact.predicate_name, [scope, *[term_to_symbol(term) for term in fact.terms]])
+                    backend.add_rule([backend.add_atom(symbol)])
+
+            try:
+                control.ground([(self.PROGRAM_NAME, [scope])])
+            except (RuntimeError, MemoryError):
+                # Control state is unknown after a failed grounding, recreate it on next run
+                self.__control = None
+                return "ERROR", [], {}
+            control.assign_external(active, True)
+
+            rules: List[str] = []
+            with control.solve(yield_=True) as hdl:  # type: ignore
+                for model in hdl:
+                    for symbol in model.symbols(shown=True):
+                        if symbol.name != PredicateNames.RULE.value or len(symbol.arguments) != 2:
+                            continue
+                        if symbol.arguments[0] != scope:
+                            continue
+                        rules.append(symbol.arguments[1].name)
+                    hdl.cancel()
+                status = str(hdl.get())
+
+            control.release_external(active)
+
+            return status, rules, control.statistics
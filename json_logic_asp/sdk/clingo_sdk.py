@@ -1,26 +1,114 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from clingo import Control
+from clingo import Control, Function, ast
 
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.constants.asp_naming import PredicateNames
+from json_logic_asp.sdk.clingo_builder import term_to_symbol
 
-def run_clingo(absolute_file_path: str) -> Tuple[str, List[str], Dict]:
-    rules: List[str] = []
 
-    prg = Control(["--stats"])
-    try:
-        prg.load(absolute_file_path)
-    except (RuntimeError, MemoryError):
-        return "ERROR", [], {}
+def __read_grounded_rules(prg: Control, arity: int) -> Optional[List[Tuple[str, ...]]]:
+    # A stratified program is fully decided by the grounder: its only answer set is made of the grounded facts
+    if prg.is_conflicting:
+        return None
+
+    rules: List[Tuple[str, ...]] = []
+    for symbolic_atom in prg.symbolic_atoms.by_signature(PredicateNames.RULE, arity):
+        if not symbolic_atom.is_fact:
+            return None
+        rules.append(tuple(argument.name for argument in symbolic_atom.symbol.arguments))
 
+    return rules
+
+
+def __ground_and_solve(
+    prg: Control, arity: int = 1, stratified: bool = False
+) -> Tuple[str, List[Tuple[str, ...]], Dict]:
     prg.ground([("base", [])])
 
+    if stratified:
+        grounded_rules = __read_grounded_rules(prg, arity)
+        if grounded_rules is not None:
+            return "SAT", grounded_rules, prg.statistics
+
+    rules: List[Tuple[str, ...]] = []
     with prg.solve(yield_=True) as hdl:  # type: ignore
         for model in hdl:
             for symbol in model.symbols(terms=True, shown=True):
-                if symbol.name != "rule" or len(symbol.arguments) != 1:
+                if symbol.name != PredicateNames.RULE or len(symbol.arguments) != arity:
                     continue
-                rules.append(symbol.arguments[0].name)
+                rules.append(tuple(argument.name for argument in symbol.arguments))
             hdl.cancel()
         status = str(hdl.get())
 
     return status, rules, prg.statistics
+
+
+def run_clingo(absolute_file_path: str, stratified: bool = False) -> Tuple[str, List[str], Dict]:
+    prg = Control(["--stats"])
+    try:
+        prg.load(absolute_file_path)
+    except (RuntimeError, MemoryError):
+        return "ERROR", [], {}
+
+    status, rules, stats = __ground_and_solve(prg, stratified=stratified)
+    return status, [rule[0] for rule in rules], stats
+
+
+def run_clingo_program(program: str, stratified: bool = False) -> Tuple[str, List[str], Dict]:
+    prg = Control(["--stats"])
+    try:
+        prg.add("base", [], program)
+    except (RuntimeError, MemoryError):
+        return "ERROR", [], {}
+
+    status, rules, stats = __ground_and_solve(prg, stratified=stratified)
+    return status, [rule[0] for rule in rules], stats
+
+
+def run_clingo_scoped_program(program: str, stratified: bool = False) -> Tuple[str, List[Tuple[str, str]], Dict]:
+    prg = Control(["--stats"])
+    try:
+        prg.add("base", [], program)
+    except (RuntimeError, MemoryError):
+        return "ERROR", [], {}
+
+    status, rules, stats = __ground_and_solve(prg, arity=2, stratified=stratified)
+    return status, [(scope, rule_id) for scope, rule_id in rules], stats
+
+
+def __load_ast_program(prg: Control, program: Sequence[ast.AST], facts: Sequence[PredicateAtom]):
+    with ast.ProgramBuilder(prg) as builder:
+        for statement in program:
+            builder.add(statement)
+
+    with prg.backend() as backend:
+        for fact in facts:
+            symbol = Function(fact.predicate_name, [term_to_symbol(term) for term in fact.terms])
+            backend.add_rule([backend.add_atom(symbol)])
+
+
+def run_clingo_ast_program(
+    program: Sequence[ast.AST], facts: Sequence[PredicateAtom], stratified: bool = False
+) -> Tuple[str, List[str], Dict]:
+    prg = Control(["--stats"])
+    try:
+        __load_ast_program(prg, program, facts)
+    except (RuntimeError, MemoryError):
+        return "ERROR", [], {}
+
+    status, rules, stats = __ground_and_solve(prg, stratified=stratified)
+    return status, [rule[0] for rule in rules], stats
+
+
+def run_clingo_scoped_ast_program(
+    program: Sequence[ast.AST], facts: Sequence[PredicateAtom], stratified: bool = False
+) -> Tuple[str, List[Tuple[str, str]], Dict]:
+    prg = Control(["--stats"])
+    try:
+        __load_ast_program(prg, program, facts)
+    except (RuntimeError, MemoryError):
+        return "ERROR", [], {}
+
+    status, rules, stats = __ground_and_solve(prg, arity=2, stratified=stratified)
+    return status, [(scope, rule_id) for scope, rule_id in rules], stats
@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Callable, Dict
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from json_logic_asp.constants.json_logic_ops import JsonLogicOps
 from json_logic_asp.constants.loggers import SIMPLIFIER_LOGGER_NAME
@@ -102,11 +103,48 @@ SIMPLIFIABLE_OPERATIONS: Dict[str, Callable] = {
 }
 
 
+# Results of the nodes already simplified by the running simplification, by node identity
+__simplified_nodes: ContextVar[Optional[Dict[int, Any]]] = ContextVar("simplified_nodes", default=None)
+
+
+def __simplify_nested_nodes(node_key: str, node_values: Any, node: Dict, simplified_nodes: Dict[int, Any]):
+    # Simplifiable nodes are simplified bottom-up with an explicit stack, so when a node simplifies its children they
+    # are already in the results, and deeply nested rules never hit the recursion limit
+    pending: List[Tuple[Dict, str, Any, bool]] = [(node, node_key, node_values, False)]
+    while pending:
+        current_node, current_key, current_values, children_simplified = pending.pop()
+        if children_simplified:
+            simplified_nodes[id(current_node)] = SIMPLIFIABLE_OPERATIONS[current_key](
+                node_key=current_key, node_values=current_values
+            )
+            continue
+
+        pending.append((current_node, current_key, current_values, True))
+        for child_value in reversed(current_values if isinstance(current_values, list) else [current_values]):
+            if not isinstance(child_value, dict) or not child_value or id(child_value) in simplified_nodes:
+                continue
+            child_key = next(iter(child_value))
+            if child_key in SIMPLIFIABLE_OPERATIONS:
+                pending.append((child_value, child_key, child_value[child_key], False))
+
+
 def simplify_node(node: Dict):
+    simplified_nodes = __simplified_nodes.get()
+    if simplified_nodes is None:
+        token = __simplified_nodes.set({})
+        try:
+            return simplify_node(node)
+        finally:
+            __simplified_nodes.reset(token)
+
+    if id(node) in simplified_nodes:
+        return simplified_nodes[id(node)]
+
     node_key, node_value = extract_key_and_value_from_node(node)
 
     if node_key not in SIMPLIFIABLE_OPERATIONS:
         logger.debug(f"Node {node_key} cannot be simplified, skipping")
         return node
 
-    return SIMPLIFIABLE_OPERATIONS[node_key](node_key=node_key, node_values=node_value)
+    __simplify_nested_nodes(node_key, node_value, node, simplified_nodes)
+    return simplified_nodes[id(node)]
@@ -1,11 +1,44 @@
 __all__ = [
+    "generate_single_data_asp_atoms",
+    "generate_multiple_data_asp_atoms",
+    "generate_multiple_data_asp_definition",
     "generate_single_data_asp_definition",
+    "generate_single_data_native_values",
     "translate_single_rule_eval",
     "translate_multi_rule_eval",
     "generate_single_rule_asp_definition",
     "generate_multiple_rule_asp_definition",
+    "generate_multiple_rule_asp_statements",
+    "render_asp_statements",
+    "write_multiple_rule_asp_definition",
+    "stream_multiple_rule_asp_definition",
+    "iter_ndjson_rule_inputs",
+    "compile_ndjson_rules",
+    "load_ndjson_rule_id_mapping",
+    "generate_rule_function",
+    "TranslationCache",
+    "RuleCompiler",
+    "parameterize_asp_statements",
 ]
 
-from .data_generator import generate_single_data_asp_definition
+from .data_generator import (
+    generate_multiple_data_asp_atoms,
+    generate_multiple_data_asp_definition,
+    generate_single_data_asp_atoms,
+    generate_single_data_asp_definition,
+    generate_single_data_native_values,
+)
 from .eval_translator import translate_multi_rule_eval, translate_single_rule_eval
-from .rule_generator import generate_multiple_rule_asp_definition, generate_single_rule_asp_definition
+from .function_generator import generate_rule_function
+from .rule_compiler import RuleCompiler
+from .rule_generator import (
+    generate_multiple_rule_asp_definition,
+    generate_multiple_rule_asp_statements,
+    generate_single_rule_asp_definition,
+    render_asp_statements,
+    stream_multiple_rule_asp_definition,
+    write_multiple_rule_asp_definition,
+)
+from .rule_stream import compile_ndjson_rules, iter_ndjson_rule_inputs, load_ndjson_rule_id_mapping
+from .rule_templates import parameterize_asp_statements
+from .translation_cache import TranslationCache
@@ -1,9 +1,11 @@
+from typing import Dict, List, Tuple
+
 from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
 from json_logic_asp.adapters.asp.asp_statements import FactStatement
 from json_logic_asp.constants.asp_naming import PredicateNames
 from json_logic_asp.models.translator_dto import DataInput
 from json_logic_asp.utils.id_management import generate_constant_string
-from json_logic_asp.utils.json_logic_helpers import value_encoder
+from json_logic_asp.utils.json_logic_helpers import EncodedValue, native_value_encoder, value_encoder
 from json_logic_asp.utils.list_utils import remove_duplicates
 
 
@@ -27,6 +29,50 @@ def __flatten_data(y):
     return out
 
 
+def __generate_data_fact_statements(data_input: DataInput) -> List[FactStatement]:
+    statements = []
+
+    flattened_obj = __flatten_data(data_input.data_object)
+    for var_name, var_value in flattened_obj.items():
+        statements.append(
+            FactStatement(
+                atom=PredicateAtom(
+                    predicate_name=PredicateNames.DATA_VAR,
+                    terms=[
+                        generate_constant_string(var_name),
+                        value_encoder(var_value),
+                    ],
+                ),
+                comment=f"{var_name} : {var_value}",
+            )
+        )
+
+    return statements
+
+
+def generate_single_data_asp_atoms(data_input: DataInput) -> List[PredicateAtom]:
+    """
+    Given a data input, generate the corresponding ASP fact atoms, without rendering them.
+
+    :param data_input: DataInput object with the containing data
+    :return: list of atoms to be added as facts
+    """
+    return [stmt.atom for stmt in __generate_data_fact_statements(data_input)]
+
+
+def generate_single_data_native_values(data_input: DataInput) -> Dict[str, EncodedValue]:
+    """
+    Given a data input, generate the flattened data with natively encoded values, for the native evaluation.
+
+    :param data_input: DataInput object with the containing data
+    :return: dictionary of variable name and natively encoded value
+    """
+    return {
+        var_name: native_value_encoder(var_value)
+        for var_name, var_value in __flatten_data(data_input.data_object).items()
+    }
+
+
 def generate_single_data_asp_definition(data_input: DataInput, with_comments: bool = False) -> str:
     """
     Given a data input, generate the corresponding ASP definition.
@@ -37,18 +83,7 @@ def generate_single_data_asp_definition(data_input: DataInput, with_comments: bo
     """
     statements = []
 
-    flattened_obj = __flatten_data(data_input.data_object)
-    for var_name, var_value in flattened_obj.items():
-        stmt = FactStatement(
-            atom=PredicateAtom(
-                predicate_name=PredicateNames.DATA_VAR,
-                terms=[
-                    generate_constant_string(var_name),
-                    value_encoder(var_value),
-                ],
-            ),
-            comment=f"{var_name} : {var_value}",
-        )
+    for stmt in __generate_data_fact_statements(data_input):
         if with_comments:
             statements.append(stmt.to_asp_comment())
         statements.append(stmt.to_asp_statement())
@@ -56,3 +91,61 @@ def generate_single_data_asp_definition(data_input: DataInput, with_comments: bo
     statements = remove_duplicates(statements)
 
     return "\n".join(statements)
+
+
+def __generate_multiple_data_fact_statements(
+    data_inputs: List[DataInput],
+) -> Tuple[List[FactStatement], Dict[str, str]]:
+    statements: List[FactStatement] = []
+    mapping: Dict[str, str] = {}
+
+    for data_input in data_inputs:
+        hashed_id = generate_constant_string(data_input.data_id)
+        if hashed_id in mapping:
+            continue
+        mapping[hashed_id] = data_input.data_id
+
+        statements.append(
+            FactStatement(
+                atom=PredicateAtom(predicate_name=PredicateNames.RECORD, terms=[hashed_id]),
+                comment=data_input.data_id,
+            )
+        )
+        statements.extend(
+            FactStatement(atom=stmt.atom.scoped(hashed_id), comment=stmt.comment)
+            for stmt in __generate_data_fact_statements(data_input)
+        )
+
+    return statements, mapping
+
+
+def generate_multiple_data_asp_atoms(data_inputs: List[DataInput]) -> Tuple[List[PredicateAtom], Dict[str, str]]:
+    """
+    Given multiple data inputs, generate the corresponding ASP fact atoms scoped by their data id, without rendering.
+
+    :param data_inputs: list of DataInput objects with the containing data
+    :return: tuple of atoms to be added as facts and mapping dictionary (ASP record to original data id)
+    """
+    statements, mapping = __generate_multiple_data_fact_statements(data_inputs)
+    return [stmt.atom for stmt in statements], mapping
+
+
+def generate_multiple_data_asp_definition(
+    data_inputs: List[DataInput], with_comments: bool = False
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Given multiple data inputs, generate the corresponding ASP definition, with every fact scoped by its data id.
+
+    :param data_inputs: list of DataInput objects with the containing data
+    :param with_comments: if true, generate the definition including ASP comments
+    :return: tuple of data encoded in ASP definition and mapping dictionary (ASP record to original data id)
+    """
+    statements: List[str] = []
+
+    data_statements, mapping = __generate_multiple_data_fact_statements(data_inputs)
+    for stmt in data_statements:
+        if with_comments:
+            statements.append(stmt.to_asp_comment())
+        statements.append(stmt.to_asp_statement())
+
+    return "\n".join(statements), mapping
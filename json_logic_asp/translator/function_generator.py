@@ -0,0 +1,247 @@
+from itertools import product
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type
+
+from json_logic_asp.adapters.json_logic.jl_array_nodes import EMPTY_MERGE_VALUE, ArrayInNode, ArrayMergeNode
+from json_logic_asp.adapters.json_logic.jl_boolean_nodes import BooleanAndNode, BooleanNotNode, BooleanOrNode
+from json_logic_asp.adapters.json_logic.jl_data_nodes import DataMissingNode, DataVarNode
+from json_logic_asp.adapters.json_logic.jl_logic_nodes import NATIVE_COMPARATORS, LogicEvalNode, LogicIfNode
+from json_logic_asp.models.json_logic_nodes import JsonLogicDataNode, JsonLogicNode
+from json_logic_asp.utils.json_logic_helpers import EncodedValue, native_value_encoder
+
+NativeData = Dict[str, EncodedValue]
+RuleFunction = Callable[[NativeData], bool]
+ValuesFunction = Callable[[NativeData], List[EncodedValue]]
+
+
+def __generate_values_function(node: JsonLogicDataNode) -> ValuesFunction:
+    if isinstance(node, DataVarNode):
+        var_name = node.var_name
+        return lambda data: [data[var_name]] if var_name in data else []
+
+    if isinstance(node, ArrayMergeNode):
+        primitives = [v for v in node.child_nodes if not isinstance(v, JsonLogicDataNode)]
+        constants = [native_value_encoder(val) for val in primitives] if primitives else [EMPTY_MERGE_VALUE]
+        var_functions = [
+            __generate_values_function(var_node)
+            for var_node in node.child_nodes
+            if isinstance(var_node, JsonLogicDataNode)
+        ]
+
+        def merge_values(data: NativeData) -> List[EncodedValue]:
+            values = list(constants)
+            for var_function in var_functions:
+                values.extend(var_function(data))
+            return values
+
+        return merge_values
+
+    raise NotImplementedError(f"{node.__class__.__name__} cannot be compiled to a Python function")
+
+
+def __generate_data_function(node: JsonLogicDataNode, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    if isinstance(node, DataVarNode):
+        var_name = node.var_name
+        return lambda data: var_name in data
+
+    values_function = __generate_values_function(node)
+    return lambda data: len(values_function(data)) > 0
+
+
+def __generate_missing_function(node: DataMissingNode, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    var_names = tuple(node.var_names)
+    if len(var_names) == 1:
+        var_name = var_names[0]
+        return lambda data: var_name not in data
+
+    return lambda data: not any(var_name in data for var_name in var_names)
+
+
+def __generate_and_function(node: BooleanAndNode, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    if node.has_false:
+        return lambda data: False
+
+    # Data children atoms share their term variable in the ASP rule body, so they must agree on a common value
+    shared_data_nodes: Dict[str, List[JsonLogicDataNode]] = {}
+    functions: List[RuleFunction] = []
+    for child_node in node.child_nodes:
+        if isinstance(child_node, JsonLogicDataNode):
+            shared_data_nodes.setdefault(child_node.term_variable_name, []).append(child_node)
+        elif isinstance(child_node, JsonLogicNode):
+            functions.append(__generate_function(child_node, cache))
+
+    for data_nodes in shared_data_nodes.values():
+        if len(data_nodes) == 1:
+            functions.append(__generate_function(data_nodes[0], cache))
+            continue
+
+        values_functions = [__generate_values_function(data_node) for data_node in data_nodes]
+
+        def shared_values(data: NativeData, values_functions=values_functions) -> bool:
+            values = set(values_functions[0](data))
+            for values_function in values_functions[1:]:
+                values.intersection_update(values_function(data))
+            return len(values) > 0
+
+        functions.append(shared_values)
+
+    if len(functions) == 1:
+        return functions[0]
+    if len(functions) == 2:
+        first, second = functions
+        return lambda data: first(data) and second(data)
+
+    def and_function(data: NativeData) -> bool:
+        for function in functions:
+            if not function(data):
+                return False
+        return True
+
+    return and_function
+
+
+def __generate_or_function(node: BooleanOrNode, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    if node.has_true:
+        return lambda data: True
+
+    functions = [
+        __generate_function(child_node, cache)
+        for child_node in node.child_nodes
+        if isinstance(child_node, JsonLogicNode)
+    ]
+
+    if not functions:
+        return lambda data: False
+    if len(functions) == 1:
+        return functions[0]
+    if len(functions) == 2:
+        first, second = functions
+        return lambda data: first(data) or second(data)
+
+    def or_function(data: NativeData) -> bool:
+        for function in functions:
+            if function(data):
+                return True
+        return False
+
+    return or_function
+
+
+def __generate_not_function(node: BooleanNotNode, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    function = __generate_function(node.child_nodes[0], cache)
+    return lambda data: not function(data)
+
+
+def __generate_if_function(node: LogicIfNode, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    functions = [__generate_function(child_node, cache) for child_node in node.child_nodes]
+    pairs: List[Tuple[RuleFunction, RuleFunction]] = list(zip(functions[0:-1:2], functions[1::2]))
+    else_function: Optional[RuleFunction] = functions[-1] if len(functions) % 2 == 1 else None
+
+    # Evaluation happens in pairs: the first condition that holds decides with its value, otherwise the else node
+    def if_function(data: NativeData) -> bool:
+        for condition, value in pairs:
+            if condition(data):
+                return value(data)
+        return else_function(data) if else_function is not None else False
+
+    return if_function
+
+
+def __generate_eval_function(node: LogicEvalNode, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    if node.comparator not in NATIVE_COMPARATORS:
+        raise NotImplementedError(f"{node.__class__.__name__} cannot be compiled to a Python function")
+    comparator = NATIVE_COMPARATORS[node.comparator]
+
+    data_nodes: List[JsonLogicDataNode] = []
+    operands: List[Tuple[bool, Any]] = []
+    for child_node in node.child_nodes:
+        if isinstance(child_node, JsonLogicDataNode):
+            if child_node not in data_nodes:
+                data_nodes.append(child_node)
+            operands.append((True, data_nodes.index(child_node)))
+        else:
+            operands.append((False, native_value_encoder(child_node)))
+
+    # Most common case, a variable compared against a constant: inline both and skip the combinations
+    if len(operands) == 2 and len(data_nodes) == 1 and isinstance(data_nodes[0], DataVarNode):
+        var_name = data_nodes[0].var_name
+        (left_is_data, left), (right_is_data, right) = operands
+        if left_is_data and not right_is_data:
+            return lambda data: var_name in data and comparator(data[var_name], right)
+        if right_is_data and not left_is_data:
+            return lambda data: var_name in data and comparator(left, data[var_name])
+
+    values_functions = [__generate_values_function(data_node) for data_node in data_nodes]
+
+    # Same as the ASP encoding, the node holds if any combination of the data node values satisfies all comparisons
+    def eval_function(data: NativeData) -> bool:
+        for combination in product(*[values_function(data) for values_function in values_functions]):
+            values = [combination[value] if is_data else value for is_data, value in operands]
+            if all(comparator(values[i], values[i + 1]) for i in range(len(values) - 1)):
+                return True
+        return False
+
+    return eval_function
+
+
+def __generate_in_function(node: ArrayInNode, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    if isinstance(node.list_node, list):
+        if not isinstance(node.data_node, DataVarNode):
+            raise NotImplementedError(f"{node.data_node.__class__.__name__} cannot be compiled to a Python function")
+
+        var_name = node.data_node.var_name
+        list_values: FrozenSet[EncodedValue] = frozenset(native_value_encoder(val) for val in node.list_node)
+        return lambda data: data.get(var_name) in list_values
+
+    data_values_function = __generate_values_function(node.data_node)
+    list_values_function = __generate_values_function(node.list_node)
+
+    def in_function(data: NativeData) -> bool:
+        values = set(list_values_function(data))
+        return any(value in values for value in data_values_function(data))
+
+    return in_function
+
+
+FUNCTION_GENERATORS: Dict[Type, Callable[[Any, Dict[int, RuleFunction]], RuleFunction]] = {
+    DataMissingNode: __generate_missing_function,
+    JsonLogicDataNode: __generate_data_function,
+    BooleanAndNode: __generate_and_function,
+    BooleanOrNode: __generate_or_function,
+    BooleanNotNode: __generate_not_function,
+    LogicIfNode: __generate_if_function,
+    LogicEvalNode: __generate_eval_function,
+    ArrayInNode: __generate_in_function,
+}
+
+
+def __generate_function(node: Any, cache: Dict[int, RuleFunction]) -> RuleFunction:
+    if isinstance(node, bool):
+        return (lambda data: True) if node else (lambda data: False)
+
+    node_key = id(node)
+    if node_key not in cache:
+        generator = next((FUNCTION_GENERATORS[t] for t in type(node).__mro__ if t in FUNCTION_GENERATORS), None)
+        if generator is None:
+            raise NotImplementedError(f"{node.__class__.__name__} cannot be compiled to a Python function")
+        cache[node_key] = generator(node, cache)
+
+    return cache[node_key]
+
+
+def generate_rule_function(
+    node: JsonLogicNode, function_cache: Optional[Dict[int, RuleFunction]] = None
+) -> RuleFunction:
+    """
+    Given a parsed rule tree, generate a single Python function evaluating it natively.
+
+    The tree is walked once, resolving every node into a closure with its constants already encoded, so evaluating
+    the function does no per-node dispatch and short-circuits as soon as the result is known.
+
+    :param node: root node of the parsed rule
+    :param function_cache: optional cache of already generated functions to reuse (and fill), for nodes shared by rules
+    :return: function receiving the natively encoded data and returning whether the rule matches
+    """
+    if function_cache is None:
+        function_cache = {}
+
+    return __generate_function(node, function_cache)
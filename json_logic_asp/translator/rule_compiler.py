@@ -0,0 +1,146 @@
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple, Type
+
+from json_logic_asp.adapters.json_logic.jl_array_nodes import ArrayInNode, ArrayMergeNode
+from json_logic_asp.adapters.json_logic.jl_boolean_nodes import BooleanAndNode, BooleanNotNode, BooleanOrNode
+from json_logic_asp.adapters.json_logic.jl_data_nodes import DataMissingNode, DataVarNode
+from json_logic_asp.adapters.json_logic.jl_logic_nodes import (
+    LogicEqualNode,
+    LogicGreaterOrEqualThanNode,
+    LogicGreaterThanNode,
+    LogicIfNode,
+    LogicLowerOrEqualThanNode,
+    LogicLowerThanNode,
+    LogicNotEqualNode,
+    LogicStrictEqualNode,
+    LogicStrictNotEqualNode,
+)
+from json_logic_asp.constants.json_logic_ops import JsonLogicOps
+from json_logic_asp.models.json_logic_nodes import JsonLogicNode
+
+SUPPORTED_NODE_TYPES: Dict[JsonLogicOps, Type] = {
+    JsonLogicOps.DATA_VAR: DataVarNode,
+    JsonLogicOps.DATA_MISSING: DataMissingNode,
+    JsonLogicOps.BOOLEAN_AND: BooleanAndNode,
+    JsonLogicOps.BOOLEAN_OR: BooleanOrNode,
+    JsonLogicOps.BOOLEAN_NOT: BooleanNotNode,
+    JsonLogicOps.LOGIC_IF: LogicIfNode,
+    JsonLogicOps.LOGIC_EQ: LogicEqualNode,
+    JsonLogicOps.LOGIC_STRICT_EQ: LogicStrictEqualNode,
+    JsonLogicOps.LOGIC_NOT_EQ: LogicNotEqualNode,
+    JsonLogicOps.LOGIC_STRICT_NOT_EQ: LogicStrictNotEqualNode,
+    JsonLogicOps.NUMERIC_GT: LogicGreaterThanNode,
+    JsonLogicOps.NUMERIC_GTE: LogicGreaterOrEqualThanNode,
+    JsonLogicOps.NUMERIC_LT: LogicLowerThanNode,
+    JsonLogicOps.NUMERIC_LTE: LogicLowerOrEqualThanNode,
+    JsonLogicOps.ARRAY_MERGE: ArrayMergeNode,
+    JsonLogicOps.ARRAY_IN: ArrayInNode,
+}
+
+SCALAR_TYPES = (str, int, float, bool)
+
+
+class RuleCompiler:
+    """
+    Parser of JSON Logic rule trees into nodes, built once and reused across rules and calls.
+
+    The custom nodes are validated once and merged with the supported ones into a frozen dispatch table, so parsing a
+    node is a single lookup. Parsed nodes are interned in the node cache, so identical subtrees are shared by all the
+    rules parsed by the same compiler.
+    """
+
+    def __init__(
+        self,
+        custom_nodes: Optional[Dict[str, Type]] = None,
+        node_cache: Optional[Dict[str, JsonLogicNode]] = None,
+    ):
+        """
+        :param custom_nodes: optional dictionary of node_key and corresponding class generating the node
+        :param node_cache: optional node cache to reuse (and fill) while parsing the rules
+        """
+        custom_nodes = dict(custom_nodes or {})
+        for node_key, node_class in custom_nodes.items():
+            if not isinstance(node_key, str):
+                raise ValueError(f"Custom node key {node_key!r} must be a string")
+            if not isinstance(node_class, type) or not issubclass(node_class, JsonLogicNode):
+                raise ValueError(f"Custom node {node_key} must be a JsonLogicNode class")
+
+        self.custom_nodes: Mapping[str, Type] = MappingProxyType(custom_nodes)
+        self.node_types: Mapping[str, Type] = MappingProxyType(
+            {
+                **{node_key.value: node_class for node_key, node_class in SUPPORTED_NODE_TYPES.items()},
+                **custom_nodes,
+            }
+        )
+        # Known operations without a node are parsed too, so they are reported instead of being taken as plain values
+        self.__node_keys: FrozenSet[str] = frozenset([*[op.value for op in JsonLogicOps], *custom_nodes])
+
+        self.node_cache: Dict[str, JsonLogicNode] = node_cache if node_cache is not None else {}
+        self.__leaf_nodes: Dict[Tuple[str, Type, Any], JsonLogicNode] = {}
+
+    def is_node(self, value: Any) -> bool:
+        """
+        Check whether a value is a JSON Logic node, a dictionary with a single known operation as key.
+        :param value: value to check
+        :return: whether the value must be parsed as a node
+        """
+        return isinstance(value, dict) and len(value) == 1 and next(iter(value)) in self.__node_keys
+
+    def parse(self, rule_tree: Dict[str, Any]) -> JsonLogicNode:
+        """
+        Parse a JSON Logic rule tree into its root node, reusing the already parsed identical subtrees.
+        :param rule_tree: JSON Logic definition of the rule
+        :return: parsed root node
+        """
+        # Subtrees are parsed bottom-up with an explicit stack, so deeply nested rules never hit the recursion limit.
+        # Every entry holds a tree, its arguments once its children are queued, and the arguments slot it fills.
+        parsed_root: List[Any] = [None]
+        pending: List[Tuple[Dict[str, Any], Optional[List[Any]], List[Any], int]] = [(rule_tree, None, parsed_root, 0)]
+        while pending:
+            tree, node_args, parent_args, slot = pending.pop()
+            node_key, node_value = next(iter(tree.items()))
+
+            if node_args is not None:
+                node = self.node_types[node_key](*node_args)
+                parent_args[slot] = self.node_cache.setdefault(str(hash(node)), node)
+                continue
+
+            node_class = self.node_types.get(node_key)
+            if node_class is None:
+                raise NotImplementedError(f"Node {node_key} is not yet implemented")
+
+            if not isinstance(node_value, (dict, list)):
+                parent_args[slot] = self.__parse_leaf(node_key, node_class, node_value)
+                continue
+
+            node_args = [node_value] if isinstance(node_value, dict) else list(node_value)
+            pending.append((tree, node_args, parent_args, slot))
+            for index in range(len(node_args) - 1, -1, -1):
+                child = node_args[index]
+                if not self.is_node(child):
+                    continue
+                # Already parsed leaves are reused in place, without going through the stack
+                leaf_node = self.__get_parsed_leaf(*next(iter(child.items())))
+                if leaf_node is not None:
+                    node_args[index] = leaf_node
+                else:
+                    pending.append((child, None, node_args, index))
+
+        return parsed_root[0]
+
+    def __get_parsed_leaf(self, node_key: str, node_value: Any) -> Optional[JsonLogicNode]:
+        if not isinstance(node_value, SCALAR_TYPES):
+            return None
+        return self.__leaf_nodes.get((node_key, type(node_value), node_value))
+
+    def __parse_leaf(self, node_key: str, node_class: Type, node_value: Any) -> JsonLogicNode:
+        leaf_node = self.__get_parsed_leaf(node_key, node_value)
+        if leaf_node is not None:
+            return leaf_node
+
+        node = node_class(node_value)
+        node = self.node_cache.setdefault(str(hash(node)), node)
+        if isinstance(node_value, SCALAR_TYPES):
+            # Leaves are mostly repeated variables, so they are interned before building them
+            self.__leaf_nodes[(node_key, type(node_value), node_value)] = node
+        return node
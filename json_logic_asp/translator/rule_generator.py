@@ -1,155 +1,431 @@
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
 
 from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
 from json_logic_asp.adapters.asp.asp_statements import RuleStatement
-from json_logic_asp.adapters.json_logic.jl_array_nodes import ArrayInNode, ArrayMergeNode
-from json_logic_asp.adapters.json_logic.jl_boolean_nodes import BooleanAndNode, BooleanNotNode, BooleanOrNode
-from json_logic_asp.adapters.json_logic.jl_data_nodes import DataMissingNode, DataVarNode
-from json_logic_asp.adapters.json_logic.jl_logic_nodes import (
-    LogicEqualNode,
-    LogicGreaterOrEqualThanNode,
-    LogicGreaterThanNode,
-    LogicIfNode,
-    LogicLowerOrEqualThanNode,
-    LogicLowerThanNode,
-    LogicNotEqualNode,
-    LogicStrictEqualNode,
-    LogicStrictNotEqualNode,
-)
 from json_logic_asp.constants.asp_naming import PredicateNames
-from json_logic_asp.constants.json_logic_ops import JsonLogicOps
+from json_logic_asp.models.asp_base import Statement
 from json_logic_asp.models.json_logic_nodes import JsonLogicNode
 from json_logic_asp.models.translator_dto import RuleInput
+from json_logic_asp.translator.rule_compiler import RuleCompiler
+from json_logic_asp.translator.rule_templates import parameterize_asp_statement
+from json_logic_asp.translator.translation_cache import TranslationCache
 from json_logic_asp.utils.id_management import generate_constant_string
-from json_logic_asp.utils.json_logic_helpers import extract_key_and_value_from_node
 from json_logic_asp.utils.list_utils import remove_duplicates
 
-SUPPORTED_NODE_TYPES: Dict[JsonLogicOps, Type] = {
-    JsonLogicOps.DATA_VAR: DataVarNode,
-    JsonLogicOps.DATA_MISSING: DataMissingNode,
-    JsonLogicOps.BOOLEAN_AND: BooleanAndNode,
-    JsonLogicOps.BOOLEAN_OR: BooleanOrNode,
-    JsonLogicOps.BOOLEAN_NOT: BooleanNotNode,
-    JsonLogicOps.LOGIC_IF: LogicIfNode,
-    JsonLogicOps.LOGIC_EQ: LogicEqualNode,
-    JsonLogicOps.LOGIC_STRICT_EQ: LogicStrictEqualNode,
-    JsonLogicOps.LOGIC_NOT_EQ: LogicNotEqualNode,
-    JsonLogicOps.LOGIC_STRICT_NOT_EQ: LogicStrictNotEqualNode,
-    JsonLogicOps.NUMERIC_GT: LogicGreaterThanNode,
-    JsonLogicOps.NUMERIC_GTE: LogicGreaterOrEqualThanNode,
-    JsonLogicOps.NUMERIC_LT: LogicLowerThanNode,
-    JsonLogicOps.NUMERIC_LTE: LogicLowerOrEqualThanNode,
-    JsonLogicOps.ARRAY_MERGE: ArrayMergeNode,
-    JsonLogicOps.ARRAY_IN: ArrayInNode,
-}
+# Every worker gets several partitions, so a slower partition does not leave the other workers idle at the end
+PARTITIONS_PER_WORKER = 4
+
+
+def __iter_multiple_rule_asp_statements(
+    rule_inputs: Iterable[RuleInput],
+    mapping: Dict[str, str],
+    rule_compiler: RuleCompiler,
+    rule_root_nodes: Optional[Dict[str, JsonLogicNode]],
+    translation_cache: Optional[TranslationCache],
+    rule_statements: Optional[Dict[str, List[Statement]]],
+    rule_groups: Optional[Dict[str, List[str]]],
+    parameterize: bool,
+    root_statements: Optional[List[Statement]] = None,
+) -> Iterator[Statement]:
+    # Root statements go after every node statement, so they are emitted last unless they are collected apart
+    emit_root_statements = root_statements is None
+    if root_statements is None:
+        root_statements = []
+    # Nodes shared by several rules are only emitted by the first one
+    emitted_node_ids: Set[str] = set()
 
+    for rule_input in rule_inputs:
+        hashed_id = generate_constant_string(rule_input.rule_id)
+        mapping[hashed_id] = rule_input.rule_id
 
-def __get_or_update_cache(node: JsonLogicNode, node_cache: Dict[str, JsonLogicNode]) -> JsonLogicNode:
-    node_hash = str(hash(node))
+        cache_key = None
+        translated_rule = None
+        if translation_cache is not None:
+            cache_key = TranslationCache.generate_key(rule_input.rule_tree, rule_compiler.custom_nodes)
+            translated_rule = translation_cache.get(cache_key)
+
+        node_statements: Iterable[Statement]
+        if translated_rule is not None:
+            node_statements, root_atom = translated_rule
+        else:
+            root_node = rule_compiler.parse(rule_input.rule_tree)
+            root_atom = root_node.get_asp_atom()
+            if rule_root_nodes is not None:
+                rule_root_nodes[hashed_id] = root_node
+            if translation_cache is None and rule_statements is None:
+                # Nothing keeps the statements of every rule, so they are emitted as they are visited
+                node_statements = root_node.iter_asp_statements(emitted_node_ids)
+            else:
+                node_statements = root_node.to_asp_statements()
+                if translation_cache is not None and cache_key is not None:
+                    translation_cache.put(cache_key, (node_statements, root_atom))
+
+        if parameterize:
+            node_statements = (
+                parameterized
+                for statement in node_statements
+                for parameterized in parameterize_asp_statement(statement)
+            )
+        if rule_groups is None:
+            root_statement = RuleStatement(
+                atom=PredicateAtom(predicate_name=PredicateNames.RULE, terms=[hashed_id]),
+                literals=[root_atom],
+                comment=rule_input.rule_id,
+            )
+        else:
+            # Node ids are derived from their content, so identical rules always have the same root atom
+            group_id = generate_constant_string(root_atom.to_asp_atom())
+            rule_groups.setdefault(group_id, []).append(hashed_id)
+            root_statement = RuleStatement(
+                atom=PredicateAtom(predicate_name=PredicateNames.RULE, terms=[group_id]),
+                literals=[root_atom],
+            )
+        if rule_statements is not None:
+            node_statements = list(node_statements)
+            rule_statements.setdefault(hashed_id, []).extend([*node_statements, root_statement])
+        yield from node_statements
+        root_statements.append(root_statement)
+
+    if translation_cache is not None:
+        translation_cache.flush()
+
+    if emit_root_statements:
+        yield from root_statements
+
+
+def __iter_asp_lines(
+    statements: Iterable[Statement],
+    with_comments: bool,
+    scope_term: Optional[str] = None,
+    scope_guard: Optional[PredicateAtom] = None,
+) -> Iterator[str]:
+    # Statements are rendered one at a time, and only the lines already seen are kept to remove the duplicated ones
+    seen_lines: Set[str] = set()
+    for statement in statements:
+        if scope_term is not None:
+            statement = statement.scoped(scope_term, scope_guard)
+
+        lines = [statement.to_asp_statement()]
+        if with_comments and statement.to_asp_comment():
+            lines.insert(0, statement.to_asp_comment())
+
+        for line in lines:
+            if line not in seen_lines:
+                seen_lines.add(line)
+                yield line
+
+
+def __translate_rule_inputs_partition(
+    rule_inputs: List[RuleInput],
+    with_comments: bool,
+    custom_nodes: Dict[str, Type],
+    group_rules: bool,
+    parameterize: bool,
+) -> Tuple[List[str], List[str], Dict[str, str], Dict[str, List[str]]]:
+    mapping: Dict[str, str] = {}
+    rule_groups: Dict[str, List[str]] = {}
+    root_statements: List[Statement] = []
+    statements = __iter_multiple_rule_asp_statements(
+        rule_inputs=rule_inputs,
+        mapping=mapping,
+        rule_compiler=RuleCompiler(custom_nodes=custom_nodes),
+        rule_root_nodes=None,
+        translation_cache=None,
+        rule_statements=None,
+        rule_groups=rule_groups if group_rules else None,
+        parameterize=parameterize,
+        root_statements=root_statements,
+    )
+    node_lines = list(__iter_asp_lines(statements, with_comments))
 
-    node = node_cache.get(node_hash, node)
-    node_cache[node_hash] = node
+    return node_lines, list(__iter_asp_lines(root_statements, with_comments)), mapping, rule_groups
 
-    return node
 
+def __translate_rule_inputs_in_parallel(
+    rule_inputs: List[RuleInput],
+    workers: int,
+    with_comments: bool,
+    custom_nodes: Dict[str, Type],
+    rule_groups: Optional[Dict[str, List[str]]],
+    parameterize: bool,
+) -> Tuple[str, Dict[str, str]]:
+    # Partitions are contiguous and merged in order, so the definition is the same as translating the rules serially
+    partition_size = max(1, math.ceil(len(rule_inputs) / (workers * PARTITIONS_PER_WORKER)))
+    partitions = [rule_inputs[start : start + partition_size] for start in range(0, len(rule_inputs), partition_size)]
+    translate_partition = partial(
+        __translate_rule_inputs_partition,
+        with_comments=with_comments,
+        custom_nodes=custom_nodes,
+        group_rules=rule_groups is not None,
+        parameterize=parameterize,
+    )
 
-def __is_valid_json_logic_node(node_value: Any, json_logic_node_keys: List[str]):
-    if not isinstance(node_value, dict):
-        return False
+    node_lines: List[str] = []
+    root_lines: List[str] = []
+    mapping: Dict[str, str] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partition_node_lines, partition_root_lines, partition_mapping, partition_rule_groups in executor.map(
+            translate_partition, partitions
+        ):
+            node_lines.extend(partition_node_lines)
+            root_lines.extend(partition_root_lines)
+            mapping.update(partition_mapping)
+            if rule_groups is not None:
+                for group_id, hashed_ids in partition_rule_groups.items():
+                    rule_groups.setdefault(group_id, []).extend(hashed_ids)
+
+    # Node ids are derived from their content in a canonical child order, so subtrees shared by several
+    # partitions render the same lines even when their operands are permuted
+    return "\n".join(remove_duplicates([*node_lines, *root_lines])), mapping
+
+
+def generate_multiple_rule_asp_statements(
+    rule_inputs: List[RuleInput],
+    custom_nodes: Optional[Dict[str, Type]] = None,
+    rule_node_cache: Optional[Dict[str, JsonLogicNode]] = None,
+    rule_root_nodes: Optional[Dict[str, JsonLogicNode]] = None,
+    translation_cache: Optional[TranslationCache] = None,
+    rule_statements: Optional[Dict[str, List[Statement]]] = None,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+    parameterize: bool = False,
+    rule_compiler: Optional[RuleCompiler] = None,
+) -> Tuple[List[Statement], Dict[str, str]]:
+    """
+    Given multiple rule inputs, generate the corresponding ASP statements, without rendering them.
 
-    keys = list(node_value.keys())
-    if len(keys) != 1:
-        return False
+    Nodes shared by several rules are only emitted once, unless the statements of every rule are kept (in the
+    translation cache or the rule statements).
 
-    key = keys[0]
-    if not isinstance(key, str):
-        return False
+    Rules found in the translation cache are not parsed again, so they are neither added to the node cache nor to the
+    root nodes.
 
-    try:
-        JsonLogicOps(key)
-    except ValueError:
-        return key in json_logic_node_keys
+    If a rule groups dictionary is provided, rules with identical definitions share a single ASP rule, identified by
+    a group id instead of the rule id, so it is only evaluated once. Matching group ids must then be fanned out to
+    their ASP rule ids with the filled dictionary.
 
-    return True
+    If parameterize is set, node rules comparing against constants are split into a generic rule shared by all rules
+    differing only in those constants, and a parameter fact with them (see `parameterize_asp_statement`).
 
+    :param rule_inputs: list of rule input objects to translate
+    :param custom_nodes: dictionary of node_key and corresponding class generating the node
+    :param rule_node_cache: optional node cache to reuse (and fill) while parsing the rules
+    :param rule_root_nodes: optional dictionary to fill with the parsed root node of every ASP rule id
+    :param translation_cache: optional cache of translated rules to reuse (and fill)
+    :param rule_statements: optional dictionary to fill with the statements of every ASP rule id, including its head
+    :param rule_groups: optional dictionary to fill with every group id and the ASP rule ids sharing its definition
+    :param parameterize: if True, compile rules differing only in their constants into a single generic rule
+    :param rule_compiler: optional compiler to reuse, replacing the custom nodes and the node cache
+    :return: tuple of ASP statements and mapping dictionary (ASP rule to original rule id)
+    """
+    if rule_compiler is None:
+        rule_compiler = RuleCompiler(custom_nodes=custom_nodes, node_cache=rule_node_cache)
+
+    mapping: Dict[str, str] = {}
+    statements = list(
+        __iter_multiple_rule_asp_statements(
+            rule_inputs=rule_inputs,
+            mapping=mapping,
+            rule_compiler=rule_compiler,
+            rule_root_nodes=rule_root_nodes,
+            translation_cache=translation_cache,
+            rule_statements=rule_statements,
+            rule_groups=rule_groups,
+            parameterize=parameterize,
+        )
+    )
 
-def __parse_json_logic_node(
-    node: Dict[str, Any], rule_node_cache: Dict[str, JsonLogicNode], custom_nodes: Dict[str, Type]
-) -> JsonLogicNode:
-    node_key, node_value = extract_key_and_value_from_node(node)
+    return statements, mapping
 
-    supported_nodes: Dict[Union[JsonLogicOps, str], Type] = {
-        **SUPPORTED_NODE_TYPES,  # type: ignore
-        **custom_nodes,
-    }
 
-    if node_key not in supported_nodes:
-        raise NotImplementedError(f"Node {node_key} is not yet implemented")
+def render_asp_statements(
+    statements: Iterable[Statement],
+    with_comments: bool = False,
+    scope_term: Optional[str] = None,
+    scope_guard: Optional[PredicateAtom] = None,
+) -> str:
+    """
+    Render ASP statements into an ASP definition, removing duplicated statements.
 
-    if isinstance(node_value, dict):
-        node_value = [node_value]
+    :param statements: statements to render
+    :param with_comments: whether to include ASP comments
+    :param scope_term: if provided, lift every predicate into this scope (see Statement.scoped)
+    :param scope_guard: optional atom added to every lifted statement body
+    :return: ASP definition
+    """
+    return "\n".join(__iter_asp_lines(statements, with_comments, scope_term=scope_term, scope_guard=scope_guard))
 
-    if isinstance(node_value, list):
-        node_value = [
-            __parse_json_logic_node(node, rule_node_cache, custom_nodes)
-            if __is_valid_json_logic_node(node, list(supported_nodes.keys()))
-            else node
-            for node in node_value
-        ]
 
-    node_generator = supported_nodes[node_key]
-    if isinstance(node_value, list):
-        jl_node = node_generator(*node_value)
-    else:
-        jl_node = node_generator(node_value)
+def write_multiple_rule_asp_definition(
+    rule_inputs: Iterable[RuleInput],
+    write: Callable[[str], Any],
+    with_comments: bool = False,
+    custom_nodes: Optional[Dict[str, Type]] = None,
+    rule_node_cache: Optional[Dict[str, JsonLogicNode]] = None,
+    translation_cache: Optional[TranslationCache] = None,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+    parameterize: bool = False,
+    rule_compiler: Optional[RuleCompiler] = None,
+) -> Dict[str, str]:
+    """
+    Given multiple rule inputs, stream the corresponding ASP definition into a sink, one line at a time.
 
-    return __get_or_update_cache(jl_node, rule_node_cache)
+    Statements are written while the rules are translated, without building the whole definition in memory. The sink
+    can be the `write` method of a text buffer or a file, or a function adding the lines to a Clingo program builder,
+    like `lambda line: ast.parse_string(line, builder.add)`.
+
+    :param rule_inputs: rule input objects to translate
+    :param write: function receiving every line of the ASP definition, including its line break
+    :param with_comments: whether to include ASP comments
+    :param custom_nodes: dictionary of node_key and corresponding class generating the node
+    :param rule_node_cache: optional node cache to reuse (and fill) while parsing the rules
+    :param translation_cache: optional cache of translated rules to reuse (and fill), see `TranslationCache`
+    :param rule_groups: optional dictionary to fill with every group id and the ASP rule ids sharing its definition
+    :param parameterize: if True, compile rules differing only in their constants into a single generic rule
+    :param rule_compiler: optional compiler to reuse, replacing the custom nodes and the node cache
+    :return: mapping dictionary (ASP rule to original rule id)
+    """
+    if rule_compiler is None:
+        rule_compiler = RuleCompiler(custom_nodes=custom_nodes, node_cache=rule_node_cache)
+
+    mapping: Dict[str, str] = {}
+    statements = __iter_multiple_rule_asp_statements(
+        rule_inputs=rule_inputs,
+        mapping=mapping,
+        rule_compiler=rule_compiler,
+        rule_root_nodes=None,
+        translation_cache=translation_cache,
+        rule_statements=None,
+        rule_groups=rule_groups,
+        parameterize=parameterize,
+    )
+    for line in __iter_asp_lines(statements, with_comments):
+        write(f"{line}\n")
+
+    return mapping
+
+
+def stream_multiple_rule_asp_definition(
+    rule_inputs: Iterable[RuleInput],
+    write: Callable[[str], Any],
+    write_mapping: Callable[[str, str], Any],
+    with_comments: bool = False,
+    custom_nodes: Optional[Dict[str, Type]] = None,
+    translation_cache: Optional[TranslationCache] = None,
+    parameterize: bool = False,
+    rule_compiler: Optional[RuleCompiler] = None,
+):
+    """
+    Given a stream of rule inputs, translate and write them one by one, keeping nothing for every rule.
+
+    Unlike `write_multiple_rule_asp_definition`, root statements and mapping entries are written along with the
+    statements of the following rules instead of at the end, so the memory used is bounded by the distinct nodes (kept
+    to skip the duplicated ones), not by the number of rules.
+
+    :param rule_inputs: rule input objects to translate, like a generator reading them from a file
+    :param write: function receiving every line of the ASP definition, including its line break
+    :param write_mapping: function receiving every ASP rule id and its original rule id
+    :param with_comments: whether to include ASP comments
+    :param custom_nodes: dictionary of node_key and corresponding class generating the node
+    :param translation_cache: optional cache of translated rules to reuse (and fill), see `TranslationCache`
+    :param parameterize: if True, compile rules differing only in their constants into a single generic rule
+    :param rule_compiler: optional compiler to reuse, replacing the custom nodes
+    """
+    if rule_compiler is None:
+        rule_compiler = RuleCompiler(custom_nodes=custom_nodes)
+
+    mapping: Dict[str, str] = {}
+    root_statements: List[Statement] = []
+
+    def flush_rules():
+        # Root statements are unique per rule, so they are written as they are without keeping their lines
+        for root_statement in root_statements:
+            if with_comments and root_statement.to_asp_comment():
+                write(f"{root_statement.to_asp_comment()}\n")
+            write(f"{root_statement.to_asp_statement()}\n")
+        for hashed_id, rule_id in mapping.items():
+            write_mapping(hashed_id, rule_id)
+        root_statements.clear()
+        mapping.clear()
+
+    statements = __iter_multiple_rule_asp_statements(
+        rule_inputs=rule_inputs,
+        mapping=mapping,
+        rule_compiler=rule_compiler,
+        rule_root_nodes=None,
+        translation_cache=translation_cache,
+        rule_statements=None,
+        rule_groups=None,
+        parameterize=parameterize,
+        root_statements=root_statements,
+    )
+    for line in __iter_asp_lines(statements, with_comments):
+        # Statements are pulled lazily, so the rules translated before this line are the ones pending to be written
+        flush_rules()
+        write(f"{line}\n")
+    flush_rules()
 
 
 def generate_multiple_rule_asp_definition(
     rule_inputs: List[RuleInput],
     with_comments: bool = False,
     custom_nodes: Optional[Dict[str, Type]] = None,
+    rule_node_cache: Optional[Dict[str, JsonLogicNode]] = None,
+    translation_cache: Optional[TranslationCache] = None,
+    rule_groups: Optional[Dict[str, List[str]]] = None,
+    parameterize: bool = False,
+    rule_compiler: Optional[RuleCompiler] = None,
+    workers: Optional[int] = None,
 ) -> Tuple[str, Dict[str, str]]:
     """
     Given multiple rule inputs, generate the corresponding ASP definition.
 
+    If more than one worker is requested, the rules are partitioned and translated across a pool of processes, and the
+    partial definitions are merged into the same definition a serial translation would generate. The node and
+    translation caches live in the calling process, so they cannot be used with workers, and only the custom nodes of
+    the rule compiler are used.
+
     :param rule_inputs: list of rule input objects to translate
     :param with_comments: whether to include ASP comments
     :param custom_nodes: dictionary of node_key and corresponding class generating the node
+    :param rule_node_cache: optional node cache to reuse (and fill) while parsing the rules
+    :param translation_cache: optional cache of translated rules to reuse (and fill), see `TranslationCache`
+    :param rule_groups: optional dictionary to fill with every group id and the ASP rule ids sharing its definition
+    :param parameterize: if True, compile rules differing only in their constants into a single generic rule
+    :param rule_compiler: optional compiler to reuse, replacing the custom nodes and the node cache
+    :param workers: optional number of worker processes to translate the rules with
     :return: tuple of ASP definition and mapping dictionary (ASP rule to original rule id)
     """
-    rule_node_cache: Dict[str, JsonLogicNode] = {}
-
-    statements = []
-    root_statements = []
-
-    mapping = {}
-
-    for rule_input in rule_inputs:
-        root_node = __parse_json_logic_node(
-            node=rule_input.rule_tree,
-            rule_node_cache=rule_node_cache,
-            custom_nodes=custom_nodes or {},
+    if workers is not None and workers > 1:
+        if rule_node_cache is not None or translation_cache is not None:
+            raise ValueError("Node and translation caches cannot be shared with worker processes")
+        return __translate_rule_inputs_in_parallel(
+            rule_inputs=rule_inputs,
+            workers=workers,
+            with_comments=with_comments,
+            custom_nodes=dict(rule_compiler.custom_nodes if rule_compiler is not None else custom_nodes or {}),
+            rule_groups=rule_groups,
+            parameterize=parameterize,
         )
-        statements.extend(root_node.to_asp(with_comment=with_comments))
-        # statements = root_node.to_asp()
 
-        hashed_id = generate_constant_string(rule_input.rule_id)
-        mapping[hashed_id] = rule_input.rule_id
-
-        root_statement = RuleStatement(
-            atom=PredicateAtom(predicate_name=PredicateNames.RULE, terms=[hashed_id]),
-            literals=[root_node.get_asp_atom()],
-            comment=rule_input.rule_id,
-        )
-        if with_comments:
-            root_statements.append(root_statement.to_asp_comment())
-        root_statements.append(root_statement.to_asp_statement())
-
-    statements = remove_duplicates(statements + root_statements)
+    if rule_compiler is None:
+        rule_compiler = RuleCompiler(custom_nodes=custom_nodes, node_cache=rule_node_cache)
+
+    mapping: Dict[str, str] = {}
+    statements = __iter_multiple_rule_asp_statements(
+        rule_inputs=rule_inputs,
+        mapping=mapping,
+        rule_compiler=rule_compiler,
+        rule_root_nodes=None,
+        translation_cache=translation_cache,
+        rule_statements=None,
+        rule_groups=rule_groups,
+        parameterize=parameterize,
+    )
 
-    return "\n".join(statements), mapping
+    return "\n".join(__iter_asp_lines(statements, with_comments)), mapping
 
 
 def generate_single_rule_asp_definition(
@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Type, Union
+
+from json_logic_asp.models.translator_dto import RuleInput
+from json_logic_asp.translator.rule_generator import stream_multiple_rule_asp_definition
+from json_logic_asp.translator.translation_cache import TranslationCache
+
+
+def iter_ndjson_rule_inputs(lines: Iterable[str]) -> Iterator[RuleInput]:
+    """
+    Lazily read rule inputs from NDJSON lines, each one a JSON object with the `rule_id` and the `rule_tree`.
+
+    Blank lines are skipped, so a file opened for reading can be given as it is.
+
+    :param lines: NDJSON lines, like an open file
+    :return: iterator of rule inputs
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        content = json.loads(line)
+        if not isinstance(content, dict) or "rule_tree" not in content:
+            raise ValueError(f"Line {line_number} is not a rule object with a rule_tree")
+        yield RuleInput(rule_tree=content["rule_tree"], rule_id=content.get("rule_id"))
+
+
+def compile_ndjson_rules(
+    rules_path: Union[str, Path],
+    asp_definition_path: Union[str, Path],
+    rule_id_mapping_path: Union[str, Path],
+    with_comments: bool = False,
+    custom_nodes: Optional[Dict[str, Type]] = None,
+    translation_cache: Optional[TranslationCache] = None,
+    parameterize: bool = False,
+) -> int:
+    """
+    Compile a NDJSON file of rules into an ASP definition file and a NDJSON file mapping its rule ids.
+
+    Rules are read, translated and written one by one (see `stream_multiple_rule_asp_definition`), so files larger
+    than the available memory can be compiled.
+
+    :param rules_path: NDJSON file with a rule object per line (see `iter_ndjson_rule_inputs`)
+    :param asp_definition_path: file path to write the ASP definition
+    :param rule_id_mapping_path: file path to write the mapping, an `asp_rule_id` and `rule_id` object per line
+    :param with_comments: whether to include ASP comments
+    :param custom_nodes: dictionary of node_key and corresponding class generating the node
+    :param translation_cache: optional cache of translated rules to reuse (and fill), see `TranslationCache`
+    :param parameterize: if True, compile rules differing only in their constants into a single generic rule
+    :return: number of compiled rules
+    """
+    compiled_rules = 0
+
+    with open(asp_definition_path, mode="w", encoding="utf-8") as asp_definition_file:
+        with open(rule_id_mapping_path, mode="w", encoding="utf-8") as rule_id_mapping_file:
+
+            def write_mapping(asp_rule_id: str, rule_id: str):
+                nonlocal compiled_rules
+                compiled_rules += 1
+                rule_id_mapping_file.write(json.dumps({"asp_rule_id": asp_rule_id, "rule_id": rule_id}) + "\n")
+
+            with open(rules_path, mode="r", encoding="utf-8") as rules_file:
+                stream_multiple_rule_asp_definition(
+                    rule_inputs=iter_ndjson_rule_inputs(rules_file),
+                    write=asp_definition_file.write,
+                    write_mapping=write_mapping,
+                    with_comments=with_comments,
+                    custom_nodes=custom_nodes,
+                    translation_cache=translation_cache,
+                    parameterize=parameterize,
+                )
+
+    return compiled_rules
+
+
+def load_ndjson_rule_id_mapping(rule_id_mapping_path: Union[str, Path]) -> Dict[str, str]:
+    """
+    Load a rule id mapping written by `compile_ndjson_rules`.
+    :param rule_id_mapping_path: NDJSON file with an `asp_rule_id` and `rule_id` object per line
+    :return: mapping dictionary (ASP rule to original rule id)
+    """
+    mapping: Dict[str, str] = {}
+    with open(rule_id_mapping_path, mode="r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+                mapping[entry["asp_rule_id"]] = entry["rule_id"]
+    return mapping
@@ -0,0 +1,129 @@
+from typing import List, Sequence, Set
+
+from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, Literal, MatchAtom, ParameterAtom, PredicateAtom
+from json_logic_asp.adapters.asp.asp_statements import ParameterFactStatement, RuleStatement
+from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
+from json_logic_asp.models.asp_base import Statement
+from json_logic_asp.utils.id_management import generate_content_id
+
+EQUALITY_COMPARATORS = ("=", "==")
+
+
+def __is_variable(term: str) -> bool:
+    return term[0] == "_" or term[0].isupper()
+
+
+def __get_variables(literals: Sequence[Literal]) -> Set[str]:
+    terms: List[str] = []
+    for literal in literals:
+        if isinstance(literal, PredicateAtom):
+            terms.extend(literal.terms)
+        elif isinstance(literal, ComparatorAtom):
+            terms.extend([literal.left_value, literal.right_value])
+    return {term for term in terms if __is_variable(term)}
+
+
+def parameterize_asp_statement(statement: Statement) -> List[Statement]:
+    """
+    Split a node rule comparing against constants into a generic rule and a parameter fact holding the constants.
+
+    The generic rule only depends on the node type and its data, so rules differing only in their constants (like
+    `{">": [{"var": "amount"}, N]}` for thousands of `N`) share a single generic rule, joined against a table of
+    parameter facts. Constants compared for equality or matched by the data, like `in` lists, are joined directly with
+    the data, so Clingo looks them up through the table index.
+
+    Statements without constants, or whose node id is used in their body, are returned unchanged.
+
+    :param statement: statement to parameterize
+    :return: list of statements, with the generic rule and the parameter fact if it was parameterized
+    """
+    if not isinstance(statement, RuleStatement) or len(statement.atom.terms) != 1 or statement.atom.negated:
+        return [statement]
+
+    node_id = statement.atom.terms[0]
+    if __is_variable(node_id):
+        return [statement]
+    if any(isinstance(literal, PredicateAtom) and node_id in literal.terms for literal in statement.literals):
+        return [statement]
+
+    constants: List[str] = []
+    parameter_terms: List[str] = []
+    literals: List[Literal] = []
+    generated_variables = {VariableNames.NODE.value}
+
+    def to_parameter(constant: str) -> str:
+        parameter = f"{VariableNames.PARAMETER.value}{len(constants) + 1}"
+        constants.append(constant)
+        parameter_terms.append(parameter)
+        generated_variables.add(parameter)
+        return parameter
+
+    for literal in statement.literals:
+        if isinstance(literal, MatchAtom):
+            # Matched constant: the parameter takes its place, so the table is joined on the data value
+            literals.append(
+                MatchAtom(
+                    predicate_name=literal.predicate_name,
+                    terms=[*literal.terms[:-1], to_parameter(literal.terms[-1])],
+                    variable_name=literal.variable_name,
+                    negated=literal.negated,
+                )
+            )
+            continue
+
+        if not isinstance(literal, ComparatorAtom):
+            literals.append(literal)
+            continue
+
+        left, right = literal.left_value, literal.right_value
+        if literal.comparator in EQUALITY_COMPARATORS and __is_variable(left) != __is_variable(right):
+            # Equal to a constant: the variable itself takes the parameter place, so the table is joined on its value
+            constants.append(right if __is_variable(left) else left)
+            parameter_terms.append(left if __is_variable(left) else right)
+            continue
+
+        literals.append(
+            ComparatorAtom(
+                left_value=left if __is_variable(left) else to_parameter(left),
+                comparator=literal.comparator,
+                right_value=right if __is_variable(right) else to_parameter(right),
+            )
+        )
+
+    if not constants or generated_variables & __get_variables(statement.literals):
+        return [statement]
+
+    atom = PredicateAtom(predicate_name=statement.atom.predicate_name, terms=[VariableNames.NODE])
+    # Rules of the same family render the same generic rule, so its content identifies the family
+    family_id = generate_content_id(
+        RuleStatement(
+            atom=atom,
+            literals=[PredicateAtom(predicate_name=PredicateNames.PARAMETER, terms=parameter_terms), *literals],
+        ).to_asp_statement()
+    )
+
+    return [
+        RuleStatement(
+            atom=atom,
+            literals=[
+                ParameterAtom(
+                    predicate_name=PredicateNames.PARAMETER,
+                    terms=[family_id, VariableNames.NODE, *parameter_terms],
+                ),
+                *literals,
+            ],
+        ),
+        ParameterFactStatement(
+            atom=ParameterAtom(predicate_name=PredicateNames.PARAMETER, terms=[family_id, node_id, *constants]),
+            comment=statement.comment,
+        ),
+    ]
+
+
+def parameterize_asp_statements(statements: List[Statement]) -> List[Statement]:
+    """
+    Parameterize every node rule comparing against constants, see `parameterize_asp_statement`.
+    :param statements: list of statements to parameterize
+    :return: list of statements, with generic rules and parameter facts replacing the parameterized ones
+    """
+    return [parameterized for statement in statements for parameterized in parameterize_asp_statement(statement)]
@@ -0,0 +1,235 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, Literal, MatchAtom, ParameterAtom, PredicateAtom
+from json_logic_asp.adapters.asp.asp_statements import FactStatement, RuleStatement
+from json_logic_asp.models.asp_base import Statement
+from json_logic_asp.utils.artifact_storage import get_library_version
+
+TranslatedRule = Tuple[Sequence[Statement], PredicateAtom]
+
+# Predicate atoms are stored by their exact class, as subclasses are handled differently when scoped and parameterized
+PREDICATE_ATOM_TYPES = {"predicate": PredicateAtom, "parameter": ParameterAtom}
+
+
+def __encode_literal(literal: Literal) -> List[Any]:
+    if type(literal) is MatchAtom:
+        return ["match", literal.predicate_name, list(literal.terms), literal.negated, literal.variable_name]
+    if type(literal) is ComparatorAtom:
+        return ["comparator", literal.left_value, literal.comparator, literal.right_value]
+    for literal_type, literal_class in PREDICATE_ATOM_TYPES.items():
+        if type(literal) is literal_class:
+            return [literal_type, literal.predicate_name, list(literal.terms), literal.negated]
+    raise ValueError(f"{literal.__class__.__name__} cannot be stored")
+
+
+def __decode_literal(content: List[Any]) -> Literal:
+    literal_type, *values = content
+    if literal_type == "match":
+        predicate_name, terms, negated, variable_name = values
+        return MatchAtom(predicate_name=predicate_name, terms=terms, variable_name=variable_name, negated=negated)
+    if literal_type == "comparator":
+        left_value, comparator, right_value = values
+        return ComparatorAtom(left_value=left_value, comparator=comparator, right_value=right_value)
+    if literal_type in PREDICATE_ATOM_TYPES:
+        predicate_name, terms, negated = values
+        return PREDICATE_ATOM_TYPES[literal_type](predicate_name=predicate_name, terms=terms, negated=negated)
+    raise ValueError(f"Unknown stored literal type {literal_type}")
+
+
+def __decode_atom(content: List[Any]) -> PredicateAtom:
+    atom = __decode_literal(content)
+    if not isinstance(atom, PredicateAtom):
+        raise ValueError(f"Stored {atom.__class__.__name__} is not an atom")
+    return atom
+
+
+def __encode_statement(statement: Statement) -> List[Any]:
+    if type(statement) is RuleStatement:
+        literals = [__encode_literal(literal) for literal in statement.literals]
+        return ["rule", __encode_literal(statement.atom), literals, statement.comment]
+    if type(statement) is FactStatement:
+        return ["fact", __encode_literal(statement.atom), statement.comment]
+    raise ValueError(f"{statement.__class__.__name__} cannot be stored")
+
+
+def __decode_statement(content: List[Any]) -> Statement:
+    statement_type, *values = content
+    if statement_type == "rule":
+        atom, literals, comment = values
+        return RuleStatement(
+            atom=__decode_atom(atom),
+            literals=[__decode_literal(literal) for literal in literals],
+            comment=comment,
+        )
+    if statement_type == "fact":
+        atom, comment = values
+        return FactStatement(atom=__decode_atom(atom), comment=comment)
+    raise ValueError(f"Unknown stored statement type {statement_type}")
+
+
+def encode_translated_rule(translated_rule: TranslatedRule) -> str:
+    """
+    Encode a translated rule as JSON, to be stored without executing any code when loaded back.
+
+    Only the statements and literals of this library can be encoded, custom statement or literal classes raise.
+
+    :param translated_rule: tuple of the rule statements and its root atom
+    :return: JSON document
+    """
+    statements, root_atom = translated_rule
+    return json.dumps(
+        [[__encode_statement(statement) for statement in statements], __encode_literal(root_atom)],
+        separators=(",", ":"),
+    )
+
+
+def decode_translated_rule(content: Union[str, bytes]) -> TranslatedRule:
+    """
+    Decode a translated rule encoded by `encode_translated_rule`.
+    :param content: JSON document
+    :return: tuple of the rule statements and its root atom
+    """
+    statements, root_atom = json.loads(content)
+    return [__decode_statement(statement) for statement in statements], __decode_atom(root_atom)
+
+
+class TranslationCache:
+    """
+    Cache of translated rules, keyed by a canonical hash of the rule tree and the custom nodes, so rules submitted
+    repeatedly are only translated once.
+
+    Entries are kept in memory with least recently used eviction, and optionally persisted in a SQLite file shared
+    across processes. The file stores the statements as JSON, so loading it never executes code. Rules translated into
+    statements or literals defined outside this library are only kept in memory.
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, path: Optional[Union[str, Path]] = None):
+        """
+        :param max_size: maximum number of translated rules kept in memory
+        :param path: optional SQLite file path, to persist the translated rules
+        """
+        if max_size < 1:
+            raise ValueError("Cache max size must be greater than zero")
+
+        self.__max_size = max_size
+        self.__entries: "OrderedDict[str, TranslatedRule]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        self.__connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self.__connection = sqlite3.connect(str(path), check_same_thread=False)
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, value BLOB)")
+            self.__connection.commit()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @staticmethod
+    def generate_key(rule_tree: Any, custom_nodes: Optional[Mapping[str, Type]] = None) -> str:
+        """
+        Generate the canonical hash of a rule tree, stable across runs and key ordering.
+        :param rule_tree: JSON Logic definition of the rule
+        :param custom_nodes: dictionary of node_key and corresponding class generating the node
+        :return: hexadecimal SHA-256 digest
+        """
+        content = json.dumps(
+            [
+                get_library_version(),
+                sorted(
+                    [node_key, f"{node_class.__module__}.{node_class.__qualname__}"]
+                    for node_key, node_class in (custom_nodes or {}).items()
+                ),
+                rule_tree,
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[TranslatedRule]:
+        """
+        Get a translated rule, looking in memory first and then in the persistent store.
+        :param key: canonical hash of the rule, see `generate_key`
+        :return: tuple of the rule statements and its root atom, or None if it was not translated yet
+        """
+        with self.__lock:
+            translated_rule = self.__entries.get(key)
+            if translated_rule is None and self.__connection is not None:
+                row = self.__connection.execute("SELECT value FROM translations WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    try:
+                        translated_rule = decode_translated_rule(row[0])
+                    except (ValueError, TypeError):
+                        # Entries written by other versions, or not by this cache, are translated again
+                        translated_rule = None
+                    if translated_rule is not None:
+                        self.__store_in_memory(key, translated_rule)
+
+            if translated_rule is None:
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return translated_rule
+
+    def put(self, key: str, translated_rule: TranslatedRule):
+        """
+        Store a translated rule, in memory and in the persistent store. Stored rules are only persisted after `flush`.
+        :param key: canonical hash of the rule, see `generate_key`
+        :param translated_rule: tuple of the rule statements and its root atom
+        """
+        with self.__lock:
+            self.__store_in_memory(key, translated_rule)
+            if self.__connection is not None:
+                try:
+                    content = encode_translated_rule(translated_rule)
+                except ValueError:
+                    return
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO translations (key, value) VALUES (?, ?)", (key, content)
+                )
+
+    def __store_in_memory(self, key: str, translated_rule: TranslatedRule):
+        self.__entries[key] = translated_rule
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    def flush(self):
+        """
+        Persist the stored rules, committing them to the persistent store in a single transaction.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.commit()
+
+    def clear(self):
+        """
+        Remove every translated rule from memory, and reset the counters. The persistent store is kept.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        """
+        Persist the stored rules and close the persistent store, if any. Entries in memory are still available.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.commit()
+                self.__connection.close()
+                self.__connection = None
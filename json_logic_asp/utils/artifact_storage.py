@@ -0,0 +1,155 @@
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Iterator, List, Tuple, Union
+
+from json_logic_asp.models.rule_set_artifact import RuleSetArtifact
+from json_logic_asp.models.translator_dto import RuleInput
+
+# Bumped whenever the layout of the stored artifacts changes
+ARTIFACT_FORMAT_VERSION = 4
+
+
+@lru_cache(maxsize=None)
+def get_library_version() -> str:
+    # Looking up the installed distribution scans the import paths, so it is only done once
+    try:
+        return version("json-logic-asp")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def __iter_json_chunks(value: Any) -> Iterator[str]:
+    # Same output as `json.dumps(value, sort_keys=True, separators=(",", ":"))`, but walked with an explicit stack, so
+    # deeply nested rules never hit the recursion limit. Every entry is either an already encoded chunk or a value.
+    pending: List[Tuple[bool, Any]] = [(False, value)]
+    while pending:
+        is_chunk, current = pending.pop()
+        if is_chunk:
+            yield current
+        elif isinstance(current, dict):
+            items = sorted(current.items(), key=lambda item: item[0])
+            pending.append((True, "}"))
+            for index in range(len(items) - 1, -1, -1):
+                key, item = items[index]
+                pending.append((False, item))
+                pending.append((True, f"{',' if index else ''}{json.dumps(key)}:"))
+            pending.append((True, "{"))
+        elif isinstance(current, (list, tuple)):
+            pending.append((True, "]"))
+            for index in range(len(current) - 1, -1, -1):
+                pending.append((False, current[index]))
+                if index:
+                    pending.append((True, ","))
+            pending.append((True, "["))
+        else:
+            yield json.dumps(current)
+
+
+def generate_rule_input_content_hash(rule_input: RuleInput) -> str:
+    """
+    Generate a hash of a single rule input content, stable across runs and key ordering.
+    :param rule_input: rule input with JSON Logic definition
+    :return: hexadecimal SHA-256 digest
+    """
+    content = "".join(__iter_json_chunks([rule_input.rule_id, rule_input.rule_tree]))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def combine_rule_input_content_hashes(rule_input_hashes: List[str], simplify: bool = False) -> str:
+    """
+    Combine the hashes of every rule input, in order, into the hash of the whole rule inputs content.
+    :param rule_input_hashes: list of hashes generated with `generate_rule_input_content_hash`
+    :param simplify: whether the rules are simplified before translating them
+    :return: hexadecimal SHA-256 digest
+    """
+    return hashlib.sha256(f"{simplify}:{','.join(rule_input_hashes)}".encode()).hexdigest()
+
+
+def generate_rule_inputs_content_hash(rule_inputs: List[RuleInput], simplify: bool = False) -> str:
+    """
+    Generate a hash of the rule inputs content, stable across runs, to identify what a rule set was compiled from.
+    :param rule_inputs: list of rule input with JSON Logic definitions
+    :param simplify: whether the rules are simplified before translating them
+    :return: hexadecimal SHA-256 digest
+    """
+    return combine_rule_input_content_hashes(
+        [generate_rule_input_content_hash(rule_input) for rule_input in rule_inputs], simplify=simplify
+    )
+
+
+def __serialize_rule_inputs(rule_inputs: List[RuleInput]) -> List[List[Any]]:
+    return [[rule_input.rule_id, rule_input.rule_tree] for rule_input in rule_inputs]
+
+
+def __deserialize_rule_inputs(content: List[List[Any]]) -> List[RuleInput]:
+    return [RuleInput(rule_id=rule_id, rule_tree=rule_tree) for rule_id, rule_tree in content]
+
+
+def save_rule_set_artifact(artifact: RuleSetArtifact, path: Union[str, Path]):
+    """
+    Store a compiled rule set artifact as compressed JSON, tagged with the format and library versions.
+    :param artifact: compiled rule set artifact
+    :param path: file path to write
+    """
+    content = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "library_version": get_library_version(),
+        "content_hash": artifact.content_hash,
+        "stratified": artifact.stratified,
+        "simplify": artifact.simplify,
+        "parameterize": artifact.parameterize,
+        "rule_inputs": __serialize_rule_inputs(artifact.rule_inputs),
+        "source_rule_inputs": (
+            __serialize_rule_inputs(artifact.source_rule_inputs) if artifact.source_rule_inputs is not None else None
+        ),
+        "rule_id_mapping": artifact.rule_id_mapping,
+        "rule_groups": artifact.rule_groups,
+        "asp_definition": artifact.asp_definition,
+        "scoped_asp_definition": artifact.scoped_asp_definition,
+        "multi_shot_asp_definition": artifact.multi_shot_asp_definition,
+    }
+
+    with gzip.open(path, mode="wt", encoding="utf-8", compresslevel=6) as file:
+        json.dump(content, file, separators=(",", ":"))
+
+
+def load_rule_set_artifact(path: Union[str, Path]) -> RuleSetArtifact:
+    """
+    Load a compiled rule set artifact, checking it was stored by the same format and library versions.
+    :param path: file path to read
+    :return: compiled rule set artifact
+    """
+    with gzip.open(path, mode="rt", encoding="utf-8") as file:
+        content = json.load(file)
+
+    if content.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported artifact format version {content.get('format_version')}, expected {ARTIFACT_FORMAT_VERSION}"
+        )
+    if content.get("library_version") != get_library_version():
+        raise ValueError(
+            f"Artifact was compiled with json-logic-asp {content.get('library_version')}, "
+            f"current version is {get_library_version()}"
+        )
+
+    return RuleSetArtifact(
+        content_hash=content["content_hash"],
+        rule_inputs=__deserialize_rule_inputs(content["rule_inputs"]),
+        rule_id_mapping=content["rule_id_mapping"],
+        rule_groups=content["rule_groups"],
+        stratified=content["stratified"],
+        asp_definition=content["asp_definition"],
+        scoped_asp_definition=content["scoped_asp_definition"],
+        multi_shot_asp_definition=content["multi_shot_asp_definition"],
+        simplify=content["simplify"],
+        parameterize=content["parameterize"],
+        source_rule_inputs=(
+            __deserialize_rule_inputs(content["source_rule_inputs"])
+            if content["source_rule_inputs"] is not None
+            else None
+        ),
+    )
@@ -3,7 +3,13 @@ from typing import Callable
 
 from cuid2 import cuid_wrapper
 
+
+def __generate_md5_content_id(content: str) -> str:
+    return f"n{hashlib.md5(content.encode()).hexdigest()}"  # nosec B303 B324
+
+
 cuid_generator: Callable[[], str] = cuid_wrapper()
+content_id_generator: Callable[[str], str] = __generate_md5_content_id
 
 
 def generate_unique_id() -> str:
@@ -12,3 +18,12 @@ def generate_unique_id() -> str:
 
 def generate_constant_string(s: str) -> str:
     return f"s{hashlib.md5(s.encode()).hexdigest()}"  # nosec B303 B324
+
+
+def generate_content_id(content: str) -> str:
+    """
+    Generate an id derived from the given content, so the same content gets the same id across runs and machines.
+    :param content: canonical description of the identified element
+    :return: id usable as an ASP constant
+    """
+    return content_id_generator(content)
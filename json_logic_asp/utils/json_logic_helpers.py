@@ -1,7 +1,11 @@
-from typing import Dict, Union
+from typing import Any, Dict, Tuple, Union
 
 from json_logic_asp.utils.id_management import generate_constant_string
 
+# Native representation of an ASP term: (0, number) for numbers and (1, name) for constants. Tuples compare the same way
+# Clingo compares the symbols: numbers before constants, and constants in lexicographical order of their names.
+EncodedValue = Tuple[int, Union[int, str]]
+
 
 def extract_key_and_value_from_node(node: Dict):
     node_key = list(node.keys())[0]
@@ -24,3 +28,12 @@ def value_encoder(val: Union[str, int, float, bool]) -> str:
         val = str(val)
 
     return val
+
+
+def native_value_encoder(val: Any) -> EncodedValue:
+    encoded_val = value_encoder(val)
+
+    try:
+        return 0, int(encoded_val)
+    except ValueError:
+        return 1, encoded_val
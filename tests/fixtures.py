@@ -17,3 +17,18 @@ def cuid_fixture():
     with patch("json_logic_asp.utils.id_management.cuid_generator") as _fixture:
         _fixture.side_effect = MockedCuidGenerator()
         yield _fixture
+
+
+class MockedContentIdGenerator:
+    def __init__(self):
+        self.content_ids = {}
+
+    def __call__(self, content, *args, **kwargs):
+        return self.content_ids.setdefault(content, f"mock{len(self.content_ids) + 1}")
+
+
+@pytest.fixture(autouse=True)
+def content_id_fixture():
+    with patch("json_logic_asp.utils.id_management.content_id_generator") as _fixture:
+        _fixture.side_effect = MockedContentIdGenerator()
+        yield _fixture
@@ -1,6 +1,6 @@
 import pytest
 
-from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, PredicateAtom
+from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, MatchAtom, ParameterAtom, PredicateAtom
 from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
 
 
@@ -40,6 +40,10 @@ class TestPredicateAtom:
         )
         assert atom.to_asp_atom() == expected
 
+    def test_memoized_atom(self):
+        atom = PredicateAtom(predicate_name="test", terms=["a"])
+        assert atom.to_asp_atom() is atom.to_asp_atom()
+
     def test_enum_predicate(self):
         atom = PredicateAtom(
             predicate_name=PredicateNames.DATA_VAR,
@@ -47,6 +51,39 @@ class TestPredicateAtom:
         )
         assert atom.to_asp_atom() == "var(a)"
 
+    def test_scoped(self):
+        atom = PredicateAtom(
+            predicate_name="test",
+            terms=["a", VariableNames.ANY],
+            negated=True,
+        )
+        scoped = atom.scoped("s")
+        assert scoped.to_asp_atom() == "not test(s, a, _)"
+        assert atom.to_asp_atom() == "not test(a, _)"
+
+
+class TestParameterAtom:
+    def test_scoped(self):
+        atom = ParameterAtom(predicate_name=PredicateNames.PARAMETER, terms=["f", "n", "1"])
+        assert atom.to_asp_atom() == "param(f, n, 1)"
+        assert atom.scoped("s") is atom
+
+
+class TestMatchAtom:
+    def test_scoped(self):
+        atom = MatchAtom(predicate_name="var", terms=["s_a", "(1;2)"], variable_name="I", negated=True)
+        scoped = atom.scoped("r")
+        assert isinstance(scoped, MatchAtom)
+        assert scoped.to_asp_atom() == "not var(r, s_a, (1;2))"
+        assert scoped.variable_name == "I"
+
+    def test_to_join_literals(self):
+        atom = MatchAtom(predicate_name="var", terms=["s_a", "(1;2)"], variable_name="I")
+        assert [literal.to_asp_atom() for literal in atom.to_join_literals()] == ["var(s_a, I)", "I = (1;2)"]
+
+        atom = MatchAtom(predicate_name="var", terms=["s_a", "P1"], variable_name="I")
+        assert atom.to_join_literals() == [atom]
+
 
 class TestComparatorAtom:
     @pytest.mark.parametrize(
@@ -94,3 +131,11 @@ class TestComparatorAtom:
             right_value="V2",
         )
         assert atom.to_asp_atom() == expected
+
+    def test_scoped(self):
+        atom = ComparatorAtom(
+            left_value="V1",
+            comparator="<",
+            right_value="V2",
+        )
+        assert atom.scoped("s") is atom
@@ -1,5 +1,13 @@
-from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
-from json_logic_asp.adapters.asp.asp_statements import DirectiveStatement, FactStatement, RuleStatement, ShowStatement
+import pytest
+
+from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, MatchAtom, ParameterAtom, PredicateAtom
+from json_logic_asp.adapters.asp.asp_statements import (
+    DirectiveStatement,
+    FactStatement,
+    ParameterFactStatement,
+    RuleStatement,
+    ShowStatement,
+)
 from json_logic_asp.constants.asp_naming import PredicateNames
 
 
@@ -9,6 +17,27 @@ class TestFactStatement:
         stmt = FactStatement(atom=atom)
         assert stmt.to_asp_statement() == "test(a)."
 
+    def test_scoped(self):
+        atom = PredicateAtom(predicate_name="test", terms=["a"])
+        stmt = FactStatement(atom=atom, comment="c")
+        assert stmt.scoped("s").to_asp_statement() == "test(s, a)."
+        assert stmt.scoped("s").to_asp_comment() == "% c"
+
+    def test_scoped_guard(self):
+        atom = PredicateAtom(predicate_name="test", terms=["a"])
+        stmt = FactStatement(atom=atom)
+        guard = PredicateAtom(predicate_name="active", terms=["s"])
+        assert stmt.scoped("s", guard).to_asp_statement() == "test(s, a) :- active(s)."
+
+
+class TestParameterFactStatement:
+    def test_scoped(self):
+        stmt = ParameterFactStatement(atom=ParameterAtom(predicate_name="param", terms=["f", "n", "1"]))
+        guard = PredicateAtom(predicate_name="active", terms=["s"])
+        assert stmt.to_asp_statement() == "param(f, n, 1)."
+        assert stmt.scoped("s") is stmt
+        assert stmt.scoped("s", guard) is stmt
+
 
 class TestRuleStatement:
     def test_statement_single_literal(self):
@@ -24,6 +53,28 @@ class TestRuleStatement:
         stmt = RuleStatement(atom=atom, literals=[literal1, literal2])
         assert stmt.to_asp_statement() == "test(a) :- test2(b), test3(c)."
 
+    def test_memoized_statement(self):
+        atom = PredicateAtom(predicate_name="test", terms=["a"])
+        stmt = RuleStatement(atom=atom, literals=[PredicateAtom(predicate_name="test2", terms=["b"])])
+        assert stmt.to_asp_statement() is stmt.to_asp_statement()
+
+    def test_scoped(self):
+        atom = PredicateAtom(predicate_name="test", terms=["a"])
+        literal1 = PredicateAtom(predicate_name="test2", terms=["b", "V"], negated=True)
+        literal2 = ComparatorAtom(left_value="V", comparator="<", right_value="1")
+        stmt = RuleStatement(atom=atom, literals=[literal1, literal2])
+        assert stmt.scoped("S").to_asp_statement() == "test(S, a) :- not test2(S, b, V), V < 1."
+
+        guard = PredicateAtom(predicate_name="record", terms=["S"])
+        assert stmt.scoped("S", guard).to_asp_statement() == "test(S, a) :- record(S), not test2(S, b, V), V < 1."
+
+    def test_scoped_match(self):
+        atom = PredicateAtom(predicate_name="test", terms=["a"])
+        literal = MatchAtom(predicate_name="test2", terms=["b", "c"], variable_name="V")
+        stmt = RuleStatement(atom=atom, literals=[literal])
+        assert stmt.scoped("s").to_asp_statement() == "test(s, a) :- test2(s, b, c)."
+        assert stmt.scoped("S").to_asp_statement() == "test(S, a) :- test2(S, b, V), V = c."
+
 
 class TestDirectiveStatement:
     def test_statement(self):
@@ -34,6 +85,12 @@ class TestDirectiveStatement:
         stmt = DirectiveStatement(action="show", statement="rule/1")
         assert stmt.to_asp_comment() is None
 
+    def test_scoped(self):
+        stmt = DirectiveStatement(action="show", statement="rule/1")
+        with pytest.raises(NotImplementedError) as exc:
+            stmt.scoped("s")
+        assert exc.match("DirectiveStatement cannot be scoped")
+
 
 class TestShowStatement:
     def test_statement(self):
@@ -43,3 +100,7 @@ class TestShowStatement:
     def test_statement_enum(self):
         stmt = ShowStatement(predicate=PredicateNames.RULE, length=1)
         assert stmt.to_asp_statement() == "#show rule/1."
+
+    def test_scoped(self):
+        stmt = ShowStatement(predicate=PredicateNames.RULE, length=1)
+        assert stmt.scoped("s").to_asp_statement() == "#show rule/2."
@@ -1 +1 @@
-from tests.fixtures import cuid_fixture  # noqa
+from tests.fixtures import content_id_fixture, cuid_fixture  # noqa
@@ -54,9 +54,9 @@ class TestArrayMergeNode:
             # Then var
             "% Merge VAR(var)",
             "merge(mock3, M) :- var(sb2145aac704ce76dbe1ac7adac535b23, M).",
-            # And then the primitives
-            "% Merge (str, 123, str2)",
-            "merge(mock3, M) :- M = (s341be97d9aff90c9978347f66f945b77;123;s6dc84905d6df841d6f19153bd593e213).",
+            # And then the primitives, sorted by type and value
+            "% Merge (123, str, str2)",
+            "merge(mock3, M) :- M = (123;s341be97d9aff90c9978347f66f945b77;s6dc84905d6df841d6f19153bd593e213).",
         ]
 
     def test_str(self):
@@ -70,7 +70,7 @@ class TestArrayMergeNode:
         node3 = ArrayMergeNode("merged1", data, "merged3")
 
         child_nodes = sorted([hash("merged1"), hash(data), hash("merged2")])
-        assert hash(node) == hash(("merge", tuple(child_nodes))) == hash(node2) != hash(node3)
+        assert hash(node) == hash(("merge", hash(tuple(child_nodes)))) == hash(node2) != hash(node3)
 
 
 class TestArrayInNode:
@@ -127,7 +127,7 @@ class TestArrayInNode:
 
         assert node.list_node == merge
         assert node.data_node == data_var
-        assert node.child_nodes == [merge, data_var]
+        assert node.child_nodes == [data_var, merge]
 
     def test_statements_list(self):
         data_var = DataVarNode("data_var")
@@ -135,9 +135,9 @@ class TestArrayInNode:
         node = ArrayInNode(data_list, data_var)
 
         assert node.to_asp(with_comment=True) == [
-            "% data_var IN (a, b, 123, c)",
-            "in(mock2) :- var(s38bb977078c0e5ba5b0b759cf506cc4c, I), I = (s0cc175b9c0f1b6a831c399e269772661;"
-            "s92eb5ffee6ae2fec3ad71c777531578f;123;s4a8a08f09d37b73795649038408b5f33).",
+            "% data_var IN (123, a, b, c)",
+            "in(mock2) :- var(s38bb977078c0e5ba5b0b759cf506cc4c, (123;s0cc175b9c0f1b6a831c399e269772661;"
+            "s92eb5ffee6ae2fec3ad71c777531578f;s4a8a08f09d37b73795649038408b5f33)).",
         ]
 
     def test_statements_node(self):
@@ -147,9 +147,9 @@ class TestArrayInNode:
 
         assert node.to_asp(with_comment=True) == [
             "% Merge (a)",
-            "merge(mock1, M) :- M = (s0cc175b9c0f1b6a831c399e269772661).",
-            "% data_var IN (MERGE(mock1))",
-            "in(mock3) :- var(s38bb977078c0e5ba5b0b759cf506cc4c, I), merge(mock1, I).",
+            "merge(mock2, M) :- M = (s0cc175b9c0f1b6a831c399e269772661).",
+            "% data_var IN (MERGE(mock2))",
+            "in(mock3) :- var(s38bb977078c0e5ba5b0b759cf506cc4c, I), merge(mock2, I).",
         ]
 
     def test_str(self):
@@ -167,6 +167,17 @@ class TestArrayInNode:
         assert hash(node1) == hash(("in", hash(data_var), hash(tuple(sorted(data_list))))) == hash(node2)
         assert node1 == node2 != node3
 
+    def test_hash_list_mixed_types(self):
+        data_var = DataVarNode("var")
+        data_list = ["a", 1, True]
+        node1 = ArrayInNode(data_list, data_var)
+        node2 = ArrayInNode(data_var, [True, "a", 1])
+
+        assert node1 == node2
+        assert node1.node_id == node2.node_id
+        # The rule list is left as it was given
+        assert data_list == ["a", 1, True]
+
     def test_hash_node(self):
         data_var = DataVarNode("var")
         data_node = ArrayMergeNode("a", "b", "c")
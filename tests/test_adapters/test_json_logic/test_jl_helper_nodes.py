@@ -38,6 +38,10 @@ class TestJsonLogicHelperBoolNode:
         node = JsonLogicHelperBoolNode(False)
         assert node.get_asp_statements() == []
 
+    def test_evaluate(self):
+        assert JsonLogicHelperBoolNode(True).evaluate({}) is True
+        assert JsonLogicHelperBoolNode(False).evaluate({}) is False
+
     def test_str(self):
         node = JsonLogicHelperBoolNode(True)
         assert str(node) == "BOOL(true)"
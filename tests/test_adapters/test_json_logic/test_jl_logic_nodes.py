@@ -57,7 +57,6 @@ class TestLogicIfNode:
         assert node.to_asp(with_comment=True) == [
             "% a EQ b",
             "eq(mock1) :- s0cc175b9c0f1b6a831c399e269772661 == s92eb5ffee6ae2fec3ad71c777531578f.",
-            "bool(true).",
             "if(mock2) :- eq(mock1).",
         ]
 
@@ -73,7 +72,6 @@ class TestLogicIfNode:
         node = LogicIfNode(False)
 
         assert node.to_asp(with_comment=True) == [
-            "bool(true).",
             "if(mock1) :- bool(false).",
         ]
 
@@ -87,7 +85,6 @@ class TestLogicIfNode:
             "eq(mock1) :- s0cc175b9c0f1b6a831c399e269772661 == s92eb5ffee6ae2fec3ad71c777531578f.",
             "% 3 GT 1",
             "gt(mock2) :- 3 > 1.",
-            "bool(true).",
             "if(mock3) :- eq(mock1), gt(mock2).",
         ]
 
@@ -109,7 +106,6 @@ class TestLogicIfNode:
         assert node.to_asp(with_comment=True) == [
             "% 3 GT 1",
             "gt(mock1) :- 3 > 1.",
-            "bool(true).",
             "if(mock2) :- bool(false), gt(mock1).",
         ]
 
@@ -131,7 +127,6 @@ class TestLogicIfNode:
         assert node.to_asp(with_comment=True) == [
             "% 3 GT 1",
             "gt(mock1) :- 3 > 1.",
-            "bool(true).",
             "if(mock2) :- gt(mock1), bool(false).",
         ]
 
@@ -148,9 +143,8 @@ class TestLogicIfNode:
             "gt(mock2) :- 3 > 1.",
             "% 4 LT 3",
             "lt(mock3) :- 4 < 3.",
-            "bool(true).",
-            "else(mock5) :- not eq(mock1), lt(mock3).",
-            "if(mock4) :- else(mock5).",
+            "else(mock5) :- lt(mock3).",
+            "if(mock4) :- not eq(mock1), else(mock5).",
             "if(mock4) :- eq(mock1), gt(mock2).",
         ]
 
@@ -165,8 +159,8 @@ class TestLogicIfNode:
             "% 4 LT 3",
             "lt(mock2) :- 4 < 3.",
             "bool(true).",
-            "else(mock5) :- not bool(true), lt(mock2).",
-            "if(mock3) :- else(mock5).",
+            "else(mock4) :- lt(mock2).",
+            "if(mock3) :- not bool(true), else(mock4).",
             "if(mock3) :- bool(true), gt(mock1).",
         ]
 
@@ -180,12 +174,21 @@ class TestLogicIfNode:
             "gt(mock1) :- 3 > 1.",
             "% 4 LT 3",
             "lt(mock2) :- 4 < 3.",
-            "bool(true).",
-            "else(mock5) :- not bool(false), lt(mock2).",
-            "if(mock3) :- else(mock5).",
+            "else(mock4) :- lt(mock2).",
+            "if(mock3) :- not bool(false), else(mock4).",
             "if(mock3) :- bool(false), gt(mock1).",
         ]
 
+    def test_statements_if_var_cond_else(self):
+        node = LogicIfNode(DataVarNode("a"), DataVarNode("b"), DataVarNode("c"))
+
+        # Data nodes only need to be present, so they never share a variable and negating them keeps the rule safe
+        assert [stmt for stmt in node.to_asp() if stmt.startswith(("if(", "else("))] == [
+            "else(mock5) :- var(s4a8a08f09d37b73795649038408b5f33, _).",
+            "if(mock4) :- not var(s0cc175b9c0f1b6a831c399e269772661, _), else(mock5).",
+            "if(mock4) :- var(s0cc175b9c0f1b6a831c399e269772661, _), var(s92eb5ffee6ae2fec3ad71c777531578f, _).",
+        ]
+
     def test_statements_if_cond_else_true(self):
         eq = LogicEqualNode("a", "b")
         gt = LogicGreaterThanNode(3, 1)
@@ -197,8 +200,8 @@ class TestLogicIfNode:
             "% 3 GT 1",
             "gt(mock2) :- 3 > 1.",
             "bool(true).",
-            "else(mock5) :- not eq(mock1), bool(true).",
-            "if(mock3) :- else(mock5).",
+            "else(mock4) :- bool(true).",
+            "if(mock3) :- not eq(mock1), else(mock4).",
             "if(mock3) :- eq(mock1), gt(mock2).",
         ]
 
@@ -218,9 +221,8 @@ class TestLogicIfNode:
             "eq(mock3) :- s693a9fdd4c2fd0700968fba0d07ff3c0 == sfbfba2e45c2045dc5cab22a5afe83d9d.",
             "% 30 GT 10",
             "gt(mock4) :- 30 > 10.",
-            "bool(true).",
-            "elif(mock6) :- not eq(mock1), eq(mock3), gt(mock4).",
-            "if(mock5) :- elif(mock6).",
+            "elif(mock6) :- eq(mock3), gt(mock4).",
+            "if(mock5) :- not eq(mock1), elif(mock6).",
             "if(mock5) :- eq(mock1), gt(mock2).",
         ]
 
@@ -243,11 +245,10 @@ class TestLogicIfNode:
             "gt(mock4) :- 30 > 10.",
             "% 4 LT 3",
             "lt(mock5) :- 4 < 3.",
-            "bool(true).",
-            "else(mock8) :- not eq(mock1), not eq(mock3), lt(mock5).",
-            "elif(mock7) :- else(mock8).",
-            "elif(mock7) :- not eq(mock1), eq(mock3), gt(mock4).",
-            "if(mock6) :- elif(mock7).",
+            "else(mock8) :- lt(mock5).",
+            "elif(mock7) :- not eq(mock3), else(mock8).",
+            "elif(mock7) :- eq(mock3), gt(mock4).",
+            "if(mock6) :- not eq(mock1), elif(mock7).",
             "if(mock6) :- eq(mock1), gt(mock2).",
         ]
 
@@ -273,11 +274,10 @@ class TestLogicIfNode:
             "eq(mock5) :- s9d607a663f3e9b0a90c3c8d4426640dc == s7a6f150b83091ce20c89368641f9a137.",
             "% 300 GT 100",
             "gt(mock6) :- 300 > 100.",
-            "bool(true).",
-            "elif(mock9) :- not eq(mock1), not eq(mock3), eq(mock5), gt(mock6).",
-            "elif(mock8) :- elif(mock9).",
-            "elif(mock8) :- not eq(mock1), eq(mock3), gt(mock4).",
-            "if(mock7) :- elif(mock8).",
+            "elif(mock9) :- eq(mock5), gt(mock6).",
+            "elif(mock8) :- not eq(mock3), elif(mock9).",
+            "elif(mock8) :- eq(mock3), gt(mock4).",
+            "if(mock7) :- not eq(mock1), elif(mock8).",
             "if(mock7) :- eq(mock1), gt(mock2).",
         ]
 
@@ -306,13 +306,12 @@ class TestLogicIfNode:
             "gt(mock6) :- 300 > 100.",
             "% 4 LT 3",
             "lt(mock7) :- 4 < 3.",
-            "bool(true).",
-            "else(mock11) :- not eq(mock1), not eq(mock3), not eq(mock5), lt(mock7).",
-            "elif(mock10) :- else(mock11).",
-            "elif(mock10) :- not eq(mock1), not eq(mock3), eq(mock5), gt(mock6).",
-            "elif(mock9) :- elif(mock10).",
-            "elif(mock9) :- not eq(mock1), eq(mock3), gt(mock4).",
-            "if(mock8) :- elif(mock9).",
+            "else(mock11) :- lt(mock7).",
+            "elif(mock10) :- not eq(mock5), else(mock11).",
+            "elif(mock10) :- eq(mock5), gt(mock6).",
+            "elif(mock9) :- not eq(mock3), elif(mock10).",
+            "elif(mock9) :- eq(mock3), gt(mock4).",
+            "if(mock8) :- not eq(mock1), elif(mock9).",
             "if(mock8) :- eq(mock1), gt(mock2).",
         ]
 
@@ -341,8 +340,9 @@ class DummyLogicEvalNode(LogicEvalNode):
 
 
 class DummySingleDataNode(JsonLogicSingleDataNode):
-    def __init__(self):
+    def __init__(self, value: str = "test"):
         super().__init__(term_variable_name="T", operation_name="test")
+        self.value = value
 
     def get_asp_statements(self) -> List[Statement]:
         return [
@@ -447,25 +447,46 @@ class TestLogicEvalNode:
             "% TEST mock2",
             "test(mock2, T) :- T = mock2.",
             "% var_name DUMMY TEST(mock2)",
-            "dummy(mock3) :- var(s86536e21993c5a96a4d4c9c9afcc9b17, V1), test(mock2, V2), " "V1 ~~ V2.",
+            "dummy(mock3) :- var(s86536e21993c5a96a4d4c9c9afcc9b17, V1), test(mock2, V2), V1 ~~ V2.",
         ]
 
     def test_statements_multi_data_node(self):
         data_var = DataVarNode("var_name")
-        dummy1 = DummySingleDataNode()
-        dummy2 = DummySingleDataNode()
+        dummy1 = DummySingleDataNode("test1")
+        dummy2 = DummySingleDataNode("test2")
         node = DummyLogicEvalNode(dummy1, data_var, dummy2)
 
         assert node.to_asp(with_comment=True) == [
+            "% TEST mock1",
+            "test(mock1, T) :- T = mock1.",
             "% TEST mock2",
             "test(mock2, T) :- T = mock2.",
-            "% TEST mock3",
-            "test(mock3, T) :- T = mock3.",
-            "% TEST(mock2) DUMMY var_name DUMMY TEST(mock3)",
-            "dummy(mock4) :- test(mock2, V1), var(s86536e21993c5a96a4d4c9c9afcc9b17, V2), test(mock3, V3), "
+            "% TEST(mock1) DUMMY var_name DUMMY TEST(mock2)",
+            "dummy(mock4) :- test(mock1, V1), var(s86536e21993c5a96a4d4c9c9afcc9b17, V2), test(mock2, V3), "
             "V1 ~~ V2, V2 ~~ V3.",
         ]
 
+    @pytest.mark.parametrize("node_class, predicate", [(LogicEqualNode, "eq"), (LogicStrictEqualNode, "seq")])
+    def test_statements_constant_match(self, node_class, predicate):
+        data_var = DataVarNode("var_name")
+        node1 = node_class(data_var, "str")
+        node2 = node_class(1.0, data_var)
+
+        assert node1.to_asp(with_comment=True) == [
+            f"% var_name {predicate.upper()} str",
+            f"{predicate}(mock2) :- var(s86536e21993c5a96a4d4c9c9afcc9b17, s341be97d9aff90c9978347f66f945b77).",
+        ]
+        assert node2.to_asp() == [f"{predicate}(mock3) :- var(s86536e21993c5a96a4d4c9c9afcc9b17, 1)."]
+
+    @pytest.mark.parametrize(
+        "node_class, expected", [(LogicNotEqualNode, "neq(mock2) :- "), (LogicGreaterThanNode, "gt(mock2) :- ")]
+    )
+    def test_statements_constant_join(self, node_class, expected):
+        data_var = DataVarNode("var_name")
+        node = node_class(data_var, 1)
+
+        assert node.to_asp() == [f"{expected}var(s86536e21993c5a96a4d4c9c9afcc9b17, V1), V1 {node.comparator} 1."]
+
     def test_str(self):
         node = DummyLogicEvalNode("a", "b")
 
@@ -477,9 +498,25 @@ class TestLogicEvalNode:
         node3 = DummyLogicEvalNode("a", "b")
         node4 = DummyLogicEvalNode("a", "b2")
 
-        nested_hash = tuple(sorted(hash(child) for child in node.child_nodes))
-        assert hash(node) == hash(("dummy", nested_hash)) == hash(node3) == hash(node3) != hash(node4)
-        assert node == node2 == node3 != node4
+        nested_hash = node._get_children_hash(sort=False)
+        assert hash(node) == hash(("dummy", nested_hash)) == hash(node3) != hash(node4)
+        assert node == node3 != node4
+        # Comparisons are ordered unless they are symmetric
+        assert node != node2
+
+    def test_hash_symmetric(self):
+        assert LogicEqualNode("a", "b") == LogicEqualNode("b", "a")
+        assert LogicStrictNotEqualNode(1, "b") == LogicStrictNotEqualNode("b", 1)
+        assert LogicGreaterThanNode(3, 1) != LogicGreaterThanNode(1, 3)
+        # Chained comparisons compare in pairs, so their order matters even when symmetric
+        assert LogicNotEqualNode("a", "b", "c") != LogicNotEqualNode("a", "c", "b")
+
+    def test_symmetric_node_id(self):
+        node = LogicEqualNode(DataVarNode("a"), 1)
+        node2 = LogicEqualNode(1, DataVarNode("a"))
+
+        assert node.node_id == node2.node_id
+        assert node.to_asp() == node2.to_asp()
 
 
 def test_logic_equal_node():
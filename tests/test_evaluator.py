@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
+from json_logic_asp.constants.evaluation_backends import EvaluationBackends
 from json_logic_asp.evaluator import (
+    evaluate_json_logic_rules_against_multiple_data,
     evaluate_multiple_json_logic_rules_against_single_data,
     evaluate_pregenerated_json_logic_rules_against_single_data,
     evaluate_single_json_logic_rule_against_single_data,
@@ -136,3 +138,60 @@ def test_evaluate_single_json_logic_rule_against_single_data_no_match():
     )
 
     assert match is False
+
+
+def test_evaluate_json_logic_rules_against_multiple_data():
+    json_logic_rules = [
+        RuleInput(rule_id="rule1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="rule2", rule_tree={"and": [True, {"missing": "d"}]}),
+    ]
+
+    json_logic_data = [
+        DataInput(data_id="data1", data_object={"a": "b"}),
+        DataInput(data_id="data2", data_object={"a": "c", "d": 1}),
+        DataInput(data_id="data3", data_object={"a": "b", "d": 1}),
+    ]
+
+    rules = evaluate_json_logic_rules_against_multiple_data(
+        json_logic_rules=json_logic_rules,
+        json_logic_data=json_logic_data,
+        simplify=True,
+        batch_size=2,
+    )
+
+    assert {data_id: sorted(rule_ids) for data_id, rule_ids in rules.items()} == {
+        "data1": ["rule1", "rule2"],
+        "data2": [],
+        "data3": ["rule1"],
+    }
+
+
+def test_evaluate_json_logic_rules_against_multiple_data_native():
+    json_logic_rules = [
+        RuleInput(rule_id="rule1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="rule2", rule_tree={"missing": "d"}),
+    ]
+
+    json_logic_data = [
+        DataInput(data_id="data1", data_object={"a": "b"}),
+        DataInput(data_id="data2", data_object={"a": "c", "d": 1}),
+    ]
+
+    rules = evaluate_json_logic_rules_against_multiple_data(
+        json_logic_rules=json_logic_rules,
+        json_logic_data=json_logic_data,
+        backend=EvaluationBackends.NATIVE,
+    )
+
+    assert {data_id: sorted(rule_ids) for data_id, rule_ids in rules.items()} == {
+        "data1": ["rule1", "rule2"],
+        "data2": [],
+    }
+
+    match = evaluate_single_json_logic_rule_against_single_data(
+        json_logic_rule=json_logic_rules[0],
+        json_logic_data=json_logic_data[0],
+        backend=EvaluationBackends.NATIVE,
+    )
+
+    assert match is True
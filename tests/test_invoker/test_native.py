@@ -0,0 +1,172 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from json_logic_asp.adapters.json_logic.jl_data_nodes import DataVarNode
+from json_logic_asp.adapters.json_logic.jl_logic_nodes import LogicEvalNode
+from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
+from json_logic_asp.constants.evaluation_backends import EvaluationBackends
+from json_logic_asp.invoker.native import (
+    get_matching_rules_for_compiled_rules_and_data,
+    get_matching_rules_for_native_rules_and_data,
+)
+from json_logic_asp.models.json_logic_nodes import JsonLogicDataNode, JsonLogicNode, JsonLogicTreeNode
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.rule_set import RuleSet
+
+DIFFERENTIAL_RULES: List[Dict[str, Any]] = [
+    {"var": "a"},
+    {"!": {"var": "a"}},
+    {"missing": "a"},
+    {"missing": ["a", "n"]},
+    {"==": [{"var": "a"}, "b"]},
+    {"===": [{"var": "a"}, "b"]},
+    {"!=": [{"var": "a"}, "b"]},
+    {"!==": [{"var": "n"}, 3]},
+    {"==": [{"var": "n"}, 3]},
+    {"==": [{"var": "f"}, True]},
+    {"==": [1.5, {"var": "n"}]},
+    {"==": [{"var": "a"}, {"var": "c"}]},
+    {"==": [{"var": "a"}, {"var": "a"}]},
+    {"<": [{"var": "n"}, 3]},
+    {"<": [{"var": "n"}, "x"]},
+    {"<=": [1, {"var": "n"}, 5]},
+    {">": [{"var": "n"}, {"var": "m"}]},
+    {">=": [{"var": "n"}, -2]},
+    {"<": [{"var": "a"}, {"var": "c"}]},
+    {"and": [{"var": "a"}, {"<": [{"var": "n"}, 5]}]},
+    {"and": [True, {"var": "a"}]},
+    {"and": [{"var": "a"}, {"var": "c"}, {"missing": "m"}]},
+    {"and": [False, {"var": "a"}]},
+    {"or": [{"missing": "a"}, {">": [{"var": "n"}, 4]}]},
+    {"or": [True, {"var": "a"}]},
+    {"or": [False, {"var": "a"}]},
+    {"!": {"and": [{"var": "a"}, {"var": "n"}]}},
+    {"!": {"!": {"var": "n"}}},
+    {"in": [{"var": "a"}, ["b", "c"]]},
+    {"in": [{"var": "n"}, [1, 3, 5]]},
+    {"in": [{"var": "a"}, ["b"]]},
+    {"in": [{"var": "a"}, []]},
+    {"in": [{"var": "a"}, {"merge": ["b", {"var": "c"}]}]},
+    {"in": [{"var": "n"}, {"merge": [{"var": "m"}]}]},
+    {"in": [{"var": "a"}, {"merge": [{"var": "c"}, {"var": "d"}]}]},
+    {"if": [{"!": {"missing": "a"}}, {"var": "n"}, {"missing": "m"}]},
+    {"if": [{"==": [{"var": "n"}, 3]}, True, {"==": [{"var": "n"}, 4]}, {"var": "a"}, False]},
+    {"if": [{"missing": "a"}, {"var": "n"}, {">": [{"var": "n"}, 1]}, {"missing": "c"}]},
+    {"if": [{"missing": "a"}, False, True]},
+    {"if": [{"missing": "a"}, False, {"==": [{"var": "n"}, 3]}, True, {"<": [{"var": "n"}, 0]}, {"var": "f"}, True]},
+    {"if": [{"missing": "m"}, {"var": "a"}, True, {"var": "c"}, {"==": [{"var": "a"}, "b"]}, True, False]},
+    {"if": [{"var": "a"}, {"var": "c"}, {"var": "n"}]},
+    {"if": [{"var": "a"}, {"var": "n"}, {"var": "c"}, {"var": "m"}]},
+    {"if": [{"var": "m"}, {"var": "a"}, {"var": "c"}, {"var": "n"}, {"var": "f"}]},
+]
+
+DIFFERENTIAL_DATA: List[Dict[str, Any]] = [
+    {},
+    {"a": "b"},
+    {"a": "c", "c": "c"},
+    {"a": "b", "c": "z", "n": 3},
+    {"a": "x", "d": "x", "n": 4, "m": 4},
+    {"a": "b", "n": 5, "m": 2, "f": True},
+    {"n": -2, "m": 0, "f": False},
+    {"a": 3, "n": 3, "c": "a"},
+    {"a": "3", "n": "3"},
+    {"n": 1.5, "m": 1},
+    {"n": "y", "a": "b", "c": "b"},
+]
+
+
+def test_get_matching_rules_for_native_rules_and_data():
+    class FakeNode(JsonLogicTreeNode):
+        def __init__(self, matches: bool):
+            super().__init__(operation_name=PredicateNames.RULE)
+            self.matches = matches
+
+        def get_asp_statements(self):
+            return []
+
+        def evaluate(self, data):
+            return self.matches
+
+    rule_nodes: Dict[str, JsonLogicNode] = {"a": FakeNode(True), "b": FakeNode(False), "c": FakeNode(True)}
+
+    assert get_matching_rules_for_native_rules_and_data(rule_nodes=rule_nodes, data_values={}) == ["a", "c"]
+    assert get_matching_rules_for_native_rules_and_data(
+        rule_nodes=rule_nodes, data_values={}, mapping={"a": "rule1"}
+    ) == ["rule1", "c"]
+
+
+def test_get_matching_rules_for_compiled_rules_and_data():
+    rule_functions = {"a": lambda data: "x" in data, "b": lambda data: False, "c": lambda data: True}
+
+    assert get_matching_rules_for_compiled_rules_and_data(rule_functions=rule_functions, data_values={}) == ["c"]
+    assert get_matching_rules_for_compiled_rules_and_data(
+        rule_functions=rule_functions, data_values={"x": (0, 1)}, mapping={"a": "rule1"}
+    ) == ["rule1", "c"]
+
+
+def test_native_evaluation_not_supported():
+    class FakeNode(JsonLogicTreeNode):
+        def __init__(self):
+            super().__init__(operation_name=PredicateNames.RULE)
+
+        def get_asp_statements(self):
+            return []
+
+    class FakeDataNode(JsonLogicDataNode):
+        def __init__(self):
+            super().__init__(term_variable_name=VariableNames.VAR, operation_name=PredicateNames.DATA_VAR)
+
+        def get_asp_statements(self):
+            return []
+
+        def __str__(self):
+            return "FAKE"
+
+        def __hash__(self):
+            return hash("FAKE")
+
+    class FakeEvalNode(LogicEvalNode):
+        def __init__(self, *children):
+            super().__init__(*children, comparator="~", predicate=PredicateNames.LOGIC_EQUALS)
+
+    for node in [FakeNode(), FakeDataNode(), FakeEvalNode(DataVarNode("a"), 2)]:
+        with pytest.raises(NotImplementedError) as exc:
+            node.evaluate({})
+        assert exc.match(f"{node.__class__.__name__} does not support native evaluation")
+
+
+def test_native_evaluation_matches_clingo():
+    rule_set = RuleSet(
+        rule_inputs=[
+            RuleInput(rule_id=f"rule{i}", rule_tree=rule_tree) for i, rule_tree in enumerate(DIFFERENTIAL_RULES)
+        ]
+    )
+
+    for data_object in DIFFERENTIAL_DATA:
+        data_input = DataInput(data_object=data_object)
+
+        clingo_rules = rule_set.evaluate(data_input, backend=EvaluationBackends.CLINGO)
+        native_rules = rule_set.evaluate(data_input, backend=EvaluationBackends.NATIVE)
+
+        assert sorted(native_rules) == sorted(clingo_rules), data_object
+
+
+def test_native_evaluation_many_matches_clingo():
+    rule_set = RuleSet(
+        rule_inputs=[
+            RuleInput(rule_id=f"rule{i}", rule_tree=rule_tree) for i, rule_tree in enumerate(DIFFERENTIAL_RULES)
+        ],
+        backend=EvaluationBackends.NATIVE,
+    )
+    data_inputs = [
+        DataInput(data_id=f"data{i}", data_object=data_object) for i, data_object in enumerate(DIFFERENTIAL_DATA)
+    ]
+
+    clingo_rules = rule_set.evaluate_many(data_inputs, backend=EvaluationBackends.CLINGO)
+    native_rules = rule_set.evaluate_many(data_inputs)
+
+    assert rule_set.backend == EvaluationBackends.NATIVE
+    assert {data_id: sorted(rule_ids) for data_id, rule_ids in native_rules.items()} == {
+        data_id: sorted(rule_ids) for data_id, rule_ids in clingo_rules.items()
+    }
@@ -1,7 +1,19 @@
+from typing import List
 from unittest.mock import patch
 
-from json_logic_asp.invoker import get_matching_rules_for_asp_rules_and_data, get_matching_rules_from_asp_problem
+from clingo import ast
+
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.invoker import (
+    get_matching_rules_for_asp_program_and_data,
+    get_matching_rules_for_asp_program_and_multiple_data,
+    get_matching_rules_for_asp_rules_and_data,
+    get_matching_rules_for_asp_rules_and_multiple_data,
+    get_matching_rules_from_asp_problem,
+    get_matching_rules_from_clingo_engine,
+)
 from json_logic_asp.invoker.run import __store_clingo_temp_file
+from json_logic_asp.sdk.clingo_engine import ClingoEngine
 
 
 def test_store_clingo_temp_file():
@@ -25,6 +37,41 @@ def test_get_matching_rules_from_asp_problem_mapping():
     assert rules == ["c", "d"]
 
 
+def test_get_matching_rules_from_asp_problem_rule_groups():
+    rules = get_matching_rules_from_asp_problem(
+        "rule(g1). rule(b). #show rule/1.", mapping={"a1": "c", "a2": "d", "b": "e"}, rule_groups={"g1": ["a1", "a2"]}
+    )
+    assert rules == ["c", "d", "e"]
+
+
+@patch("json_logic_asp.invoker.run.run_clingo")
+def test_get_matching_rules_from_asp_problem_in_memory(mock_run_clingo):
+    rules = get_matching_rules_from_asp_problem("rule(a). #show rule/1.")
+
+    mock_run_clingo.assert_not_called()
+    assert rules == ["a"]
+
+
+@patch("json_logic_asp.invoker.run.run_clingo_program")
+def test_get_matching_rules_from_asp_problem_debug_dump(mock_run_clingo_program):
+    dumped_files = []
+
+    def store_clingo_temp_file(problem):
+        fp = __store_clingo_temp_file(problem)
+        dumped_files.append(fp)
+        return fp
+
+    with patch("json_logic_asp.invoker.run.__store_clingo_temp_file", side_effect=store_clingo_temp_file):
+        rules = get_matching_rules_from_asp_problem("rule(a). #show rule/1.", debug_dump=True)
+
+    mock_run_clingo_program.assert_not_called()
+    assert rules == ["a"]
+
+    # Dumped file is kept for inspection
+    assert len(dumped_files) == 1 and dumped_files[0].exists()
+    dumped_files[0].unlink()
+
+
 def test_get_matching_rules_from_asp_problem_no_match():
     rules = get_matching_rules_from_asp_problem("rule(a). :- rule(a). #show rule/1.", mapping={"a": "c"})
     assert rules == []
@@ -39,11 +86,101 @@ def test_get_matching_rules_for_asp_rules_and_data(mock_get_matching_rules_from_
     mock_get_matching_rules_from_asp_problem.assert_called_once_with(
         problem="var(a, b).\n\n\nrule(a).\n\n\n#show rule/1.",
         mapping={"a": "b"},
+        debug_dump=False,
+        stratified=False,
+        rule_groups=None,
     )
     assert rules == ["b"]
 
 
+def test_get_matching_rules_for_asp_rules_and_data_stratified():
+    rules = get_matching_rules_for_asp_rules_and_data(
+        "var(a, b).", "rule(a) :- var(a, _). rule(c) :- not var(c, _).", mapping={"a": "b"}, stratified=True
+    )
+    assert sorted(rules) == ["b", "c"]
+
+
 def test_get_matching_rules_for_asp_rules_and_data_real():
     rules = get_matching_rules_for_asp_rules_and_data("var(a, b).", "rule(a) :- var(a, _).", mapping={"a": "b"})
 
     assert rules == ["b"]
+
+
+def test_get_matching_rules_from_clingo_engine():
+    engine = ClingoEngine(program="rule(scope, a) :- active(scope), var(scope, b, 1). #show rule/2.")
+
+    assert get_matching_rules_from_clingo_engine(engine, [PredicateAtom("var", ["b", "1"])], mapping={"a": "c"}) == [
+        "c"
+    ]
+    assert get_matching_rules_from_clingo_engine(engine, [PredicateAtom("var", ["b", "2"])], mapping={"a": "c"}) == []
+
+
+def test_get_matching_rules_for_asp_rules_and_multiple_data():
+    rules = get_matching_rules_for_asp_rules_and_multiple_data(
+        "record(d1). record(d2). record(d3). var(d1, a, b). var(d2, a, c).",
+        "rule(D, r1) :- record(D), var(D, a, _). rule(D, r2) :- record(D), var(D, a, b).",
+        data_mapping={"d1": "data1", "d2": "data2", "d3": "data3"},
+        mapping={"r1": "rule1", "r2": "rule2"},
+    )
+
+    assert {data_id: sorted(rule_ids) for data_id, rule_ids in rules.items()} == {
+        "data1": ["rule1", "rule2"],
+        "data2": ["rule1"],
+        "data3": [],
+    }
+
+
+def test_get_matching_rules_for_asp_rules_and_multiple_data_unsat():
+    rules = get_matching_rules_for_asp_rules_and_multiple_data(
+        "record(d1).",
+        "rule(D, r1) :- record(D). :- rule(D, r1).",
+        data_mapping={"d1": "data1"},
+    )
+
+    assert rules == {"data1": []}
+
+
+def test_get_matching_rules_for_asp_program_and_data():
+    program: List[ast.AST] = []
+    ast.parse_string("rule(a) :- var(b, 1). rule(c) :- var(b, 2). #show rule/1.", program.append)
+
+    assert get_matching_rules_for_asp_program_and_data(
+        program, [PredicateAtom("var", ["b", "1"])], mapping={"a": "d"}, stratified=True
+    ) == ["d"]
+    assert get_matching_rules_for_asp_program_and_data(program, [PredicateAtom("var", ["b", "3"])]) == []
+
+
+def test_get_matching_rules_for_asp_program_and_multiple_data():
+    program: List[ast.AST] = []
+    ast.parse_string(
+        "rule(D, r1) :- record(D), var(D, a, _). rule(D, r2) :- record(D), var(D, a, b). #show rule/2.",
+        program.append,
+    )
+
+    rules = get_matching_rules_for_asp_program_and_multiple_data(
+        program,
+        [
+            PredicateAtom("record", ["d1"]),
+            PredicateAtom("record", ["d2"]),
+            PredicateAtom("var", ["d1", "a", "b"]),
+        ],
+        data_mapping={"d1": "data1", "d2": "data2"},
+        mapping={"r1": "rule1", "r2": "rule2"},
+    )
+
+    assert {data_id: sorted(rule_ids) for data_id, rule_ids in rules.items()} == {
+        "data1": ["rule1", "rule2"],
+        "data2": [],
+    }
+
+
+def test_get_matching_rules_for_asp_rules_and_multiple_data_rule_groups():
+    rules = get_matching_rules_for_asp_rules_and_multiple_data(
+        "record(d1). record(d2). var(d1, a, b).",
+        "rule(D, g1) :- record(D), var(D, a, _).",
+        data_mapping={"d1": "data1", "d2": "data2"},
+        mapping={"r1": "rule1", "r2": "rule2"},
+        rule_groups={"g1": ["r1", "r2"]},
+    )
+
+    assert rules == {"data1": ["rule1", "rule2"], "data2": []}
@@ -0,0 +1,138 @@
+from typing import Any, Dict, Set
+
+import pytest
+
+from json_logic_asp.adapters.json_logic.jl_data_nodes import DataVarNode
+from json_logic_asp.adapters.json_logic.jl_logic_nodes import LogicEqualNode, LogicEvalNode
+from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
+from json_logic_asp.constants.evaluation_backends import EvaluationBackends
+from json_logic_asp.invoker.vectorized import (
+    __collect_constants,
+    get_matching_rules_matrix_for_native_rules_and_columns,
+)
+from json_logic_asp.models.json_logic_nodes import JsonLogicSingleDataNode, JsonLogicTreeNode
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.rule_set import RuleSet
+from json_logic_asp.translator.rule_compiler import RuleCompiler
+from json_logic_asp.utils.json_logic_helpers import EncodedValue, native_value_encoder
+from tests.test_invoker.test_native import DIFFERENTIAL_DATA, DIFFERENTIAL_RULES
+
+np = pytest.importorskip("numpy")
+
+
+def test_vectorized_evaluation_matches_native():
+    rule_set = RuleSet(
+        rule_inputs=[
+            RuleInput(rule_id=f"rule{i}", rule_tree=rule_tree) for i, rule_tree in enumerate(DIFFERENTIAL_RULES)
+        ]
+    )
+    var_names = sorted({var_name for data_object in DIFFERENTIAL_DATA for var_name in data_object})
+    columns: Dict[str, Any] = {
+        var_name: np.array([data_object.get(var_name) for data_object in DIFFERENTIAL_DATA], dtype=object)
+        for var_name in var_names
+    }
+
+    matrix = rule_set.evaluate_columns(columns)
+
+    assert matrix.shape == (len(DIFFERENTIAL_DATA), len(DIFFERENTIAL_RULES))
+    rule_ids = list(rule_set.rule_id_mapping.values())
+    for i, data_object in enumerate(DIFFERENTIAL_DATA):
+        native_rules = rule_set.evaluate(DataInput(data_object=data_object), backend=EvaluationBackends.NATIVE)
+        assert sorted(rule_ids[j] for j in np.flatnonzero(matrix[i])) == sorted(native_rules), data_object
+
+
+def test_vectorized_evaluation_typed_columns():
+    rule_set = RuleSet(
+        rule_inputs=[
+            RuleInput(rule_id="rule1", rule_tree={"==": [{"var": "a"}, "b"]}),
+            RuleInput(rule_id="rule2", rule_tree={"<": [{"var": "c"}, 3]}),
+            RuleInput(rule_id="rule3", rule_tree={"missing": "c"}),
+            RuleInput(rule_id="rule4", rule_tree={"in": [{"var": "a"}, ["x", "b"]]}),
+            RuleInput(rule_id="rule5", rule_tree={"var": "d"}),
+        ]
+    )
+    columns = {
+        "a": np.array(["b", "x", "z"]),
+        "c": np.ma.masked_array([1, 5, 2], mask=[False, False, True]),
+        "d": np.array([True, False, True]),
+    }
+
+    assert rule_set.evaluate_columns(columns).tolist() == [
+        [True, True, False, True, True],
+        [False, False, False, True, True],
+        [False, False, True, False, True],
+    ]
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [([1, True], [[True], [False]]), ([True, 1], [[False], [True]]), ([False, 0, 1], [[False], [False], [True]])],
+    ids=["int_first", "bool_first", "false_and_zero"],
+)
+def test_vectorized_evaluation_mixed_bool_int_column(values, expected):
+    rule_set = RuleSet(rule_inputs=[RuleInput(rule_id="rule1", rule_tree={"==": [{"var": "n"}, 1]})])
+
+    assert rule_set.evaluate_columns({"n": np.array(values, dtype=object)}).tolist() == expected
+    for value, matches in zip(values, expected):
+        assert rule_set.evaluate(DataInput(data_object={"n": value})) == (["rule1"] if matches[0] else [])
+
+
+def test_vectorized_collect_constants_deep_rule():
+    rule: Dict[str, Any] = {"in": [{"var": "a"}, ["x", "y"]]}
+    for level in range(10000):
+        rule = {"and": [{"==": [{"var": "b"}, level % 3]}, {"!": rule}]}
+
+    constants: Set[EncodedValue] = set()
+    __collect_constants(RuleCompiler().parse(rule), constants)
+
+    assert constants == {native_value_encoder(value) for value in ["x", "y", 0, 1, 2]}
+
+
+def test_vectorized_evaluation_empty_batch():
+    rule_set = RuleSet(rule_inputs=[RuleInput(rule_id="rule1", rule_tree={"var": "a"})])
+
+    assert rule_set.evaluate_columns({}).shape == (0, 1)
+
+
+def test_vectorized_evaluation_different_lengths():
+    with pytest.raises(ValueError) as exc:
+        get_matching_rules_matrix_for_native_rules_and_columns(
+            rule_nodes={}, columns={"a": np.array([1, 2]), "b": np.array([1])}
+        )
+
+    assert exc.match(r"All columns must have the same length, received lengths \[1, 2\]")
+
+
+def test_vectorized_evaluation_not_supported():
+    class FakeNode(JsonLogicTreeNode):
+        def __init__(self):
+            super().__init__(operation_name=PredicateNames.RULE)
+
+        def get_asp_statements(self):
+            return []
+
+    class FakeDataNode(JsonLogicSingleDataNode):
+        def __init__(self):
+            super().__init__(term_variable_name=VariableNames.VAR, operation_name=PredicateNames.DATA_VAR)
+
+        def get_asp_statements(self):
+            return []
+
+        def __str__(self):
+            return "FAKE"
+
+        def __hash__(self):
+            return hash("FAKE")
+
+    class FakeEvalNode(LogicEvalNode):
+        def __init__(self, *children):
+            super().__init__(*children, comparator="~", predicate=PredicateNames.LOGIC_EQUALS)
+
+    for node, node_name in [
+        (FakeNode(), "FakeNode"),
+        (LogicEqualNode(FakeDataNode(), 2), "FakeDataNode"),
+        (FakeEvalNode(DataVarNode("a"), 2), "FakeEvalNode"),
+    ]:
+        with pytest.raises(NotImplementedError) as exc:
+            get_matching_rules_matrix_for_native_rules_and_columns(rule_nodes={"a": node}, columns={})
+        assert exc.match(f"{node_name} does not support vectorized evaluation")
@@ -1,8 +1,8 @@
-from typing import List
+from typing import List, Set
 
 import pytest
 
-from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.adapters.asp.asp_literals import MatchAtom, PredicateAtom
 from json_logic_asp.adapters.asp.asp_statements import FactStatement, RuleStatement
 from json_logic_asp.models.asp_base import Statement
 from json_logic_asp.models.json_logic_nodes import (
@@ -13,7 +13,14 @@ from json_logic_asp.models.json_logic_nodes import (
     JsonLogicSingleDataNode,
     JsonLogicTreeNode,
 )
-from tests.fixtures import cuid_fixture  # noqa
+from json_logic_asp.translator.rule_compiler import SUPPORTED_NODE_TYPES
+from tests.fixtures import content_id_fixture, cuid_fixture  # noqa
+
+
+@pytest.mark.parametrize("cls", SUPPORTED_NODE_TYPES.values())
+def test_slotted_node_types(cls):
+    # Supported nodes are kept for every distinct subtree, so none of them must fall back to an attributes dictionary
+    assert all("__slots__" in klass.__dict__ for klass in cls.__mro__ if klass is not object)
 
 
 class DummyJsonLogicNode(JsonLogicNode):
@@ -58,6 +65,21 @@ class TestJsonLogicNode:
         negated = node.get_negated_asp_atom()
         assert atom.negated != negated.negated
 
+    def test_memoized_atoms(self):
+        node = DummyJsonLogicNode(accepted_child_node_types=(str,), operation_name="name")
+        atom = node.get_asp_atom()
+        negated = node.get_negated_asp_atom()
+        assert node.get_asp_atom() is atom
+        assert node.get_negated_asp_atom() is negated
+
+        # Registering a new child changes the node, so its id and atoms are built again
+        node_id = node.node_id
+        node.register_child("a")
+        assert node.get_asp_atom() is not atom
+        assert node.get_negated_asp_atom() is not negated
+        assert node.node_id != node_id
+        assert node.get_asp_atom().terms == (node.node_id,)
+
     def test_to_asp(self):
         node = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test1")
         asp = node.to_asp()
@@ -68,7 +90,80 @@ class TestJsonLogicNode:
         nested = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test2")
         node.register_child(nested)
         asp = node.to_asp()
-        assert asp == ["test(mock2).", "test(mock1)."]
+        assert asp == ["test(mock1).", "test(mock2)."]
+
+    def test_to_asp_nested_children(self):
+        node = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test1")
+        first = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test2")
+        nested = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test3")
+        second = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test4")
+        first.register_child(nested)
+        node.register_child(first)
+        node.register_child(second)
+
+        assert node.to_asp() == [
+            nested.get_asp_atom().to_asp_atom() + ".",
+            first.get_asp_atom().to_asp_atom() + ".",
+            second.get_asp_atom().to_asp_atom() + ".",
+            node.get_asp_atom().to_asp_atom() + ".",
+        ]
+
+    def test_to_asp_shared_children(self):
+        node = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test1")
+        first = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test2")
+        second = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test3")
+        shared = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test4")
+        first.register_child(shared)
+        second.register_child(shared)
+        node.register_child(first)
+        node.register_child(second)
+        node.register_child(shared)
+
+        assert node.to_asp() == ["test(mock1).", "test(mock2).", "test(mock3).", "test(mock4)."]
+        assert [shared.node_id, first.node_id, second.node_id, node.node_id] == ["mock1", "mock2", "mock3", "mock4"]
+
+    def test_iter_asp_statements_emitted_node_ids(self):
+        node = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test1")
+        other = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test2")
+        shared = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test3")
+        node.register_child(shared)
+        other.register_child(shared)
+
+        emitted_node_ids: Set[str] = set()
+        first_statements = [statement.to_asp_statement() for statement in node.iter_asp_statements(emitted_node_ids)]
+        second_statements = [statement.to_asp_statement() for statement in other.iter_asp_statements(emitted_node_ids)]
+
+        assert first_statements == [f"test({shared.node_id}).", f"test({node.node_id})."]
+        assert second_statements == [f"test({other.node_id})."]
+        assert emitted_node_ids == {shared.node_id, node.node_id, other.node_id}
+
+    def test_iter_asp_statements_emitted_again(self):
+        node = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name="test1")
+        node.register_child(DummyJsonLogicNode(accepted_child_node_types=(), operation_name="test2"))
+
+        first_statements = list(node.iter_asp_statements())
+        second_statements = list(node.iter_asp_statements())
+        third_statements = list(node.iter_asp_statements())
+
+        # Statements are built again the second time, and only kept from then on
+        assert all(first is not second for first, second in zip(first_statements, second_statements))
+        assert all(second is third for second, third in zip(second_statements, third_statements))
+        assert [statement.to_asp_statement() for statement in first_statements] == [
+            statement.to_asp_statement() for statement in third_statements
+        ]
+
+    def test_to_asp_deep_children(self):
+        nodes = [
+            DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode,), operation_name=f"test{i}")
+            for i in range(10000)
+        ]
+        for node, nested in zip(nodes, nodes[1:]):
+            node.register_child(nested)
+
+        asp = nodes[0].to_asp()
+        assert len(asp) == 10000
+        assert asp[0] == "test(mock1)."
+        assert asp[-1] == "test(mock10000)."
 
     def test_to_asp_child_no_jl_node(self):
         node = DummyJsonLogicNode(accepted_child_node_types=(str,), operation_name="test1")
@@ -96,6 +191,67 @@ class TestJsonLogicNode:
         assert hash(node1) == hash(node3) != hash(node2)
         assert node1 == node3 != node2
 
+    def test_content_node_id(self):
+        node1 = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode, str), operation_name="test1")
+        node2 = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode, str), operation_name="test1")
+        node3 = DummyJsonLogicNode(accepted_child_node_types=(DummyJsonLogicNode, str), operation_name="test1")
+        node1.register_child("a")
+        node2.register_child("a")
+        node3.register_child("b")
+
+        assert node1.node_id == node2.node_id == "mock1"
+        assert node3.node_id == "mock2"
+
+    def test_unhashable_child(self):
+        node = DummyJsonLogicNode(accepted_child_node_types=(list,), operation_name="name")
+        node.register_child(["1"])
+        node.register_child(["1"])
+        assert node.child_nodes == [["1"]]
+
+    def test_wide_children(self):
+        node = DummyJsonLogicNode(accepted_child_node_types=(str, list), operation_name="name")
+        children = ["a", ["b"], "c", "d", "e", "f", "g", "h", "i"]
+        for child in [*children, "a", ["b"], "i"]:
+            node.register_child(child)
+        assert node.child_nodes == children
+
+    def test_slotted_node_id(self):
+        class SlottedJsonLogicNode(DummyJsonLogicNode):
+            __slots__ = "value"
+
+            def __init__(self, value: str, extra: str):
+                super().__init__(accepted_child_node_types=(), operation_name="slotted")
+                self.value = value
+                self.extra = extra
+
+        node1 = SlottedJsonLogicNode("a", "b")
+        node2 = SlottedJsonLogicNode("a", "b")
+        node3 = SlottedJsonLogicNode("a", "c")
+        node4 = SlottedJsonLogicNode("c", "b")
+
+        assert node1.node_id == node2.node_id == "mock1"
+        assert len({node1.node_id, node3.node_id, node4.node_id}) == 3
+
+    def test_memoized_hash(self):
+        hash_calls = []
+
+        class CountingTreeNode(DummyJsonLogicTreeNode):
+            def __hash__(self):
+                hash_calls.append(self)
+                return super().__hash__()
+
+        node = CountingTreeNode(operation_name="test1")
+        nested = CountingTreeNode(operation_name="test2")
+        node.register_child(nested)
+
+        assert hash(node) == hash(node)
+        assert hash_calls == [node, nested]
+
+        # Registering a new child changes the structure, so the hash is computed again
+        node.register_child(DummyJsonLogicTreeNode(operation_name="test3"))
+        assert hash(node) != hash(CountingTreeNode(operation_name="test1"))
+        assert hash_calls.count(node) == 2
+
 
 class DummyJsonLogicTreeNode(JsonLogicTreeNode):
     def get_asp_statements(self) -> List[Statement]:
@@ -125,7 +281,7 @@ class TestJsonLogicTreeNode:
         nested = DummyJsonLogicTreeNode(operation_name="test2")
         node.register_child(nested)
 
-        assert node.to_asp() == ["test2(mock2).", "test(mock1) :- test2(mock2)."]
+        assert node.to_asp() == ["test2(mock1).", "test(mock2) :- test2(mock1)."]
 
     def test_str(self):
         node = DummyJsonLogicTreeNode(operation_name="test")
@@ -206,7 +362,7 @@ class TestJsonLogicOperationNode:
         nested = DummyJsonLogicDataNode(operation_name="test2", term_variable_name="T")
         node.register_child(nested)
 
-        assert node.to_asp() == ["test2(mock2, T).", "test(mock1) :- test2(mock2, T)."]
+        assert node.to_asp() == ["test2(mock1, T).", "test(mock2) :- test2(mock1, T)."]
 
 
 @pytest.mark.parametrize(
@@ -241,10 +397,23 @@ class TestJsonLogicDataNode:
         node = cls(operation_name="test", term_variable_name="T")
         assert node.get_asp_atom_with_different_variable_name("V").to_asp_atom() == "test(mock1, V)"
 
+    def test_memoized_asp_atom_with_different_var_name(self, cls):
+        node = cls(operation_name="test", term_variable_name="T")
+        atom = node.get_asp_atom_with_different_variable_name("V")
+        assert node.get_asp_atom_with_different_variable_name("V") is atom
+        assert node.get_asp_atom_with_different_variable_name("V", negated=True) is not atom
+
     def test_asp_atom_with_different_var_name_negated(self, cls):
         node = cls(operation_name="test", term_variable_name="T")
         assert node.get_asp_atom_with_different_variable_name("V", negated=True).to_asp_atom() == "not test(mock1, V)"
 
+    def test_asp_atom_matching_value(self, cls):
+        node = cls(operation_name="test", term_variable_name="T")
+        atom = node.get_asp_atom_matching_value("(a;b)", "V")
+        assert isinstance(atom, MatchAtom)
+        assert atom.to_asp_atom() == "test(mock1, (a;b))"
+        assert atom.variable_name == "V"
+
     def test_to_asp(self, cls):
         node = cls(operation_name="test2", term_variable_name="T")
         assert node.to_asp() == ["test2(mock1, T)."]
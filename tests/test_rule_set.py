@@ -0,0 +1,539 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.adapters.asp.asp_statements import DirectiveStatement, FactStatement
+from json_logic_asp.constants.evaluation_backends import EvaluationBackends
+from json_logic_asp.models.json_logic_nodes import JsonLogicOperationNode
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.rule_set import RuleSet
+from json_logic_asp.translator.function_generator import generate_rule_function
+from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_statements
+from json_logic_asp.translator.translation_cache import TranslationCache
+
+RULES = [
+    RuleInput(rule_id="rule1", rule_tree={"==": [{"var": "a"}, "b"]}),
+    RuleInput(rule_id="rule2", rule_tree={"<": [{"var": "c"}, 3]}),
+    RuleInput(rule_id="rule3", rule_tree={"missing": "d"}),
+]
+
+
+class AlwaysTestNode(JsonLogicOperationNode):
+    def __init__(self, *children):
+        super().__init__(operation_name="always")
+
+    def get_asp_statements(self):
+        return [FactStatement(atom=self.get_asp_atom())]
+
+    def __str__(self):
+        return "ALWAYS"
+
+    def __hash__(self):
+        return hash("always")
+
+
+class DirectiveTestNode(JsonLogicOperationNode):
+    def __init__(self, *children):
+        super().__init__(operation_name="directive")
+
+    def get_asp_statements(self):
+        return [DirectiveStatement(action="program", statement="base"), FactStatement(atom=self.get_asp_atom())]
+
+    def __str__(self):
+        return "DIRECTIVE"
+
+    def __hash__(self):
+        return hash("directive")
+
+
+def test_rule_set_compiles_once():
+    with patch(
+        "json_logic_asp.rule_set.generate_multiple_rule_asp_statements",
+        return_value=([FactStatement(atom=PredicateAtom(predicate_name="rule", terms=["a"]))], {"a": "b"}),
+    ) as mock_generate_multiple_rule_asp_statements:
+        rule_set = RuleSet(rule_inputs=RULES)
+        assert rule_set.evaluate(DataInput(data_object={"a": "b"})) == ["b"]
+        assert rule_set.evaluate(DataInput(data_object={"c": 1})) == ["b"]
+
+    mock_generate_multiple_rule_asp_statements.assert_called_once()
+    assert rule_set.asp_definition == "rule(a)."
+    assert rule_set.rule_id_mapping == {"a": "b"}
+
+
+def test_rule_set_properties():
+    rule_set = RuleSet(rule_inputs=RULES)
+
+    assert len(rule_set) == 3
+    assert [rule_input.rule_id for rule_input in rule_set.rule_inputs] == ["rule1", "rule2", "rule3"]
+    assert sorted(rule_set.rule_id_mapping.values()) == ["rule1", "rule2", "rule3"]
+    assert len(rule_set.node_cache) > 0
+    assert "rule(" in rule_set.asp_definition
+    assert rule_set.multi_shot is False
+
+
+def test_rule_set_evaluate():
+    rule_set = RuleSet(rule_inputs=RULES)
+
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "c": 2, "d": "e"}))) == ["rule1", "rule2"]
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "x", "c": 5}))) == ["rule3"]
+
+
+def test_rule_set_evaluate_simplify():
+    rule_set = RuleSet(
+        rule_inputs=[RuleInput(rule_id="rule1", rule_tree={"and": [True, {"missing": "d"}]})],
+        simplify=True,
+    )
+
+    assert rule_set.rule_inputs[0].rule_tree == {"missing": "d"}
+    assert rule_set.evaluate(DataInput(data_object={"a": "b"})) == ["rule1"]
+
+
+def test_rule_set_evaluate_deep_rule():
+    rule_tree: Dict[str, Any] = {"var": "a"}
+    for level in range(10000):
+        rule_tree = {"and": [rule_tree, {"<": [{"var": "b"}, level + 10]}]}
+
+    rule_set = RuleSet(rule_inputs=[RuleInput(rule_id="deep", rule_tree=rule_tree), *RULES])
+
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "b": 5}))) == ["deep", "rule1", "rule3"]
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "b": 10}))) == ["rule1", "rule3"]
+
+
+def test_rule_set_evaluate_concurrently():
+    rule_set = RuleSet(rule_inputs=RULES)
+    data_inputs = [DataInput(data_object={"a": "b", "c": i, "d": "e"}) for i in range(10)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(rule_set.evaluate, data_inputs))
+
+    assert [sorted(res) for res in results] == [["rule1", "rule2"]] * 3 + [["rule1"]] * 7
+
+
+def test_rule_set_build_lazily_concurrently(tmp_path):
+    path = tmp_path / "rule_set.json.gz"
+    RuleSet(rule_inputs=RULES).save(path)
+    # Loaded rule sets build everything but their Clingo program on first use, from every evaluating thread at once
+    rule_set = RuleSet.load(path)
+    data_inputs = [DataInput(data_object={"a": "b", "c": i, "d": "e"}, data_id=str(i)) for i in range(10)]
+
+    def evaluate(data_input):
+        return [
+            sorted(rule_set.evaluate(data_input, backend=EvaluationBackends.COMPILED)),
+            sorted(rule_set.evaluate(data_input, backend=EvaluationBackends.NATIVE)),
+            sorted(rule_set.evaluate_many([data_input])[data_input.data_id]),
+        ]
+
+    def generate_slowly(*args):
+        # Compiling is slowed down, so every thread reaches the rule functions before the first one has built them
+        time.sleep(0.01)
+        return generate_rule_function(*args)
+
+    with patch("json_logic_asp.rule_set.generate_rule_function", side_effect=generate_slowly) as mock_generate:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(evaluate, data_inputs))
+
+    assert results == [[["rule1", "rule2"]] * 3] * 3 + [[["rule1"]] * 3] * 7
+    assert mock_generate.call_count == len(RULES)
+
+
+def test_rule_set_evaluate_multi_shot():
+    rule_set = RuleSet(rule_inputs=RULES, multi_shot=True)
+    data_inputs = [
+        DataInput(data_object={"a": "b", "c": 2, "d": "e"}),
+        DataInput(data_object={"a": "x", "c": 5}),
+        DataInput(data_object={"a": "b", "c": 2, "d": "e"}),
+    ]
+
+    assert rule_set.multi_shot is True
+    assert [sorted(rule_set.evaluate(data_input)) for data_input in data_inputs] == [
+        ["rule1", "rule2"],
+        ["rule3"],
+        ["rule1", "rule2"],
+    ]
+
+
+def test_rule_set_evaluate_multi_shot_concurrently():
+    rule_set = RuleSet(rule_inputs=RULES, multi_shot=True)
+    data_inputs = [DataInput(data_object={"a": "b", "c": i, "d": "e"}) for i in range(10)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(rule_set.evaluate, data_inputs))
+
+    assert [sorted(res) for res in results] == [["rule1", "rule2"]] * 3 + [["rule1"]] * 7
+
+
+def test_rule_set_evaluate_many():
+    rule_set = RuleSet(rule_inputs=RULES)
+    data_inputs = [
+        DataInput(data_id="data1", data_object={"a": "b", "c": 2, "d": "e"}),
+        DataInput(data_id="data2", data_object={"a": "x", "c": 5}),
+        DataInput(data_id="data3", data_object={"a": "b", "d": "e"}),
+    ]
+
+    expected = {"data1": ["rule1", "rule2"], "data2": ["rule3"], "data3": ["rule1"]}
+    for batch_size in [1, 2, 3, 10]:
+        matching_rules = rule_set.evaluate_many(data_inputs, batch_size=batch_size)
+        assert {data_id: sorted(rule_ids) for data_id, rule_ids in matching_rules.items()} == expected
+
+    assert {data_input.data_id: sorted(rule_set.evaluate(data_input)) for data_input in data_inputs} == expected
+
+
+def test_rule_set_evaluate_many_invalid_batch_size():
+    rule_set = RuleSet(rule_inputs=RULES)
+
+    with pytest.raises(ValueError) as exc:
+        rule_set.evaluate_many([], batch_size=0)
+
+    assert exc.match("Batch size must be a positive number, received 0")
+
+
+def test_rule_set_evaluate_compiled():
+    rule_set = RuleSet(
+        rule_inputs=[*RULES, RuleInput(rule_id="rule4", rule_tree={"always": []})],
+        custom_nodes={"always": AlwaysTestNode},
+        backend=EvaluationBackends.COMPILED,
+    )
+    data_inputs = [
+        DataInput(data_id="data1", data_object={"a": "b", "c": 2, "d": "e"}),
+        DataInput(data_id="data2", data_object={"a": "x", "c": 5}),
+    ]
+
+    assert sorted(rule_set.rule_functions) == sorted(
+        rule_id for rule_id, original_id in rule_set.rule_id_mapping.items() if original_id != "rule4"
+    )
+    assert sorted(rule_set.evaluate(data_inputs[0])) == ["rule1", "rule2", "rule4"]
+    assert {data_id: sorted(rule_ids) for data_id, rule_ids in rule_set.evaluate_many(data_inputs).items()} == {
+        "data1": ["rule1", "rule2", "rule4"],
+        "data2": ["rule3", "rule4"],
+    }
+
+
+def test_rule_set_evaluate_compiled_without_fallback():
+    rule_set = RuleSet(rule_inputs=RULES)
+
+    with patch("json_logic_asp.rule_set.get_matching_rules_for_asp_program_and_data") as mock_get_matching_rules:
+        matching_rules = rule_set.evaluate(
+            DataInput(data_object={"a": "b", "c": 2, "d": "e"}), backend=EvaluationBackends.COMPILED
+        )
+
+    mock_get_matching_rules.assert_not_called()
+    assert sorted(matching_rules) == ["rule1", "rule2"]
+    assert rule_set.rule_functions == rule_set.rule_functions
+
+
+def test_rule_set_evaluate_stratified():
+    for custom_nodes, stratified in [(None, True), ({"always": AlwaysTestNode}, False)]:
+        rule_set = RuleSet(rule_inputs=RULES, custom_nodes=custom_nodes)
+
+        with patch(
+            "json_logic_asp.rule_set.get_matching_rules_for_asp_program_and_data", return_value=[]
+        ) as mock_get_matching_rules:
+            rule_set.evaluate(DataInput(data_object={"a": "b"}))
+
+        assert mock_get_matching_rules.call_args.kwargs["stratified"] is stratified
+
+        with patch(
+            "json_logic_asp.rule_set.get_matching_rules_for_asp_program_and_multiple_data", return_value={}
+        ) as mock_get_matching_rules_many:
+            rule_set.evaluate_many([DataInput(data_object={"a": "b"})])
+
+        assert mock_get_matching_rules_many.call_args.kwargs["stratified"] is stratified
+
+
+def test_rule_set_save_and_load(tmp_path):
+    rule_set = RuleSet(rule_inputs=RULES)
+    path = tmp_path / "rule_set.json.gz"
+    rule_set.save(path)
+
+    with patch("json_logic_asp.rule_set.generate_multiple_rule_asp_statements") as mock_generate:
+        loaded_rule_set = RuleSet.load(path)
+        assert loaded_rule_set.content_hash == rule_set.content_hash
+        assert loaded_rule_set.asp_definition == rule_set.asp_definition
+        assert loaded_rule_set.rule_id_mapping == rule_set.rule_id_mapping
+        assert sorted(loaded_rule_set.evaluate(DataInput(data_object={"a": "b", "c": 2, "d": 1}))) == ["rule1", "rule2"]
+        assert sorted(loaded_rule_set.evaluate(DataInput(data_object={"a": "x", "c": 5}))) == ["rule3"]
+
+    mock_generate.assert_not_called()
+
+    data_inputs = [DataInput(data_object={"a": "b"}, data_id="data1"), DataInput(data_object={"c": 5}, data_id="data2")]
+    assert loaded_rule_set.evaluate_many(data_inputs) == rule_set.evaluate_many(data_inputs)
+
+
+def test_rule_set_save_and_load_backends(tmp_path):
+    path = tmp_path / "rule_set.json.gz"
+    RuleSet(rule_inputs=RULES).save(path)
+
+    for multi_shot, backend in [
+        (True, EvaluationBackends.CLINGO),
+        (False, EvaluationBackends.NATIVE),
+        (False, EvaluationBackends.COMPILED),
+    ]:
+        loaded_rule_set = RuleSet.load(path, multi_shot=multi_shot, backend=backend)
+        assert loaded_rule_set.multi_shot is multi_shot
+        assert sorted(loaded_rule_set.evaluate(DataInput(data_object={"a": "b", "c": 2, "d": 1}))) == ["rule1", "rule2"]
+
+    assert len(RuleSet.load(path).node_cache) > 0
+
+
+def test_rule_set_load_content_hash(tmp_path):
+    rule_set = RuleSet(rule_inputs=RULES)
+    path = tmp_path / "rule_set.json.gz"
+    rule_set.save(path)
+
+    assert RuleSet.load(path, content_hash=rule_set.content_hash).content_hash == rule_set.content_hash
+    assert RuleSet(rule_inputs=list(reversed(RULES))).content_hash != rule_set.content_hash
+    assert RuleSet(rule_inputs=RULES, simplify=True).content_hash != rule_set.content_hash
+
+    with pytest.raises(ValueError):
+        RuleSet.load(path, content_hash="other")
+
+
+def test_rule_set_translation_cache():
+    translation_cache = TranslationCache()
+    rule_set = RuleSet(rule_inputs=RULES, translation_cache=translation_cache)
+    assert (translation_cache.hits, translation_cache.misses) == (0, 3)
+
+    cached_rule_set = RuleSet(rule_inputs=RULES, translation_cache=translation_cache, backend=EvaluationBackends.NATIVE)
+    assert (translation_cache.hits, translation_cache.misses) == (3, 3)
+    assert cached_rule_set.asp_definition == rule_set.asp_definition
+
+    data_input = DataInput(data_object={"a": "b", "c": 2, "d": 1})
+    assert sorted(cached_rule_set.evaluate(data_input)) == ["rule1", "rule2"]
+    assert len(cached_rule_set.node_cache) > 0
+
+
+def __assert_same_rules(rule_set, rule_inputs):
+    expected_rule_set = RuleSet(rule_inputs=rule_inputs)
+
+    assert rule_set.content_hash == expected_rule_set.content_hash
+    assert rule_set.rule_id_mapping == expected_rule_set.rule_id_mapping
+    assert sorted(rule_set.asp_definition.splitlines()) == sorted(expected_rule_set.asp_definition.splitlines())
+
+    data_inputs = [
+        DataInput(data_object={"a": "b", "c": 2, "d": 1}, data_id="data1"),
+        DataInput(data_object={"a": "x", "c": 5}, data_id="data2"),
+        DataInput(data_object={"a": "b", "e": "y"}, data_id="data3"),
+    ]
+    expected = {data_input.data_id: sorted(expected_rule_set.evaluate(data_input)) for data_input in data_inputs}
+    for backend in EvaluationBackends:
+        assert {
+            data_input.data_id: sorted(rule_set.evaluate(data_input, backend=backend)) for data_input in data_inputs
+        } == expected
+    assert {
+        data_id: sorted(matching_rules) for data_id, matching_rules in rule_set.evaluate_many(data_inputs).items()
+    } == expected
+
+
+NEW_RULES = [
+    RuleInput(rule_id="rule4", rule_tree={"and": [{"==": [{"var": "a"}, "b"]}, {"in": [{"var": "e"}, ["x", "y"]]}]}),
+    RuleInput(rule_id="rule5", rule_tree={"missing": "d"}),
+]
+
+
+def test_rule_set_add_rules():
+    for multi_shot in [False, True]:
+        rule_set = RuleSet(rule_inputs=RULES, multi_shot=multi_shot)
+        # Every program is built before editing, so they are all updated
+        __assert_same_rules(rule_set, RULES)
+
+        with patch(
+            "json_logic_asp.rule_set.generate_multiple_rule_asp_statements",
+            wraps=generate_multiple_rule_asp_statements,
+        ) as mock_generate:
+            rule_set.add_rules(NEW_RULES)
+
+        assert mock_generate.call_args.kwargs["rule_inputs"] == NEW_RULES
+        assert len(rule_set) == 5
+        __assert_same_rules(rule_set, [*RULES, *NEW_RULES])
+
+
+def test_rule_set_remove_rules():
+    for multi_shot in [False, True]:
+        rule_set = RuleSet(rule_inputs=[*RULES, *NEW_RULES], multi_shot=multi_shot)
+        __assert_same_rules(rule_set, [*RULES, *NEW_RULES])
+
+        # rule5 shares all its statements with rule3, so only its head is dropped
+        rule_set.remove_rules(["rule3"])
+        assert "missing(" in rule_set.asp_definition
+        __assert_same_rules(rule_set, [*RULES[:2], *NEW_RULES])
+
+        rule_set.remove_rules(["rule5", "rule1"])
+        assert "missing(" not in rule_set.asp_definition
+        __assert_same_rules(rule_set, [RULES[1], NEW_RULES[0]])
+
+
+def test_rule_set_replace_rules():
+    rule_set = RuleSet(rule_inputs=RULES, multi_shot=True)
+    __assert_same_rules(rule_set, RULES)
+
+    replaced_rules = [RuleInput(rule_id="rule1", rule_tree={"==": [{"var": "a"}, "x"]}), RULES[1]]
+    rule_set.replace_rules(replaced_rules)
+    assert [rule_input.rule_id for rule_input in rule_set.rule_inputs] == ["rule3", "rule1", "rule2"]
+    __assert_same_rules(rule_set, [RULES[2], *replaced_rules])
+
+    asp_definition = rule_set.asp_definition
+    rule_set.replace_rules([RULES[2]])
+    assert rule_set.asp_definition == asp_definition
+
+
+def test_rule_set_edit_rules_lazy_programs():
+    rule_set = RuleSet(rule_inputs=RULES)
+    rule_set.add_rules(NEW_RULES)
+    rule_set.remove_rules(["rule1"])
+    __assert_same_rules(rule_set, [*RULES[1:], *NEW_RULES])
+
+
+def test_rule_set_edit_rules_simplify():
+    rule_inputs = [RuleInput(rule_id="rule1", rule_tree={"and": [True, {"missing": "d"}]})]
+    rule_set = RuleSet(rule_inputs=rule_inputs, simplify=True)
+    rule_set.add_rules([RuleInput(rule_id="rule2", rule_tree={"or": [False, {"var": "a"}]})])
+
+    assert rule_set.rule_inputs[1].rule_tree == {"var": "a"}
+    assert (
+        rule_set.content_hash
+        == RuleSet(
+            rule_inputs=[*rule_inputs, RuleInput(rule_id="rule2", rule_tree={"or": [False, {"var": "a"}]})],
+            simplify=True,
+        ).content_hash
+    )
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b"}))) == ["rule1", "rule2"]
+
+
+def test_rule_set_edit_rules_compiled_fallback():
+    rule_set = RuleSet(rule_inputs=RULES, custom_nodes={"always": AlwaysTestNode}, backend=EvaluationBackends.COMPILED)
+    assert sorted(rule_set.evaluate(DataInput(data_object={"d": 1}))) == []
+
+    rule_set.add_rules([RuleInput(rule_id="rule4", rule_tree={"always": []})])
+    assert sorted(rule_set.evaluate(DataInput(data_object={"d": 1}))) == ["rule4"]
+
+    rule_set.remove_rules(["rule4"])
+    assert sorted(rule_set.evaluate(DataInput(data_object={"d": 1}))) == []
+
+
+def test_rule_set_edit_loaded_rules(tmp_path):
+    path = tmp_path / "rule_set.json.gz"
+    RuleSet(rule_inputs=RULES, simplify=True).save(path)
+
+    rule_set = RuleSet.load(path)
+    rule_set.add_rules(NEW_RULES)
+    rule_set.remove_rules(["rule1"])
+    assert rule_set.content_hash == RuleSet(rule_inputs=[*RULES[1:], *NEW_RULES], simplify=True).content_hash
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "e": "y"}))) == ["rule3", "rule4", "rule5"]
+
+
+@pytest.mark.parametrize("multi_shot", [False, True])
+def test_rule_set_edit_loaded_edited_rules(tmp_path, multi_shot):
+    rules = [
+        RuleInput(rule_id="a", rule_tree={"==": [{"var": "x"}, 1]}),
+        RuleInput(rule_id="b", rule_tree={"and": [{"==": [1, {"var": "x"}]}, {">": [{"var": "y"}, 0]}]}),
+        RuleInput(rule_id="c", rule_tree={"==": [{"var": "z"}, 1]}),
+    ]
+    path = tmp_path / "rule_set.json.gz"
+    # Node ids depend on the translation history, so the loaded definitions differ from the ones translated again
+    rule_set = RuleSet(rule_inputs=[rules[0], rules[2]])
+    rule_set.add_rules([rules[1]])
+    rule_set.remove_rules(["a"])
+    rule_set.save(path)
+
+    data_input = DataInput(data_object={"x": 1, "y": 1, "z": 1}, data_id="data")
+    rule_set = RuleSet.load(path, multi_shot=multi_shot)
+    rule_set.remove_rules(["c"])
+    assert rule_set.evaluate(data_input) == ["b"]
+    assert rule_set.evaluate_many([data_input]) == {"data": ["b"]}
+
+    rule_set.add_rules([rules[2]])
+    assert sorted(rule_set.evaluate(data_input)) == ["b", "c"]
+    assert sorted(rule_set.evaluate_many([data_input])["data"]) == ["b", "c"]
+
+
+def test_rule_set_edit_rules_invalid():
+    rule_set = RuleSet(rule_inputs=RULES)
+
+    with pytest.raises(ValueError):
+        rule_set.add_rules([RULES[0]])
+    with pytest.raises(ValueError):
+        rule_set.add_rules([NEW_RULES[0], NEW_RULES[0]])
+    with pytest.raises(ValueError):
+        rule_set.remove_rules(["rule4"])
+    with pytest.raises(ValueError):
+        rule_set.replace_rules([NEW_RULES[0]])
+
+    assert len(rule_set) == 3
+
+
+def test_rule_set_edit_rules_directives():
+    rule_set = RuleSet(rule_inputs=RULES, custom_nodes={"directive": DirectiveTestNode})
+    rule_set.add_rules([RuleInput(rule_id="rule4", rule_tree={"directive": []})])
+    assert "#program base." in rule_set.asp_definition
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "c": 5, "d": 1}))) == ["rule1", "rule4"]
+
+    rule_set.remove_rules(["rule1"])
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "c": 5, "d": 1}))) == ["rule4"]
+
+
+def test_rule_set_identical_rules():
+    rule_inputs = [
+        *RULES,
+        RuleInput(rule_id="rule4", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="rule5", rule_tree={"==": [{"var": "a"}, "b"]}),
+    ]
+    rule_set = RuleSet(rule_inputs=rule_inputs, multi_shot=True)
+
+    assert len([line for line in rule_set.asp_definition.splitlines() if line.startswith("rule(")]) == 3
+    assert len(rule_set.rule_id_mapping) == 5
+    __assert_same_rules(rule_set, rule_inputs)
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "d": 1}))) == ["rule1", "rule4", "rule5"]
+
+    # The shared rule is kept until all the identical rules are removed
+    rule_set.remove_rules(["rule1", "rule4"])
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "d": 1}))) == ["rule5"]
+    rule_set.add_rules([RuleInput(rule_id="rule6", rule_tree={"==": [{"var": "a"}, "b"]})])
+    assert sorted(rule_set.evaluate(DataInput(data_object={"a": "b", "d": 1}))) == ["rule5", "rule6"]
+    rule_set.remove_rules(["rule5", "rule6"])
+    assert rule_set.evaluate(DataInput(data_object={"a": "b", "d": 1})) == []
+    assert len([line for line in rule_set.asp_definition.splitlines() if line.startswith("rule(")]) == 2
+
+
+def test_rule_set_parameterize(tmp_path):
+    rule_inputs = [
+        *RULES,
+        RuleInput(rule_id="rule4", rule_tree={"<": [{"var": "c"}, 7]}),
+        RuleInput(rule_id="rule5", rule_tree={"in": [{"var": "a"}, ["b", "x"]]}),
+    ]
+    data_inputs = [
+        DataInput(data_object={"a": "b", "c": 2, "d": 1}, data_id="data1"),
+        DataInput(data_object={"a": "x", "c": 5}, data_id="data2"),
+        DataInput(data_object={"a": "y", "c": 9, "d": 1}, data_id="data3"),
+    ]
+    expected_rule_set = RuleSet(rule_inputs=rule_inputs)
+    expected = {data_input.data_id: sorted(expected_rule_set.evaluate(data_input)) for data_input in data_inputs}
+
+    rule_set = RuleSet(rule_inputs=rule_inputs, parameterize=True, multi_shot=True)
+    # Both lower than rules share a single generic rule, joined against their parameter facts
+    assert len([line for line in rule_set.asp_definition.splitlines() if line.startswith("lt(")]) == 1
+    assert len([line for line in rule_set.asp_definition.splitlines() if line.startswith("param(")]) == 4
+
+    path = tmp_path / "rule_set.json.gz"
+    rule_set.save(path)
+    for evaluated_rule_set in [rule_set, RuleSet.load(path)]:
+        for backend in EvaluationBackends:
+            assert {
+                data_input.data_id: sorted(evaluated_rule_set.evaluate(data_input, backend=backend))
+                for data_input in data_inputs
+            } == expected
+        assert {
+            data_id: sorted(matching_rules)
+            for data_id, matching_rules in evaluated_rule_set.evaluate_many(data_inputs).items()
+        } == expected
+
+    # The generic rule is kept until all the rules of its family are removed
+    rule_set.remove_rules(["rule2"])
+    assert sorted(rule_set.evaluate(data_inputs[0])) == ["rule1", "rule4", "rule5"]
+    rule_set.remove_rules(["rule4"])
+    assert "lt(N) :- " not in rule_set.asp_definition
+    rule_set.add_rules([RuleInput(rule_id="rule6", rule_tree={"<": [{"var": "c"}, 3]})])
+    assert sorted(rule_set.evaluate(data_inputs[0])) == ["rule1", "rule5", "rule6"]
@@ -0,0 +1,16 @@
+from clingo import Function, Number
+
+from json_logic_asp.sdk.clingo_builder import parse_asp_program, term_to_symbol
+from json_logic_asp.sdk.clingo_sdk import run_clingo_ast_program
+
+
+def test_term_to_symbol():
+    assert term_to_symbol("1") == Number(1)
+    assert term_to_symbol("-3") == Number(-3)
+    assert term_to_symbol("abc") == Function("abc")
+
+
+def test_parse_asp_program():
+    program = parse_asp_program("a. rule(x) :- a. #show rule/1.")
+    assert [str(statement) for statement in program] == ["a.", "rule(x) :- a.", "#show rule/1."]
+    assert run_clingo_ast_program(program, [])[:2] == ("SAT", ["x"])
@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+from clingo import Control
+
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.sdk.clingo_engine import ClingoEngine
+
+PROGRAM = "\n".join(
+    [
+        "node(scope, a) :- active(scope), var(scope, x, 1).",
+        "rule(scope, r1) :- active(scope), node(scope, a).",
+        "rule(scope, r2) :- active(scope), not node(scope, a).",
+        "#show rule/2.",
+    ]
+)
+
+
+def test_run():
+    engine = ClingoEngine(program=PROGRAM)
+
+    status, rules, _ = engine.run([PredicateAtom(predicate_name="var", terms=["x", "1"])])
+    assert status == "SAT"
+    assert rules == ["r1"]
+
+
+def test_run_multiple_times():
+    engine = ClingoEngine(program=PROGRAM)
+
+    results = [
+        engine.run([PredicateAtom(predicate_name="var", terms=["x", value])])[1] for value in ["1", "2", "sabc", "1"]
+    ]
+    assert results == [["r1"], ["r2"], ["r2"], ["r1"]]
+
+
+def test_run_recreates_control():
+    engine = ClingoEngine(program=PROGRAM, max_runs=2)
+
+    with patch("json_logic_asp.sdk.clingo_engine.Control", wraps=Control) as mock_control:
+        results = [
+            engine.run([PredicateAtom(predicate_name="var", terms=["x", value])])[1] for value in ["1", "2", "1"]
+        ]
+
+    assert results == [["r1"], ["r2"], ["r1"]]
+    assert mock_control.call_count == 2
+
+
+def test_run_recreates_control_by_default():
+    engine = ClingoEngine(program=PROGRAM)
+
+    with patch("json_logic_asp.sdk.clingo_engine.Control", wraps=Control) as mock_control:
+        for _ in range(ClingoEngine.DEFAULT_MAX_RUNS):
+            engine.run([PredicateAtom(predicate_name="var", terms=["x", "1"])])
+        assert mock_control.call_count == 1
+
+        # Grounded runs are never retracted, so the control is recreated once the default number of runs is reached
+        assert engine.run([PredicateAtom(predicate_name="var", terms=["x", "1"])])[1] == ["r1"]
+        assert mock_control.call_count == 2
+
+
+def test_run_unsat():
+    engine = ClingoEngine(program="rule(scope, a) :- active(scope). :- rule(scope, a). #show rule/2.")
+
+    status, rules, _ = engine.run([])
+    assert status == "UNSAT"
+    assert rules == []
+
+
+def test_run_invalid_program():
+    engine = ClingoEngine(program="THIS IS WRONG DEFINITION")
+
+    assert engine.run([]) == ("ERROR", [], {})
+
+
+def test_run_invalid_grounding():
+    engine = ClingoEngine(program="rule(scope, a) :- active(scope), not var(scope, x, V). #show rule/2.")
+
+    assert engine.run([]) == ("ERROR", [], {})
+    assert engine.run([]) == ("ERROR", [], {})
+
+
+def test_run_filters_other_atoms():
+    engine = ClingoEngine(
+        program="\n".join(
+            [
+                "rule(scope, a) :- active(scope).",
+                "rule(scope - 1, previous) :- active(scope).",
+                "other(scope, b) :- active(scope).",
+                "#show rule/2.",
+                "#show other/2.",
+            ]
+        )
+    )
+
+    assert engine.run([])[1] == ["a"]
+    assert engine.run([])[1] == ["a"]
+
+
+def test_add_program():
+    engine = ClingoEngine(program=PROGRAM)
+    engine.add_program("rule(scope, r3) :- active(scope), var(scope, y, 1).")
+    assert sorted(engine.run([PredicateAtom(predicate_name="var", terms=["y", "1"])])[1]) == ["r2", "r3"]
+
+    engine.add_program("rule(scope, r4) :- active(scope), var(scope, y, 1).")
+    assert sorted(engine.run([PredicateAtom(predicate_name="var", terms=["y", "1"])])[1]) == ["r2", "r3", "r4"]
+    assert engine.run([PredicateAtom(predicate_name="var", terms=["x", "1"])])[1] == ["r1"]
+
+
+def test_add_program_invalid():
+    engine = ClingoEngine(program=PROGRAM)
+    engine.run([])
+
+    engine.add_program("THIS IS WRONG DEFINITION")
+    assert engine.run([])[0] == "ERROR"
+
+
+def test_replace_program():
+    engine = ClingoEngine(program=PROGRAM)
+    assert engine.run([])[1] == ["r2"]
+
+    engine.replace_program("rule(scope, r3) :- active(scope). #show rule/2.")
+    assert engine.run([])[1] == ["r3"]
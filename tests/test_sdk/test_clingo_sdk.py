@@ -1,9 +1,18 @@
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from typing import List
 
 import pytest
+from clingo import Number, ast
 
-from json_logic_asp.sdk.clingo_sdk import run_clingo
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
+from json_logic_asp.sdk.clingo_sdk import (
+    run_clingo,
+    run_clingo_ast_program,
+    run_clingo_program,
+    run_clingo_scoped_ast_program,
+    run_clingo_scoped_program,
+)
 
 
 @pytest.mark.parametrize(
@@ -59,3 +68,198 @@ def test_run_clingo(problem, expected_status, expected_rules):
 
     assert status == expected_status
     assert rules == expected_rules
+
+
+@pytest.mark.parametrize(
+    "problem, expected_status, expected_rules",
+    [
+        (
+            "rule(a). rule(b). rule(c). #show rule/1.",
+            "SAT",
+            ["a", "b", "c"],
+        ),
+        (
+            "rule(a). :- rule(a). #show rule/1.",
+            "UNSAT",
+            [],
+        ),
+        (
+            "THIS IS WRONG DEFINITION",
+            "ERROR",
+            [],
+        ),
+    ],
+    ids=[
+        "simple",
+        "unsat",
+        "invalid_asp",
+    ],
+)
+def test_run_clingo_program(problem, expected_status, expected_rules):
+    status, rules, _ = run_clingo_program(program=problem)
+
+    assert status == expected_status
+    assert rules == expected_rules
+
+
+@pytest.mark.parametrize(
+    "problem, expected_status, expected_rules",
+    [
+        (
+            "rule(d1, a). rule(d2, a). rule(b). #show rule/2. #show rule/1.",
+            "SAT",
+            [("d1", "a"), ("d2", "a")],
+        ),
+        (
+            "THIS IS WRONG DEFINITION",
+            "ERROR",
+            [],
+        ),
+    ],
+    ids=[
+        "simple",
+        "invalid_asp",
+    ],
+)
+def test_run_clingo_scoped_program(problem, expected_status, expected_rules):
+    status, rules, _ = run_clingo_scoped_program(program=problem)
+
+    assert status == expected_status
+    assert rules == expected_rules
+
+
+@pytest.mark.parametrize(
+    "problem, expected_status, expected_rules, expected_models",
+    [
+        (
+            "rule(a). node(b). rule(c) :- not node(d), node(b). #show rule/1.",
+            "SAT",
+            ["a", "c"],
+            0,
+        ),
+        (
+            "rule(a). :- rule(a). #show rule/1.",
+            "UNSAT",
+            [],
+            0,
+        ),
+        (
+            "{node(a)}. rule(r1) :- not node(a). rule(r2). #show rule/1.",
+            "SAT",
+            ["r1", "r2"],
+            1,
+        ),
+    ],
+    ids=[
+        "grounded",
+        "conflicting",
+        "not_stratified",
+    ],
+)
+def test_run_clingo_program_stratified(problem, expected_status, expected_rules, expected_models):
+    status, rules, stats = run_clingo_program(program=problem, stratified=True)
+
+    assert status == expected_status
+    assert sorted(rules) == expected_rules
+    assert stats["summary"]["models"]["enumerated"] == expected_models
+
+
+def test_run_clingo_scoped_program_stratified():
+    status, rules, stats = run_clingo_scoped_program(
+        program="rule(d1, a). rule(d2, a) :- not node(d2). #show rule/2.",
+        stratified=True,
+    )
+
+    assert status == "SAT"
+    assert sorted(rules) == [("d1", "a"), ("d2", "a")]
+    assert stats["summary"]["models"]["enumerated"] == 0
+
+
+def test_run_clingo_stratified():
+    with NamedTemporaryFile(mode="w+", encoding="utf-8", suffix=".lp", delete=False) as file:
+        file.write("rule(a). #show rule/1.\n")
+
+    file_path = Path(file.name)
+    status, rules, stats = run_clingo(absolute_file_path=str(file_path.absolute()), stratified=True)
+    file_path.unlink()
+
+    assert status == "SAT"
+    assert rules == ["a"]
+    assert stats["summary"]["models"]["enumerated"] == 0
+
+
+@pytest.mark.parametrize(
+    "problem, facts, expected_status, expected_rules",
+    [
+        (
+            "rule(a). rule(b) :- var(x, 1). rule(c) :- var(x, y). #show rule/1.",
+            [PredicateAtom("var", ["x", "1"])],
+            "SAT",
+            ["a", "b"],
+        ),
+        (
+            "rule(a) :- var(x, 1). :- rule(a). #show rule/1.",
+            [PredicateAtom("var", ["x", "1"])],
+            "UNSAT",
+            [],
+        ),
+        (
+            "rule(a) :- var(x, X), X / 0 > 1. #show rule/1.",
+            [PredicateAtom("var", ["x", "1"])],
+            "SAT",
+            [],
+        ),
+    ],
+    ids=[
+        "simple",
+        "unsat",
+        "undefined_operation",
+    ],
+)
+def test_run_clingo_ast_program(problem, facts, expected_status, expected_rules):
+    program: List[ast.AST] = []
+    ast.parse_string(problem, program.append)
+
+    status, rules, _ = run_clingo_ast_program(program=program, facts=facts)
+
+    assert status == expected_status
+    assert sorted(rules) == expected_rules
+
+
+def test_run_clingo_ast_program_stratified():
+    program: List[ast.AST] = []
+    ast.parse_string("rule(a) :- var(x, 1). #show rule/1.", program.append)
+
+    status, rules, stats = run_clingo_ast_program(
+        program=program, facts=[PredicateAtom("var", ["x", "1"])], stratified=True
+    )
+
+    assert status == "SAT"
+    assert rules == ["a"]
+    assert stats["summary"]["models"]["enumerated"] == 0
+
+
+def test_run_clingo_ast_program_invalid():
+    location = ast.Location(ast.Position("<test>", 1, 1), ast.Position("<test>", 1, 1))
+    program = [ast.SymbolicTerm(location, Number(1))]
+
+    assert run_clingo_ast_program(program=program, facts=[]) == ("ERROR", [], {})
+    assert run_clingo_scoped_ast_program(program=program, facts=[]) == ("ERROR", [], {})
+
+
+def test_run_clingo_scoped_ast_program():
+    program: List[ast.AST] = []
+    ast.parse_string("rule(D, a) :- record(D), var(D, x, 1). #show rule/2.", program.append)
+
+    status, rules, _ = run_clingo_scoped_ast_program(
+        program=program,
+        facts=[
+            PredicateAtom("record", ["d1"]),
+            PredicateAtom("record", ["d2"]),
+            PredicateAtom("var", ["d1", "x", "1"]),
+            PredicateAtom("var", ["d2", "x", "2"]),
+        ],
+    )
+
+    assert status == "SAT"
+    assert rules == [("d1", "a")]
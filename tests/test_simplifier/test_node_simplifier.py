@@ -1,4 +1,5 @@
 import inspect
+from typing import Dict
 from unittest.mock import MagicMock, patch
 
 from json_logic_asp.simplifier.node_simplifier import SIMPLIFIABLE_OPERATIONS, simplify_node
@@ -23,6 +24,25 @@ def test_simplify_node_unknown_operation():
     mock_simplifier.assert_not_called()
 
 
+def test_simplify_node_nested_operations():
+    shared_node = {"or": [{"var": "a"}, False]}
+    node = {"and": [shared_node, {"and": [{"!": shared_node}, {"!": [{"and": []}]}]}, {"==": [{"var": "b"}, 1]}]}
+
+    assert simplify_node(node) == {"and": [{"var": "a"}, {"!": {"var": "a"}}, {"==": [{"var": "b"}, 1]}]}
+    assert simplify_node({"and": [False, {}]}) is False
+
+
+def test_simplify_node_deep_operations():
+    and_node: Dict = {"var": "a0"}
+    not_node: Dict = {"!!": True}
+    for i in range(1, 10000):
+        and_node = {"and": [{"var": f"a{i}"}, {"or": [and_node, False]}]}
+        not_node = {"!": not_node}
+
+    assert simplify_node(and_node) == {"and": [{"var": f"a{i}"} for i in reversed(range(10000))]}
+    assert simplify_node(not_node) is False
+
+
 def test_simplifiable_operations_functions():
     for key, method in SIMPLIFIABLE_OPERATIONS.items():
         assert isinstance(key, str)
@@ -1,5 +1,12 @@
 from json_logic_asp.models.translator_dto import DataInput
-from json_logic_asp.translator.data_generator import __flatten_data, generate_single_data_asp_definition
+from json_logic_asp.translator.data_generator import (
+    __flatten_data,
+    generate_multiple_data_asp_atoms,
+    generate_multiple_data_asp_definition,
+    generate_single_data_asp_atoms,
+    generate_single_data_asp_definition,
+    generate_single_data_native_values,
+)
 
 
 def test_flatten_data():
@@ -64,3 +71,79 @@ def test_generate_single_data_asp_definition_with_comments():
     expected = f"{c0}\n{l0}\n{c1}\n{l1}"
 
     assert generate_single_data_asp_definition(di, with_comments=True) == expected
+
+
+def test_generate_single_data_asp_atoms():
+    di = DataInput(
+        data_object={
+            "a": "b",
+            "c": {
+                "d": 1,
+            },
+        }
+    )
+
+    atoms = generate_single_data_asp_atoms(di)
+
+    assert [atom.to_asp_atom() for atom in atoms] == [
+        "var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f)",
+        "var(se093e60cd3981d0482ad2424b965c171, 1)",
+    ]
+
+
+def test_generate_single_data_native_values():
+    di = DataInput(
+        data_object={
+            "a": "b",
+            "c": {
+                "d": 1,
+            },
+        }
+    )
+
+    assert generate_single_data_native_values(di) == {
+        "a": (1, "s92eb5ffee6ae2fec3ad71c777531578f"),
+        "c.d": (0, 1),
+    }
+
+
+def test_generate_multiple_data_asp_definition():
+    data_inputs = [
+        DataInput(data_id="d1", data_object={"a": "b"}),
+        DataInput(data_id="d2", data_object={"a": 1}),
+        DataInput(data_id="d1", data_object={"a": 2}),
+    ]
+
+    definition, mapping = generate_multiple_data_asp_definition(data_inputs, with_comments=True)
+
+    assert definition == "\n".join(
+        [
+            "% d1",
+            "record(s9948c645c094247794f4c7acdbeb2bb6).",
+            "% a : b",
+            "var(s9948c645c094247794f4c7acdbeb2bb6, s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
+            "% d2",
+            "record(sb25b0651e4b6e887e5194135d3692631).",
+            "% a : 1",
+            "var(sb25b0651e4b6e887e5194135d3692631, s0cc175b9c0f1b6a831c399e269772661, 1).",
+        ]
+    )
+    assert mapping == {
+        "s9948c645c094247794f4c7acdbeb2bb6": "d1",
+        "sb25b0651e4b6e887e5194135d3692631": "d2",
+    }
+
+
+def test_generate_multiple_data_asp_atoms():
+    data_inputs = [
+        DataInput(data_id="d1", data_object={"a": "b"}),
+        DataInput(data_id="d1", data_object={"a": 2}),
+    ]
+
+    atoms, mapping = generate_multiple_data_asp_atoms(data_inputs)
+
+    assert [atom.to_asp_atom() for atom in atoms] == [
+        "record(s9948c645c094247794f4c7acdbeb2bb6)",
+        "var(s9948c645c094247794f4c7acdbeb2bb6, s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f)",
+    ]
+    assert mapping == {"s9948c645c094247794f4c7acdbeb2bb6": "d1"}
@@ -4,7 +4,7 @@ import pytest
 
 from json_logic_asp.models.translator_dto import DataInput, RuleInput, RuleOutput
 from json_logic_asp.translator import translate_multi_rule_eval, translate_single_rule_eval
-from tests.fixtures import cuid_fixture  # noqa
+from tests.fixtures import content_id_fixture, cuid_fixture  # noqa
 
 
 @pytest.mark.parametrize(
@@ -86,7 +86,7 @@ def test_translate_multi_rule_eval_simple():
         "var(sd95e8ab9a13affcd43b13b0b5443d484, s363b122c528f54df4a0446b6bab05515).",
         "",
         "% a EQ b",
-        "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, V1), V1 == s92eb5ffee6ae2fec3ad71c777531578f.",
+        "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
         "and(mock3) :- eq(mock2).",
         "% c GT d",
         "gt(mock5) :- var(s4a8a08f09d37b73795649038408b5f33, V1), V1 > s8277e0910d750195b448797616e091ad.",
@@ -171,7 +171,7 @@ def test_translate_single_rule_eval_simple():
         "var(s08a6c56ffa6dc13f368e7e73c0ca58ec, s865c0c0b4ab0e063e5caa3387c1a8741).",
         "",
         "% a EQ b",
-        "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, V1), V1 == s92eb5ffee6ae2fec3ad71c777531578f.",
+        "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
         "and(mock3) :- eq(mock2).",
         "% test",
         "rule(s098f6bcd4621d373cade4e832627b4f6) :- and(mock3).",
@@ -0,0 +1,97 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from json_logic_asp.adapters.json_logic.jl_array_nodes import ArrayInNode
+from json_logic_asp.adapters.json_logic.jl_data_nodes import DataVarNode
+from json_logic_asp.adapters.json_logic.jl_logic_nodes import LogicEqualNode, LogicEvalNode
+from json_logic_asp.constants.asp_naming import PredicateNames, VariableNames
+from json_logic_asp.models.json_logic_nodes import JsonLogicNode, JsonLogicSingleDataNode, JsonLogicTreeNode
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.translator.data_generator import generate_single_data_native_values
+from json_logic_asp.translator.function_generator import RuleFunction, generate_rule_function
+from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_statements
+from tests.test_invoker.test_native import DIFFERENTIAL_DATA, DIFFERENTIAL_RULES
+
+EXTRA_RULES: List[Dict[str, Any]] = [
+    {"==": [{"var": "a"}, {"var": "c"}, "b"]},
+    {"<": [1, {"var": "n"}]},
+    {"in": [{"var": "a"}, {"merge": ["b", "c"]}]},
+    {"or": [{"var": "a"}, {"var": "c"}, {"missing": "n"}]},
+    {"or": [False, {"var": "a"}, {"var": "n"}]},
+    {"and": [{"var": "a"}, {"var": "n"}, {"missing": "d"}]},
+    {"and": [{"var": "a"}, {"var": "c"}]},
+    {"and": [{"missing": "d"}, {"<": [{"var": "n"}, 5]}, {"!": {"var": "a"}}]},
+    {"or": [False]},
+    {"and": [True, {"merge": [{"var": "a"}]}]},
+    {"if": [{"var": "n"}, {"var": "a"}]},
+    {"if": [{"==": [{"var": "n"}, 3]}, {"var": "a"}, {"missing": "a"}, True]},
+]
+
+
+def test_generate_rule_function_matches_native():
+    root_nodes: Dict[str, JsonLogicNode] = {}
+    generate_multiple_rule_asp_statements(
+        rule_inputs=[
+            RuleInput(rule_id=f"rule{i}", rule_tree=rule_tree)
+            for i, rule_tree in enumerate([*DIFFERENTIAL_RULES, *EXTRA_RULES])
+        ],
+        rule_root_nodes=root_nodes,
+    )
+
+    function_cache: Dict[int, RuleFunction] = {}
+    rule_functions = {
+        rule_id: generate_rule_function(root_node, function_cache) for rule_id, root_node in root_nodes.items()
+    }
+
+    for data_object in DIFFERENTIAL_DATA:
+        data_values = generate_single_data_native_values(DataInput(data_object=data_object))
+        for rule_id, root_node in root_nodes.items():
+            assert rule_functions[rule_id](data_values) == root_node.evaluate(data_values), (rule_id, data_object)
+
+
+def test_generate_rule_function_cache():
+    node = LogicEqualNode(DataVarNode("a"), 1)
+    function_cache: Dict[int, RuleFunction] = {}
+
+    rule_function = generate_rule_function(node, function_cache)
+
+    assert function_cache == {id(node): rule_function}
+    assert generate_rule_function(node, function_cache) is rule_function
+    assert generate_rule_function(node) is not rule_function
+
+
+def test_generate_rule_function_not_supported():
+    class FakeNode(JsonLogicTreeNode):
+        def __init__(self):
+            super().__init__(operation_name=PredicateNames.RULE)
+
+        def get_asp_statements(self):
+            return []
+
+    class FakeDataNode(JsonLogicSingleDataNode):
+        def __init__(self):
+            super().__init__(term_variable_name=VariableNames.VAR, operation_name=PredicateNames.DATA_VAR)
+
+        def get_asp_statements(self):
+            return []
+
+        def __str__(self):
+            return "FAKE"
+
+        def __hash__(self):
+            return hash("FAKE")
+
+    class FakeEvalNode(LogicEvalNode):
+        def __init__(self, *children):
+            super().__init__(*children, comparator="~", predicate=PredicateNames.LOGIC_EQUALS)
+
+    for node, node_name in [
+        (FakeNode(), "FakeNode"),
+        (LogicEqualNode(FakeDataNode(), 2, 3), "FakeDataNode"),
+        (ArrayInNode(FakeDataNode(), [2, 3]), "FakeDataNode"),
+        (FakeEvalNode(DataVarNode("a"), 2), "FakeEvalNode"),
+    ]:
+        with pytest.raises(NotImplementedError) as exc:
+            generate_rule_function(node)
+        assert exc.match(f"{node_name} cannot be compiled to a Python function")
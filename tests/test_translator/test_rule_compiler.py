@@ -0,0 +1,186 @@
+from typing import Dict, List
+
+import pytest
+
+from json_logic_asp.adapters.json_logic.jl_boolean_nodes import BooleanAndNode, BooleanNotNode
+from json_logic_asp.adapters.json_logic.jl_data_nodes import DataMissingNode, DataVarNode
+from json_logic_asp.adapters.json_logic.jl_logic_nodes import LogicEqualNode
+from json_logic_asp.constants.json_logic_ops import JsonLogicOps
+from json_logic_asp.models.asp_base import Statement
+from json_logic_asp.models.json_logic_nodes import JsonLogicNode, JsonLogicTreeNode
+from json_logic_asp.translator.rule_compiler import SUPPORTED_NODE_TYPES, RuleCompiler
+from json_logic_asp.utils.id_management import __generate_md5_content_id
+from tests.fixtures import content_id_fixture, cuid_fixture  # noqa
+
+
+class DummyTestNode(JsonLogicTreeNode):
+    def get_asp_statements(self) -> List[Statement]:
+        return []
+
+
+def test_rule_compiler_dispatch_table():
+    rule_compiler = RuleCompiler(custom_nodes={"op": DummyTestNode})
+
+    assert rule_compiler.node_types["=="] is SUPPORTED_NODE_TYPES[JsonLogicOps.LOGIC_EQ]
+    assert rule_compiler.node_types["op"] is DummyTestNode
+    assert dict(rule_compiler.custom_nodes) == {"op": DummyTestNode}
+    with pytest.raises(TypeError):
+        rule_compiler.node_types["other"] = DummyTestNode  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "custom_nodes",
+    [{1: DummyTestNode}, {"op": None}, {"op": dict}],
+    ids=[
+        "non_str_key",
+        "non_class",
+        "non_node_class",
+    ],
+)
+def test_rule_compiler_invalid_custom_nodes(custom_nodes):
+    with pytest.raises(ValueError):
+        RuleCompiler(custom_nodes=custom_nodes)
+
+
+@pytest.mark.parametrize(
+    "node",
+    ["abc", {"a": "b", "c": "d"}, {123: "b"}, {"wrong key": "b"}],
+    ids=[
+        "non_dict",
+        "multi_key",
+        "non_str_key",
+        "unknown_op",
+    ],
+)
+def test_rule_compiler_is_node_invalid_nodes(node):
+    assert not RuleCompiler().is_node(node)
+
+
+def test_rule_compiler_is_node_standard_op():
+    assert RuleCompiler().is_node({"==": []})
+    # Known operations without a node are still nodes, so they are reported when parsed
+    assert RuleCompiler().is_node({"missing_some": []})
+
+
+def test_rule_compiler_is_node_custom_op():
+    assert RuleCompiler(custom_nodes={"op": DummyTestNode}).is_node({"op": []})
+    assert not RuleCompiler().is_node({"op": []})
+
+
+@pytest.mark.parametrize(
+    "json_logic_dict, json_logic_obj",
+    [
+        ({"var": "abc"}, DataVarNode("abc")),
+        ({"missing": "a"}, DataMissingNode("a")),
+        ({"==": [{"var": "acd"}, "b"]}, LogicEqualNode(DataVarNode("acd"), "b")),
+        (
+            {
+                "and": [
+                    {"==": [{"var": "a"}, "b"]},
+                    {"missing": "c"},
+                ]
+            },
+            BooleanAndNode(LogicEqualNode(DataVarNode("a"), "b"), DataMissingNode("c")),
+        ),
+        (
+            {
+                "!": {"var": "a"},
+            },
+            BooleanNotNode(DataVarNode("a")),
+        ),
+    ],
+    ids=[
+        "var",
+        "missing",
+        "equals",
+        "and",
+        "not",
+    ],
+)
+def test_rule_compiler_parse(json_logic_dict, json_logic_obj):
+    assert RuleCompiler().parse(json_logic_dict) == json_logic_obj
+
+
+def test_rule_compiler_parse_unknown_op():
+    with pytest.raises(NotImplementedError) as e:
+        RuleCompiler().parse({"op": "a"})
+
+    assert e.match("Node op is not yet implemented")
+
+
+def test_rule_compiler_parse_custom_op():
+    rule_compiler = RuleCompiler(custom_nodes={"op": DummyTestNode})
+    assert rule_compiler.parse({"op": "a"}) == DummyTestNode("a")
+
+
+def test_rule_compiler_parse_interned_nodes():
+    node_cache: Dict[str, JsonLogicNode] = {}
+    rule_compiler = RuleCompiler(node_cache=node_cache)
+
+    first_node = rule_compiler.parse({"and": [{"==": [{"var": "a"}, 1]}, {"var": "b"}]})
+    second_node = rule_compiler.parse({"or": [{"==": [{"var": "a"}, 1]}, {"var": "b"}]})
+
+    assert rule_compiler.node_cache is node_cache
+    assert first_node.child_nodes[0] is second_node.child_nodes[0]
+    assert first_node.child_nodes[1] is second_node.child_nodes[1]
+    assert first_node.child_nodes[0].child_nodes[0] is rule_compiler.parse({"var": "a"})
+    assert set(node_cache.values()) == {
+        first_node,
+        second_node,
+        first_node.child_nodes[0],
+        first_node.child_nodes[1],
+        first_node.child_nodes[0].child_nodes[0],
+    }
+
+
+def test_rule_compiler_parse_interned_leaves():
+    rule_compiler = RuleCompiler()
+
+    assert rule_compiler.parse({"var": "a"}) is rule_compiler.parse({"var": "a"})
+    assert rule_compiler.parse({"var": "a"}) is not rule_compiler.parse({"missing": "a"})
+
+
+def test_rule_compiler_parse_existing_node_cache():
+    existing_node = DataVarNode("a")
+    rule_compiler = RuleCompiler(node_cache={str(hash(existing_node)): existing_node})
+
+    assert rule_compiler.parse({"var": "a"}) is existing_node
+
+
+def test_rule_compiler_parse_unknown_nested_op():
+    with pytest.raises(NotImplementedError) as e:
+        RuleCompiler().parse({"and": [{"var": "a"}, {"!": {"+": [1, 2]}}]})
+
+    assert e.match("Node \\+ is not yet implemented")
+
+
+def test_rule_compiler_parse_deep_rule():
+    rule: Dict = {"var": "a"}
+    for _ in range(10000):
+        rule = {"and": [{"var": "b"}, {"!": rule}]}
+
+    node = RuleCompiler().parse(rule)
+
+    depth = 0
+    while isinstance(node, BooleanAndNode):
+        assert node.child_nodes[0] == DataVarNode("b")
+        node = node.child_nodes[1].child_nodes[0]
+        depth += 1
+    assert depth == 10000
+    assert node == DataVarNode("a")
+
+
+def test_rule_compiler_commutative_node_ids(content_id_fixture):  # noqa: F811
+    content_id_fixture.side_effect = __generate_md5_content_id
+    left = {"==": [{"var": "a"}, "b"]}
+    right = {">": [{"var": "x"}, 3]}
+    rule_trees = [{"and": [left, right]}, {"and": [right, left]}, {"==": ["b", {"var": "a"}]}]
+
+    def get_node_ids(trees):
+        rule_compiler = RuleCompiler()
+        return [rule_compiler.parse(tree).node_id for tree in trees]
+
+    # Ids do not depend on which of the permuted subtrees is parsed first
+    assert get_node_ids(rule_trees) == get_node_ids(rule_trees[::-1])[::-1]
+    assert get_node_ids(rule_trees[:1]) == get_node_ids(rule_trees[1:2])
+    assert get_node_ids(rule_trees[2:]) == [RuleCompiler().parse(left).node_id]
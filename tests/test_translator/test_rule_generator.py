@@ -1,22 +1,31 @@
+import io
+import os
+import subprocess
+import sys
 from typing import Dict, List
 from unittest.mock import patch
 
 import pytest
+from clingo import Control, ast
 
-from json_logic_asp.adapters.json_logic.jl_boolean_nodes import BooleanAndNode, BooleanNotNode
-from json_logic_asp.adapters.json_logic.jl_data_nodes import DataMissingNode, DataVarNode
-from json_logic_asp.adapters.json_logic.jl_logic_nodes import LogicEqualNode
+from json_logic_asp.adapters.asp.asp_literals import PredicateAtom
 from json_logic_asp.models.asp_base import Statement
 from json_logic_asp.models.json_logic_nodes import JsonLogicNode, JsonLogicTreeNode
-from json_logic_asp.models.translator_dto import RuleInput
-from json_logic_asp.translator import generate_multiple_rule_asp_definition, generate_single_rule_asp_definition
-from json_logic_asp.translator.rule_generator import (
-    SUPPORTED_NODE_TYPES,
-    __get_or_update_cache,
-    __is_valid_json_logic_node,
-    __parse_json_logic_node,
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.translator import (
+    generate_multiple_rule_asp_definition,
+    generate_multiple_rule_asp_statements,
+    generate_single_rule_asp_definition,
+    render_asp_statements,
+    stream_multiple_rule_asp_definition,
+    write_multiple_rule_asp_definition,
 )
-from tests.fixtures import cuid_fixture  # noqa
+from json_logic_asp.translator.data_generator import generate_single_data_asp_definition
+from json_logic_asp.translator.rule_compiler import RuleCompiler
+from json_logic_asp.translator.rule_generator import __translate_rule_inputs_partition
+from json_logic_asp.translator.translation_cache import TranslationCache
+from json_logic_asp.utils.id_management import __generate_md5_content_id, generate_constant_string
+from tests.fixtures import content_id_fixture, cuid_fixture  # noqa
 
 
 class DummyTestNode(JsonLogicTreeNode):
@@ -24,90 +33,6 @@ class DummyTestNode(JsonLogicTreeNode):
         return []
 
 
-def test_get_or_update_cache_not_present():
-    dummy_new_node = DummyTestNode(operation_name="test")
-    assert __get_or_update_cache(dummy_new_node, {}) == dummy_new_node
-
-
-def test_get_or_update_cache_present():
-    dummy_existing_node = DummyTestNode(operation_name="test2")
-    dummy_new_node = DummyTestNode(operation_name="test")
-
-    node_cache: Dict[str, JsonLogicNode] = {str(hash(dummy_new_node)): dummy_existing_node}
-    cached_node = __get_or_update_cache(dummy_new_node, node_cache)
-
-    assert dummy_new_node != cached_node == dummy_existing_node
-
-
-@pytest.mark.parametrize(
-    "node",
-    ["abc", {"a": "b", "c": "d"}, {123: "b"}, {"wrong key": "b"}],
-    ids=[
-        "non_dict",
-        "multi_key",
-        "non_str_key",
-        "unknown_op",
-    ],
-)
-def test_is_valid_json_logic_node_invalid_nodes(node):
-    assert not __is_valid_json_logic_node(node, list(SUPPORTED_NODE_TYPES.keys()))
-
-
-def test_is_valid_json_logic_node_standard_op():
-    assert __is_valid_json_logic_node({"==": []}, [])
-
-
-def test_is_valid_json_logic_node_custom_op():
-    assert __is_valid_json_logic_node({"op": []}, ["op"])
-
-
-@pytest.mark.parametrize(
-    "json_logic_dict, json_logic_obj",
-    [
-        ({"var": "abc"}, DataVarNode("abc")),
-        ({"missing": "a"}, DataMissingNode("a")),
-        ({"==": [{"var": "acd"}, "b"]}, LogicEqualNode(DataVarNode("acd"), "b")),
-        (
-            {
-                "and": [
-                    {"==": [{"var": "a"}, "b"]},
-                    {"missing": "c"},
-                ]
-            },
-            BooleanAndNode(LogicEqualNode(DataVarNode("a"), "b"), DataMissingNode("c")),
-        ),
-        (
-            {
-                "!": {"var": "a"},
-            },
-            BooleanNotNode(DataVarNode("a")),
-        ),
-    ],
-    ids=[
-        "var",
-        "missing",
-        "equals",
-        "and",
-        "not",
-    ],
-)
-def test_parse_json_logic_node(json_logic_dict, json_logic_obj):
-    assert __parse_json_logic_node(json_logic_dict, {}, {}) == json_logic_obj
-
-
-def test_parse_json_logic_node_unknown_op():
-    with pytest.raises(NotImplementedError) as e:
-        __parse_json_logic_node({"op": "a"}, {}, {})
-
-    assert e.match("Node op is not yet implemented")
-
-
-def test_parse_json_logic_node_custom_op():
-    custom_nodes = {"op": DummyTestNode}
-    res_node = DummyTestNode("a")
-    assert __parse_json_logic_node({"op": "a"}, {}, custom_nodes) == res_node
-
-
 @pytest.mark.parametrize(
     "rule_inputs, with_comments, custom_nodes, expected_statements, expected_mapping",
     [
@@ -121,7 +46,7 @@ def test_parse_json_logic_node_custom_op():
             False,
             None,
             [
-                "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, V1), V1 == s92eb5ffee6ae2fec3ad71c777531578f.",
+                "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
                 "and(mock3) :- eq(mock2).",
                 "rule(s098f6bcd4621d373cade4e832627b4f6) :- and(mock3).",
             ],
@@ -138,7 +63,7 @@ def test_parse_json_logic_node_custom_op():
             None,
             [
                 "% a EQ b",
-                "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, V1), V1 == s92eb5ffee6ae2fec3ad71c777531578f.",
+                "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
                 "and(mock3) :- eq(mock2).",
                 "% test",
                 "rule(s098f6bcd4621d373cade4e832627b4f6) :- and(mock3).",
@@ -160,7 +85,7 @@ def test_parse_json_logic_node_custom_op():
             None,
             [
                 "% a EQ b",
-                "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, V1), V1 == s92eb5ffee6ae2fec3ad71c777531578f.",
+                "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
                 "and(mock3) :- eq(mock2).",
                 "% c LT d",
                 "lt(mock5) :- var(s4a8a08f09d37b73795649038408b5f33, V1), V1 < s8277e0910d750195b448797616e091ad.",
@@ -190,13 +115,13 @@ def test_parse_json_logic_node_custom_op():
             None,
             [
                 "% a EQ b",
-                "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, V1), V1 == s92eb5ffee6ae2fec3ad71c777531578f.",
+                "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
                 "and(mock3) :- eq(mock2).",
-                "or(mock6) :- eq(mock2).",
+                "or(mock4) :- eq(mock2).",
                 "% test1",
                 "rule(s5a105e8b9d40e1329780d62ea2265d8a) :- and(mock3).",
                 "% test2",
-                "rule(sad0234829205b9033196ba818f7a872b) :- or(mock6).",
+                "rule(sad0234829205b9033196ba818f7a872b) :- or(mock4).",
             ],
             {
                 "s5a105e8b9d40e1329780d62ea2265d8a": "test1",
@@ -285,9 +210,376 @@ def test_generate_single_rule_asp_definition_simple():
     assert asp_definition == "\n".join(
         [
             "% a EQ b",
-            "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, V1), V1 == s92eb5ffee6ae2fec3ad71c777531578f.",
+            "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
             "and(mock3) :- eq(mock2).",
             "% test",
             "rule(s098f6bcd4621d373cade4e832627b4f6) :- and(mock3).",
         ]
     )
+
+
+def test_generate_multiple_rule_asp_statements():
+    ri = RuleInput(
+        rule_id="test",
+        rule_tree={"and": {"==": [{"var": "a"}, "b"]}},
+    )
+
+    statements, mapping = generate_multiple_rule_asp_statements([ri])
+
+    assert [statement.to_asp_statement() for statement in statements] == [
+        "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
+        "and(mock3) :- eq(mock2).",
+        "rule(s098f6bcd4621d373cade4e832627b4f6) :- and(mock3).",
+    ]
+    assert mapping == {"s098f6bcd4621d373cade4e832627b4f6": "test"}
+
+
+def test_generate_multiple_rule_asp_statements_rule_statements():
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test2", rule_tree={"and": [{"==": [{"var": "a"}, "b"]}, {"missing": "c"}]}),
+    ]
+    rule_statements: Dict[str, List[Statement]] = {}
+
+    statements, mapping = generate_multiple_rule_asp_statements(rule_inputs, rule_statements=rule_statements)
+
+    assert list(rule_statements) == list(mapping)
+    rule1_statements, rule2_statements = [
+        [statement.to_asp_statement() for statement in rule_statements[hashed_id]] for hashed_id in mapping
+    ]
+    assert rule1_statements[-1].startswith("rule(s")
+    assert rule2_statements[-1].startswith("rule(s")
+    assert rule1_statements[0] in rule2_statements
+    assert {statement.to_asp_statement() for statement in statements} == {*rule1_statements, *rule2_statements}
+
+
+def test_generate_multiple_rule_asp_statements_shared_nodes():
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test2", rule_tree={"and": [{"==": [{"var": "a"}, "b"]}, {"missing": "c"}]}),
+    ]
+
+    statements, _ = generate_multiple_rule_asp_statements(rule_inputs)
+
+    assert [statement.to_asp_statement() for statement in statements] == [
+        "eq(mock2) :- var(s0cc175b9c0f1b6a831c399e269772661, s92eb5ffee6ae2fec3ad71c777531578f).",
+        "missing(mock3) :- not var(s4a8a08f09d37b73795649038408b5f33, _).",
+        "and(mock4) :- eq(mock2), missing(mock3).",
+        "rule(s5a105e8b9d40e1329780d62ea2265d8a) :- eq(mock2).",
+        "rule(sad0234829205b9033196ba818f7a872b) :- and(mock4).",
+    ]
+
+
+@pytest.mark.parametrize("with_comments", [False, True], ids=["no_comments", "with_comments"])
+def test_write_multiple_rule_asp_definition(with_comments):
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test2", rule_tree={"and": [{"==": [{"var": "a"}, "b"]}, {"missing": "c"}]}),
+        RuleInput(rule_id="test3", rule_tree={"==": [{"var": "a"}, "b"]}),
+    ]
+    buffer = io.StringIO()
+
+    mapping = write_multiple_rule_asp_definition(rule_inputs, buffer.write, with_comments=with_comments)
+
+    definition, expected_mapping = generate_multiple_rule_asp_definition(rule_inputs, with_comments=with_comments)
+    assert buffer.getvalue() == f"{definition}\n"
+    assert mapping == expected_mapping
+
+
+def test_write_multiple_rule_asp_definition_streamed():
+    lines: List[str] = []
+    written_lines: List[int] = []
+
+    def iter_rule_inputs():
+        for rule_id in ["test1", "test2"]:
+            written_lines.append(len(lines))
+            yield RuleInput(rule_id=rule_id, rule_tree={"missing": rule_id})
+
+    write_multiple_rule_asp_definition(iter_rule_inputs(), lines.append)
+
+    # Statements of the first rule are written before reading the second one, and root statements go at the end
+    assert written_lines == [0, 1]
+    assert [line.split("(")[0] for line in lines] == ["missing", "missing", "rule", "rule"]
+
+
+@pytest.mark.parametrize("with_comments", [False, True], ids=["no_comments", "with_comments"])
+def test_stream_multiple_rule_asp_definition(with_comments):
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test2", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test3", rule_tree={"and": [{"==": [{"var": "a"}, "b"]}, {"missing": "c"}]}),
+    ]
+    lines: List[str] = []
+    mapping: Dict[str, str] = {}
+
+    def write_mapping(hashed_id, rule_id):
+        lines.append(f"mapping {rule_id}")
+        mapping[hashed_id] = rule_id
+
+    stream_multiple_rule_asp_definition(iter(rule_inputs), lines.append, write_mapping, with_comments=with_comments)
+
+    definition, expected_mapping = generate_multiple_rule_asp_definition(rule_inputs, with_comments=with_comments)
+    assert mapping == expected_mapping
+    assert sorted(line for line in lines if not line.startswith("mapping")) == sorted(
+        f"{line}\n" for line in definition.splitlines()
+    )
+    # Root statements and mapping entries are written along with the next line, so they follow their rule statements
+    assert [line.split("(")[0].strip() for line in lines if not line.startswith("%")] == [
+        "mapping test1",
+        "eq",
+        "rule",
+        "rule",
+        "mapping test2",
+        "mapping test3",
+        "missing",
+        "and",
+        "rule",
+    ]
+
+
+def test_write_multiple_rule_asp_definition_translation_cache():
+    translation_cache = TranslationCache()
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test2", rule_tree={"==": [{"var": "a"}, "b"]}),
+    ]
+    buffer = io.StringIO()
+
+    write_multiple_rule_asp_definition(rule_inputs, buffer.write, translation_cache=translation_cache)
+
+    assert (translation_cache.hits, translation_cache.misses) == (1, 1)
+    assert buffer.getvalue() == f"{generate_multiple_rule_asp_definition(rule_inputs)[0]}\n"
+
+
+def test_write_multiple_rule_asp_definition_clingo_builder():
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test2", rule_tree={"and": [{"==": [{"var": "a"}, "b"]}, {"missing": "c"}]}),
+        RuleInput(rule_id="test3", rule_tree={"missing": "a"}),
+    ]
+    control = Control(["--warn=none"])
+
+    with ast.ProgramBuilder(control) as builder:
+        mapping = write_multiple_rule_asp_definition(rule_inputs, lambda line: ast.parse_string(line, builder.add))
+        ast.parse_string(generate_single_data_asp_definition(DataInput(data_object={"a": "b"})), builder.add)
+        ast.parse_string("#show rule/1.", builder.add)
+
+    control.ground([("base", [])])
+    with control.solve(yield_=True) as handle:
+        model = next(iter(handle))
+        assert sorted(mapping[str(symbol.arguments[0])] for symbol in model.symbols(shown=True)) == ["test1", "test2"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"with_comments": True},
+        {"parameterize": True},
+        {"rule_compiler": RuleCompiler(custom_nodes={"op": DummyTestNode})},
+    ],
+    ids=[
+        "simple",
+        "with_comments",
+        "parameterize",
+        "rule_compiler",
+    ],
+)
+def test_generate_multiple_rule_asp_definition_workers(content_id_fixture, kwargs):  # noqa: F811
+    # Worker processes do not share the mocked ids, so the real content ids are used
+    content_id_fixture.side_effect = __generate_md5_content_id
+    rule_inputs = [
+        *[RuleInput(rule_id=f"test{i}", rule_tree={">": [{"var": "a"}, i % 3]}) for i in range(10)],
+        *[RuleInput(rule_id=f"op{i}", rule_tree={"op": "dummy"}) for i in range(2) if "rule_compiler" in kwargs],
+        RuleInput(rule_id="shared", rule_tree={"and": [{">": [{"var": "a"}, 1]}, {"missing": "b"}]}),
+    ]
+    rule_groups: Dict[str, List[str]] = {}
+    parallel_rule_groups: Dict[str, List[str]] = {}
+
+    definition, mapping = generate_multiple_rule_asp_definition(rule_inputs, rule_groups=rule_groups, **kwargs)
+    parallel_definition, parallel_mapping = generate_multiple_rule_asp_definition(
+        rule_inputs, rule_groups=parallel_rule_groups, workers=2, **kwargs
+    )
+
+    assert parallel_definition == definition
+    assert parallel_mapping == mapping
+    assert list(parallel_rule_groups.items()) == list(rule_groups.items())
+
+
+def test_generate_multiple_rule_asp_definition_workers_permuted_rules(content_id_fixture):  # noqa: F811
+    content_id_fixture.side_effect = __generate_md5_content_id
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"and": [{"==": [{"var": "a"}, "b"]}, {">": [{"var": "x"}, 3]}]}),
+        RuleInput(rule_id="test2", rule_tree={"and": [{">": [{"var": "x"}, 3]}, {"==": [{"var": "a"}, "b"]}]}),
+    ]
+    rule_groups: Dict[str, List[str]] = {}
+    parallel_rule_groups: Dict[str, List[str]] = {}
+
+    definition, mapping = generate_multiple_rule_asp_definition(rule_inputs, rule_groups=rule_groups)
+    parallel_definition, parallel_mapping = generate_multiple_rule_asp_definition(
+        rule_inputs, rule_groups=parallel_rule_groups, workers=2
+    )
+
+    assert parallel_definition == definition
+    assert parallel_mapping == mapping
+    assert list(parallel_rule_groups.items()) == list(rule_groups.items())
+    assert len(rule_groups) == 1
+
+
+def test_translate_rule_inputs_partition():
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"missing": "a"}),
+        RuleInput(rule_id="test2", rule_tree={"missing": "a"}),
+    ]
+
+    node_lines, root_lines, mapping, rule_groups = __translate_rule_inputs_partition(
+        rule_inputs, with_comments=True, custom_nodes={}, group_rules=True, parameterize=False
+    )
+
+    assert node_lines == ["% Missing a", "missing(mock1) :- not var(s0cc175b9c0f1b6a831c399e269772661, _)."]
+    group_id = generate_constant_string("missing(mock1)")
+    assert root_lines == [f"rule({group_id}) :- missing(mock1)."]
+    assert list(mapping.values()) == ["test1", "test2"]
+    assert rule_groups == {group_id: list(mapping)}
+
+
+def test_generate_multiple_rule_asp_definition_workers_no_rule_groups(content_id_fixture):  # noqa: F811
+    content_id_fixture.side_effect = __generate_md5_content_id
+    rule_inputs = [RuleInput(rule_id=f"test{i}", rule_tree={"missing": "a"}) for i in range(3)]
+
+    assert generate_multiple_rule_asp_definition(rule_inputs, workers=3) == generate_multiple_rule_asp_definition(
+        rule_inputs
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"rule_node_cache": {}},
+        {"translation_cache": TranslationCache()},
+    ],
+    ids=[
+        "node_cache",
+        "translation_cache",
+    ],
+)
+def test_generate_multiple_rule_asp_definition_workers_caches(kwargs):
+    with pytest.raises(ValueError) as e:
+        generate_multiple_rule_asp_definition(
+            [RuleInput(rule_id="test", rule_tree={"missing": "a"})], workers=2, **kwargs
+        )
+
+    assert e.match("Node and translation caches cannot be shared with worker processes")
+
+
+def test_render_asp_statements_scoped():
+    ri = RuleInput(
+        rule_id="test",
+        rule_tree={"and": [{"missing": "a"}, True]},
+    )
+
+    statements, _ = generate_multiple_rule_asp_statements([ri])
+    asp_definition = render_asp_statements(
+        statements=statements,
+        with_comments=True,
+        scope_term="D",
+        scope_guard=PredicateAtom(predicate_name="record", terms=["D"]),
+    )
+
+    assert asp_definition == "\n".join(
+        [
+            "% Missing a",
+            "missing(D, mock1) :- record(D), not var(D, s0cc175b9c0f1b6a831c399e269772661, _).",
+            "and(D, mock2) :- record(D), missing(D, mock1).",
+            "% test",
+            "rule(D, s098f6bcd4621d373cade4e832627b4f6) :- record(D), and(D, mock2).",
+        ]
+    )
+
+
+def test_generate_multiple_rule_asp_definition_stable():
+    # Node ids are derived from the content, so the definition is the same on every process, whatever its hash seed
+    script = (
+        "from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_definition\n"
+        "from json_logic_asp.models.translator_dto import RuleInput\n"
+        "rule_tree = {'if': [{'==': [{'var': 'a'}, 1]}, True, {'in': [{'var': 'b'}, ['x', 'y']]}, False, True]}\n"
+        "print(generate_multiple_rule_asp_definition([RuleInput(rule_id='rule', rule_tree=rule_tree)])[0])\n"
+    )
+    definitions = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for hash_seed in ["1", "2"]
+    }
+
+    assert len(definitions) == 1
+    assert "if(" in definitions.pop()
+
+
+def test_generate_multiple_rule_asp_statements_translation_cache():
+    translation_cache = TranslationCache()
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test2", rule_tree={"==": [{"var": "a"}, "b"]}),
+    ]
+
+    definition, mapping = generate_multiple_rule_asp_definition(rule_inputs, translation_cache=translation_cache)
+    assert (translation_cache.hits, translation_cache.misses) == (1, 1)
+
+    root_nodes: Dict[str, JsonLogicNode] = {}
+    with patch.object(RuleCompiler, "parse") as mock_parse:
+        statements, cached_mapping = generate_multiple_rule_asp_statements(
+            rule_inputs, rule_root_nodes=root_nodes, translation_cache=translation_cache
+        )
+
+    mock_parse.assert_not_called()
+    assert (translation_cache.hits, translation_cache.misses) == (3, 1)
+    assert render_asp_statements(statements) == definition
+    assert cached_mapping == mapping
+    assert root_nodes == {}
+
+
+def test_generate_multiple_rule_asp_statements_rule_groups():
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={"==": [{"var": "a"}, "b"]}),
+        RuleInput(rule_id="test2", rule_tree={"missing": "c"}),
+        RuleInput(rule_id="test3", rule_tree={"==": [{"var": "a"}, "b"]}),
+    ]
+    rule_groups: Dict[str, List[str]] = {}
+
+    definition, mapping = generate_multiple_rule_asp_definition(rule_inputs, rule_groups=rule_groups)
+
+    hashed_ids = list(mapping)
+    assert list(mapping.values()) == ["test1", "test2", "test3"]
+    assert sorted(rule_groups.values()) == sorted([[hashed_ids[0], hashed_ids[2]], [hashed_ids[1]]])
+    assert len([line for line in definition.splitlines() if line.startswith("rule(")]) == 2
+    for group_id in rule_groups:
+        assert f"rule({group_id}) :- " in definition
+
+
+def test_generate_multiple_rule_asp_statements_parameterize():
+    rule_inputs = [
+        RuleInput(rule_id="test1", rule_tree={">": [{"var": "a"}, 1]}),
+        RuleInput(rule_id="test2", rule_tree={">": [{"var": "a"}, 2]}),
+    ]
+    rule_statements: Dict[str, List[Statement]] = {}
+
+    statements, _ = generate_multiple_rule_asp_statements(
+        rule_inputs, rule_statements=rule_statements, parameterize=True
+    )
+
+    generic_rule = "gt(N) :- param(mock3, N, P1), var(s0cc175b9c0f1b6a831c399e269772661, V1), V1 > P1."
+    assert render_asp_statements(statements).splitlines() == [
+        generic_rule,
+        "param(mock3, mock2, 1).",
+        "param(mock3, mock4, 2).",
+        "rule(s5a105e8b9d40e1329780d62ea2265d8a) :- gt(mock2).",
+        "rule(sad0234829205b9033196ba818f7a872b) :- gt(mock4).",
+    ]
+    # Every rule keeps the generic rule among its statements, so it is reference counted as any shared statement
+    for statements_of_rule in rule_statements.values():
+        assert statements_of_rule[0].to_asp_statement() == generic_rule
@@ -0,0 +1,103 @@
+import json
+from typing import Any, Dict, List
+
+import pytest
+from clingo import Control
+
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.translator.data_generator import generate_single_data_asp_definition
+from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_definition
+from json_logic_asp.translator.rule_stream import (
+    compile_ndjson_rules,
+    iter_ndjson_rule_inputs,
+    load_ndjson_rule_id_mapping,
+)
+from json_logic_asp.translator.translation_cache import TranslationCache
+from tests.fixtures import content_id_fixture, cuid_fixture  # noqa
+
+RULES: List[Dict[str, Any]] = [
+    {"rule_id": "gt", "rule_tree": {">": [{"var": "amount"}, 10]}},
+    {"rule_id": "in", "rule_tree": {"in": [{"var": "country"}, ["es", "fr"]]}},
+    {"rule_id": "both", "rule_tree": {"and": [{">": [{"var": "amount"}, 10]}, {"missing": "country"}]}},
+    {"rule_id": "gt_copy", "rule_tree": {">": [{"var": "amount"}, 10]}},
+]
+
+
+def test_iter_ndjson_rule_inputs():
+    lines = ['{"rule_id": "a", "rule_tree": {"missing": "a"}}\n', "\n", '{"rule_tree": {"missing": "b"}}\n']
+
+    rule_inputs = list(iter_ndjson_rule_inputs(lines))
+
+    assert [(rule_input.rule_id, rule_input.rule_tree) for rule_input in rule_inputs] == [
+        ("a", {"missing": "a"}),
+        ("mock1", {"missing": "b"}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '["a", {"missing": "a"}]',
+        '{"rule_id": "a"}',
+    ],
+    ids=[
+        "not_object",
+        "no_rule_tree",
+    ],
+)
+def test_iter_ndjson_rule_inputs_invalid(line):
+    with pytest.raises(ValueError) as e:
+        list(iter_ndjson_rule_inputs(["\n", line]))
+
+    assert e.match("Line 2 is not a rule object with a rule_tree")
+
+
+@pytest.mark.parametrize(
+    "data_object, expected",
+    [
+        ({"amount": 11, "country": "es"}, ["gt", "gt_copy", "in"]),
+        ({"amount": 11}, ["both", "gt", "gt_copy"]),
+        ({"amount": 3, "country": "pt"}, []),
+    ],
+    ids=[
+        "all",
+        "missing_country",
+        "none",
+    ],
+)
+@pytest.mark.parametrize("parameterize", [False, True], ids=["plain", "parameterize"])
+def test_compile_ndjson_rules(tmp_path, data_object, expected, parameterize):
+    rules_path = tmp_path / "rules.ndjson"
+    rules_path.write_text("".join(f"{json.dumps(rule)}\n" for rule in RULES), encoding="utf-8")
+
+    compiled_rules = compile_ndjson_rules(
+        rules_path,
+        tmp_path / "rules.lp",
+        tmp_path / "mapping.ndjson",
+        with_comments=True,
+        translation_cache=TranslationCache(),
+        parameterize=parameterize,
+    )
+
+    mapping = load_ndjson_rule_id_mapping(tmp_path / "mapping.ndjson")
+    assert compiled_rules == len(RULES)
+    assert list(mapping.values()) == [rule["rule_id"] for rule in RULES]
+    _, expected_mapping = generate_multiple_rule_asp_definition(
+        [RuleInput(rule_id=rule["rule_id"], rule_tree=rule["rule_tree"]) for rule in RULES]
+    )
+    assert mapping == expected_mapping
+
+    control = Control(["--warn=none"])
+    control.load(str(tmp_path / "rules.lp"))
+    control.add("base", [], generate_single_data_asp_definition(DataInput(data_object=data_object)) + "\n#show rule/1.")
+    control.ground([("base", [])])
+    with control.solve(yield_=True) as handle:
+        model = next(iter(handle))
+        assert sorted(mapping[str(symbol.arguments[0])] for symbol in model.symbols(shown=True)) == expected
+
+
+def test_load_ndjson_rule_id_mapping(tmp_path):
+    mapping_path = tmp_path / "mapping.ndjson"
+    mapping_path.write_text('{"asp_rule_id": "s1", "rule_id": "a"}\n\n{"asp_rule_id": "s2", "rule_id": "b"}\n')
+
+    assert load_ndjson_rule_id_mapping(mapping_path) == {"s1": "a", "s2": "b"}
@@ -0,0 +1,206 @@
+import pytest
+from clingo import Control
+
+from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, MatchAtom, PredicateAtom
+from json_logic_asp.adapters.asp.asp_statements import FactStatement, ParameterFactStatement, RuleStatement
+from json_logic_asp.models.translator_dto import DataInput, RuleInput
+from json_logic_asp.translator.data_generator import generate_single_data_asp_definition
+from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_definition
+from json_logic_asp.translator.rule_templates import parameterize_asp_statement, parameterize_asp_statements
+from tests.fixtures import content_id_fixture, cuid_fixture  # noqa
+
+
+def __render(statements):
+    return [statement.to_asp_statement() for statement in statements]
+
+
+def test_parameterize_asp_statement_comparison():
+    statement = RuleStatement(
+        atom=PredicateAtom(predicate_name="gt", terms=["n1"]),
+        literals=[
+            PredicateAtom(predicate_name="var", terms=["s_amount", "V1"]),
+            ComparatorAtom(left_value="V1", comparator=">", right_value="100"),
+        ],
+        comment="amount GT 100",
+    )
+
+    generic_rule, parameter_fact = parameterize_asp_statement(statement)
+
+    assert generic_rule.to_asp_statement() == "gt(N) :- param(mock1, N, P1), var(s_amount, V1), V1 > P1."
+    assert generic_rule.comment is None
+    assert isinstance(parameter_fact, ParameterFactStatement)
+    assert parameter_fact.to_asp_statement() == "param(mock1, n1, 100)."
+    assert parameter_fact.to_asp_comment() == "% amount GT 100"
+
+
+def test_parameterize_asp_statement_equality():
+    statement = RuleStatement(
+        atom=PredicateAtom(predicate_name="in", terms=["n1"]),
+        literals=[
+            PredicateAtom(predicate_name="var", terms=["s_country", "I"]),
+            ComparatorAtom(left_value="I", comparator="=", right_value="(a;b)"),
+        ],
+    )
+
+    assert __render(parameterize_asp_statement(statement)) == [
+        "in(N) :- param(mock1, N, I), var(s_country, I).",
+        "param(mock1, n1, (a;b)).",
+    ]
+
+
+def test_parameterize_asp_statement_match():
+    statement = RuleStatement(
+        atom=PredicateAtom(predicate_name="eq", terms=["n1"]),
+        literals=[MatchAtom(predicate_name="var", terms=["s_country", "sfr"], variable_name="V1")],
+    )
+
+    generic_rule, parameter_fact = parameterize_asp_statement(statement)
+
+    assert generic_rule.to_asp_statement() == "eq(N) :- param(mock1, N, P1), var(s_country, P1)."
+    assert isinstance(generic_rule, RuleStatement)
+    assert isinstance(generic_rule.literals[1], MatchAtom)
+    assert parameter_fact.to_asp_statement() == "param(mock1, n1, sfr)."
+
+
+def test_parameterize_asp_statement_constant_left():
+    statement = RuleStatement(
+        atom=PredicateAtom(predicate_name="lt", terms=["n1"]),
+        literals=[
+            PredicateAtom(predicate_name="var", terms=["s_amount", "V1"]),
+            ComparatorAtom(left_value="1", comparator="<", right_value="V1"),
+            ComparatorAtom(left_value="V1", comparator="<", right_value="10"),
+            ComparatorAtom(left_value="2", comparator="==", right_value="V1"),
+        ],
+    )
+
+    assert __render(parameterize_asp_statement(statement)) == [
+        "lt(N) :- param(mock1, N, P1, P2, V1), var(s_amount, V1), P1 < V1, V1 < P2.",
+        "param(mock1, n1, 1, 10, 2).",
+    ]
+
+
+def test_parameterize_asp_statement_family():
+    def build_statement(node_id, value):
+        return RuleStatement(
+            atom=PredicateAtom(predicate_name="gt", terms=[node_id]),
+            literals=[
+                PredicateAtom(predicate_name="var", terms=["s_amount", "V1"]),
+                ComparatorAtom(left_value="V1", comparator=">", right_value=value),
+            ],
+        )
+
+    def build_other_statement(node_id, value):
+        return RuleStatement(
+            atom=PredicateAtom(predicate_name="gt", terms=[node_id]),
+            literals=[
+                PredicateAtom(predicate_name="var", terms=["s_other", "V1"]),
+                ComparatorAtom(left_value="V1", comparator=">", right_value=value),
+            ],
+        )
+
+    statements = parameterize_asp_statements(
+        [build_statement("n1", "1"), build_statement("n2", "2"), build_other_statement("n3", "1")]
+    )
+
+    assert __render(statements) == [
+        "gt(N) :- param(mock1, N, P1), var(s_amount, V1), V1 > P1.",
+        "param(mock1, n1, 1).",
+        "gt(N) :- param(mock1, N, P1), var(s_amount, V1), V1 > P1.",
+        "param(mock1, n2, 2).",
+        "gt(N) :- param(mock2, N, P1), var(s_other, V1), V1 > P1.",
+        "param(mock2, n3, 1).",
+    ]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        FactStatement(atom=PredicateAtom(predicate_name="bool", terms=["true"])),
+        RuleStatement(
+            atom=PredicateAtom(predicate_name="and", terms=["n1"]),
+            literals=[PredicateAtom(predicate_name="eq", terms=["n2"])],
+        ),
+        RuleStatement(
+            atom=PredicateAtom(predicate_name="eq", terms=["n1"]),
+            literals=[
+                PredicateAtom(predicate_name="var", terms=["s_a", "V1"]),
+                PredicateAtom(predicate_name="var", terms=["s_b", "V2"]),
+                ComparatorAtom(left_value="V1", comparator="==", right_value="V2"),
+            ],
+        ),
+        RuleStatement(
+            atom=PredicateAtom(predicate_name="merge", terms=["n1", "M"]),
+            literals=[ComparatorAtom(left_value="M", comparator="=", right_value="(a;b)")],
+        ),
+        RuleStatement(
+            atom=PredicateAtom(predicate_name="gt", terms=["N"]),
+            literals=[
+                PredicateAtom(predicate_name="var", terms=["s_a", "V1"]),
+                ComparatorAtom(left_value="V1", comparator=">", right_value="1"),
+            ],
+        ),
+        RuleStatement(
+            atom=PredicateAtom(predicate_name="gt", terms=["n1"]),
+            literals=[
+                PredicateAtom(predicate_name="custom", terms=["n1", "V1"]),
+                ComparatorAtom(left_value="V1", comparator=">", right_value="1"),
+            ],
+        ),
+        RuleStatement(
+            atom=PredicateAtom(predicate_name="gt", terms=["n1"]),
+            literals=[
+                PredicateAtom(predicate_name="var", terms=["s_a", "P1"]),
+                ComparatorAtom(left_value="P1", comparator=">", right_value="1"),
+            ],
+        ),
+    ],
+    ids=[
+        "fact",
+        "no_comparison",
+        "no_constants",
+        "multiple_terms",
+        "variable_node",
+        "node_in_body",
+        "reserved_variable",
+    ],
+)
+def test_parameterize_asp_statement_unchanged(statement):
+    assert parameterize_asp_statement(statement) == [statement]
+
+
+@pytest.mark.parametrize(
+    "data_object, expected",
+    [
+        ({"amount": 11, "country": "fr"}, ["between", "eq", "gt1", "in1"]),
+        ({"amount": 25, "country": "pt"}, ["gt1", "gt2", "in2"]),
+        ({"amount": 3, "country": "fr"}, ["between", "in1"]),
+    ],
+    ids=[
+        "low_amount",
+        "high_amount",
+        "excluded_amount",
+    ],
+)
+def test_parameterize_asp_statements_solve(data_object, expected):
+    rule_inputs = [
+        RuleInput(rule_id="gt1", rule_tree={">": [{"var": "amount"}, 10]}),
+        RuleInput(rule_id="gt2", rule_tree={">": [{"var": "amount"}, 20]}),
+        RuleInput(rule_id="between", rule_tree={"<": [1, {"var": "amount"}, 12]}),
+        RuleInput(rule_id="in1", rule_tree={"in": [{"var": "country"}, ["es", "fr"]]}),
+        RuleInput(rule_id="in2", rule_tree={"in": [{"var": "country"}, ["pt"]]}),
+        RuleInput(
+            rule_id="eq", rule_tree={"and": [{"==": [{"var": "country"}, "fr"]}, {"!=": [{"var": "amount"}, 3]}]}
+        ),
+    ]
+    data = generate_single_data_asp_definition(DataInput(data_object=data_object))
+
+    def solve(parameterize):
+        definition, mapping = generate_multiple_rule_asp_definition(rule_inputs, parameterize=parameterize)
+        control = Control(["--warn=none"])
+        control.add("base", [], f"{data}\n{definition}\n#show rule/1.")
+        control.ground([("base", [])])
+        with control.solve(yield_=True) as handle:
+            model = next(iter(handle))
+            return sorted(mapping[str(symbol.arguments[0])] for symbol in model.symbols(shown=True))
+
+    assert solve(parameterize=True) == solve(parameterize=False) == expected
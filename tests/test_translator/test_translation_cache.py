@@ -0,0 +1,192 @@
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from json_logic_asp.adapters.asp.asp_literals import ComparatorAtom, Literal, MatchAtom, ParameterAtom, PredicateAtom
+from json_logic_asp.adapters.asp.asp_statements import FactStatement, RuleStatement, ShowStatement
+from json_logic_asp.models.json_logic_nodes import JsonLogicOperationNode
+from json_logic_asp.models.translator_dto import RuleInput
+from json_logic_asp.translator.rule_generator import generate_multiple_rule_asp_definition
+from json_logic_asp.translator.translation_cache import (
+    TranslationCache,
+    decode_translated_rule,
+    encode_translated_rule,
+)
+
+ATOM = PredicateAtom(predicate_name="eq", terms=["a"])
+TRANSLATED_RULE = ([FactStatement(atom=ATOM)], ATOM)
+
+
+class CustomTestNode(JsonLogicOperationNode):
+    pass
+
+
+def test_translation_cache_invalid_max_size():
+    with pytest.raises(ValueError):
+        TranslationCache(max_size=0)
+
+
+def test_translation_cache_generate_key():
+    key = TranslationCache.generate_key({"==": [{"var": "a"}, 1], "x": [2]})
+
+    assert key == TranslationCache.generate_key({"x": [2], "==": [{"var": "a"}, 1]})
+    assert key != TranslationCache.generate_key({"==": [{"var": "a"}, 2], "x": [2]})
+    assert key != TranslationCache.generate_key({"==": [{"var": "a"}, 1], "x": [2]}, {"custom": CustomTestNode})
+
+    with patch("json_logic_asp.translator.translation_cache.get_library_version", return_value="other"):
+        assert key != TranslationCache.generate_key({"==": [{"var": "a"}, 1], "x": [2]})
+
+
+def test_translation_cache_get_and_put():
+    translation_cache = TranslationCache()
+
+    assert translation_cache.get("key") is None
+    translation_cache.put("key", TRANSLATED_RULE)
+    assert translation_cache.get("key") == TRANSLATED_RULE
+    assert len(translation_cache) == 1
+    assert (translation_cache.hits, translation_cache.misses) == (1, 1)
+
+    translation_cache.clear()
+    assert len(translation_cache) == 0
+    assert (translation_cache.hits, translation_cache.misses) == (0, 0)
+
+
+def test_translation_cache_lru_eviction():
+    translation_cache = TranslationCache(max_size=2)
+    translation_cache.put("key1", TRANSLATED_RULE)
+    translation_cache.put("key2", TRANSLATED_RULE)
+
+    assert translation_cache.get("key1") is not None
+    translation_cache.put("key3", TRANSLATED_RULE)
+
+    assert len(translation_cache) == 2
+    assert translation_cache.get("key2") is None
+    assert translation_cache.get("key1") is not None
+    assert translation_cache.get("key3") is not None
+
+
+def test_translation_cache_persistent(tmp_path):
+    path = tmp_path / "translations.sqlite"
+
+    translation_cache = TranslationCache(path=path)
+    translation_cache.put("key", TRANSLATED_RULE)
+    translation_cache.flush()
+    translation_cache.close()
+    translation_cache.close()
+    assert translation_cache.get("key") is not None
+
+    translation_cache = TranslationCache(max_size=1, path=str(path))
+    translated_rule = translation_cache.get("key")
+    assert translated_rule is not None
+    statements, atom = translated_rule
+    assert [statement.to_asp_statement() for statement in statements] == ["eq(a)."]
+    assert atom.to_asp_atom() == "eq(a)"
+    assert (translation_cache.hits, translation_cache.misses) == (1, 0)
+
+    translation_cache.clear()
+    assert translation_cache.get("key") is not None
+
+
+def test_translation_cache_persistent_across_instances(tmp_path):
+    path = tmp_path / "translations.sqlite"
+    rule_inputs = [RuleInput(rule_id="test", rule_tree={"and": [{"==": [{"var": "a"}, "b"]}, {"missing": "c"}]})]
+
+    translation_cache = TranslationCache(path=path)
+    definition, _ = generate_multiple_rule_asp_definition(rule_inputs, translation_cache=translation_cache)
+    translation_cache.close()
+
+    translation_cache = TranslationCache(path=path)
+    assert generate_multiple_rule_asp_definition(rule_inputs, translation_cache=translation_cache)[0] == definition
+    assert (translation_cache.hits, translation_cache.misses) == (1, 0)
+    translation_cache.close()
+
+
+class UnsupportedTestLiteral(Literal):
+    def to_asp_atom(self):
+        return "unsupported"
+
+
+def test_encode_translated_rule():
+    statements = [
+        FactStatement(atom=PredicateAtom(predicate_name="bool", terms=["true"]), comment="true"),
+        RuleStatement(
+            atom=ATOM,
+            literals=[
+                PredicateAtom(predicate_name="var", terms=["s_a", "V1"], negated=True),
+                ComparatorAtom(left_value="V1", comparator="<", right_value="1"),
+                MatchAtom(predicate_name="var", terms=["s_b", "(1;2)"], variable_name="I"),
+                ParameterAtom(predicate_name="param", terms=["f", "N", "P1"]),
+            ],
+        ),
+    ]
+
+    decoded_statements, decoded_atom = decode_translated_rule(encode_translated_rule((statements, ATOM)))
+
+    fact_statement, rule_statement = decoded_statements
+    assert type(fact_statement) is FactStatement
+    assert isinstance(rule_statement, RuleStatement)
+    assert [type(literal) for literal in rule_statement.literals] == [
+        PredicateAtom,
+        ComparatorAtom,
+        MatchAtom,
+        ParameterAtom,
+    ]
+    assert [statement.to_asp_statement() for statement in decoded_statements] == [
+        statement.to_asp_statement() for statement in statements
+    ]
+    assert fact_statement.comment == "true"
+    match_atom = rule_statement.literals[2]
+    assert isinstance(match_atom, MatchAtom)
+    assert match_atom.variable_name == "I"
+    assert decoded_atom.to_asp_atom() == ATOM.to_asp_atom()
+
+
+@pytest.mark.parametrize(
+    "translated_rule",
+    [
+        ([ShowStatement(predicate="rule", length=1)], ATOM),
+        ([RuleStatement(atom=ATOM, literals=[UnsupportedTestLiteral()])], ATOM),
+    ],
+    ids=["statement", "literal"],
+)
+def test_encode_translated_rule_unsupported(translated_rule):
+    with pytest.raises(ValueError):
+        encode_translated_rule(translated_rule)
+
+
+@pytest.mark.parametrize(
+    "content",
+    ['[[["unknown"]], ["predicate", "eq", ["a"], false]]', '[[], ["unknown"]]', '[[], ["comparator", "a", "=", "b"]]'],
+    ids=["statement", "literal", "atom"],
+)
+def test_decode_translated_rule_invalid(content):
+    with pytest.raises(ValueError):
+        decode_translated_rule(content)
+
+
+def test_translation_cache_persistent_unsupported(tmp_path):
+    path = tmp_path / "translations.sqlite"
+    translated_rule = ([RuleStatement(atom=ATOM, literals=[UnsupportedTestLiteral()])], ATOM)
+
+    translation_cache = TranslationCache(path=path)
+    translation_cache.put("key", translated_rule)
+    assert translation_cache.get("key") == translated_rule
+    translation_cache.close()
+
+    assert TranslationCache(path=path).get("key") is None
+
+
+def test_translation_cache_persistent_invalid(tmp_path):
+    path = tmp_path / "translations.sqlite"
+    TranslationCache(path=path).close()
+
+    connection = sqlite3.connect(str(path))
+    connection.execute("INSERT INTO translations (key, value) VALUES (?, ?)", ("key", b"\x80\x04not json"))
+    connection.commit()
+    connection.close()
+
+    translation_cache = TranslationCache(path=path)
+    assert translation_cache.get("key") is None
+    assert (translation_cache.hits, translation_cache.misses) == (0, 1)
+    translation_cache.close()
@@ -0,0 +1,115 @@
+import gzip
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from json_logic_asp.models.rule_set_artifact import RuleSetArtifact
+from json_logic_asp.models.translator_dto import RuleInput
+from json_logic_asp.utils.artifact_storage import (
+    ARTIFACT_FORMAT_VERSION,
+    generate_rule_input_content_hash,
+    generate_rule_inputs_content_hash,
+    get_library_version,
+    load_rule_set_artifact,
+    save_rule_set_artifact,
+)
+
+ARTIFACT = RuleSetArtifact(
+    content_hash="hash",
+    rule_inputs=[RuleInput(rule_id="rule1", rule_tree={"var": "a"})],
+    rule_id_mapping={"a": "rule1"},
+    rule_groups={"g": ["a"]},
+    stratified=True,
+    asp_definition="rule(a).",
+    scoped_asp_definition="rule(R,a) :- record(R).",
+    multi_shot_asp_definition="rule(S,a) :- active(S).",
+)
+
+
+def test_get_library_version():
+    get_library_version.cache_clear()
+    with patch("json_logic_asp.utils.artifact_storage.version", return_value="1.2.3"):
+        assert get_library_version() == "1.2.3"
+        assert get_library_version() == "1.2.3"
+
+    get_library_version.cache_clear()
+    with patch("json_logic_asp.utils.artifact_storage.version", side_effect=PackageNotFoundError):
+        assert get_library_version() == "unknown"
+
+    get_library_version.cache_clear()
+
+
+def test_generate_rule_inputs_content_hash():
+    rule_inputs = [RuleInput(rule_id="rule1", rule_tree={"==": [{"var": "a"}, 1], "x": 2})]
+    same_rule_inputs = [RuleInput(rule_id="rule1", rule_tree={"x": 2, "==": [{"var": "a"}, 1]})]
+
+    assert generate_rule_inputs_content_hash(rule_inputs) == generate_rule_inputs_content_hash(same_rule_inputs)
+    assert generate_rule_inputs_content_hash(rule_inputs) != generate_rule_inputs_content_hash(
+        rule_inputs, simplify=True
+    )
+    assert generate_rule_inputs_content_hash(rule_inputs) != generate_rule_inputs_content_hash(
+        [RuleInput(rule_id="rule2", rule_tree=rule_inputs[0].rule_tree)]
+    )
+
+
+def test_generate_rule_input_content_hash():
+    rule_input = RuleInput(rule_id="rulé", rule_tree={"in": [{"var": "a"}, ["x", 1.5, None, True]], "b": [[], {}]})
+    content = json.dumps([rule_input.rule_id, rule_input.rule_tree], sort_keys=True, separators=(",", ":"))
+
+    # Hashes match the compact sorted JSON encoding, so the ones stored in existing artifacts remain valid
+    assert generate_rule_input_content_hash(rule_input) == hashlib.sha256(content.encode()).hexdigest()
+
+
+def test_generate_rule_input_content_hash_deep_rule():
+    rule_tree: Dict[str, Any] = {"var": "a"}
+    for level in range(10000):
+        rule_tree = {"and": [rule_tree, {"==": [{"var": "b"}, level]}]}
+
+    assert len(generate_rule_input_content_hash(RuleInput(rule_id="rule1", rule_tree=rule_tree))) == 64
+
+
+def test_save_and_load_rule_set_artifact(tmp_path):
+    path = tmp_path / "artifact.json.gz"
+    save_rule_set_artifact(ARTIFACT, path)
+    artifact = load_rule_set_artifact(str(path))
+
+    assert artifact.content_hash == "hash"
+    assert [(rule_input.rule_id, rule_input.rule_tree) for rule_input in artifact.rule_inputs] == [
+        ("rule1", {"var": "a"})
+    ]
+    assert artifact.rule_id_mapping == {"a": "rule1"}
+    assert artifact.rule_groups == {"g": ["a"]}
+    assert artifact.stratified is True
+    assert artifact.asp_definition == ARTIFACT.asp_definition
+    assert artifact.scoped_asp_definition == ARTIFACT.scoped_asp_definition
+    assert artifact.multi_shot_asp_definition == ARTIFACT.multi_shot_asp_definition
+    assert artifact.simplify is False
+    assert artifact.parameterize is False
+
+
+def test_load_rule_set_artifact_format_version(tmp_path):
+    path = tmp_path / "artifact.json.gz"
+    save_rule_set_artifact(ARTIFACT, path)
+
+    with gzip.open(path, mode="rt", encoding="utf-8") as file:
+        content = json.load(file)
+    content["format_version"] = ARTIFACT_FORMAT_VERSION + 1
+    with gzip.open(path, mode="wt", encoding="utf-8") as file:
+        json.dump(content, file)
+
+    with pytest.raises(ValueError):
+        load_rule_set_artifact(path)
+
+
+def test_load_rule_set_artifact_library_version(tmp_path):
+    path = tmp_path / "artifact.json.gz"
+    with patch("json_logic_asp.utils.artifact_storage.get_library_version", return_value="0.0.1"):
+        save_rule_set_artifact(ARTIFACT, path)
+
+    with patch("json_logic_asp.utils.artifact_storage.get_library_version", return_value="0.0.2"):
+        with pytest.raises(ValueError):
+            load_rule_set_artifact(path)
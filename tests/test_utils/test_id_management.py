@@ -1,4 +1,4 @@
-from json_logic_asp.utils.id_management import generate_constant_string, generate_unique_id
+from json_logic_asp.utils.id_management import generate_constant_string, generate_content_id, generate_unique_id
 
 
 def test_generate_unique_id():
@@ -8,3 +8,8 @@ def test_generate_unique_id():
 
 def test_generate_constant_string():
     assert generate_constant_string("123") == "s202cb962ac59075b964b07152d234b70"
+
+
+def test_generate_content_id():
+    assert generate_content_id("123") == "n202cb962ac59075b964b07152d234b70"
+    assert generate_content_id("123") != generate_content_id("1234")
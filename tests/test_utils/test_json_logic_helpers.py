@@ -1,6 +1,10 @@
 import pytest
 
-from json_logic_asp.utils.json_logic_helpers import extract_key_and_value_from_node, value_encoder
+from json_logic_asp.utils.json_logic_helpers import (
+    extract_key_and_value_from_node,
+    native_value_encoder,
+    value_encoder,
+)
 
 
 def test_extract_key_and_value_from_node():
@@ -42,3 +46,26 @@ def test_extract_key_and_value_from_node():
 )
 def test_value_encoder(test_input, expected_output):
     assert value_encoder(test_input) == expected_output
+
+
+@pytest.mark.parametrize(
+    "test_input, expected_output",
+    [
+        ("a", (1, "s0cc175b9c0f1b6a831c399e269772661")),
+        (1, (0, 1)),
+        (-2, (0, -2)),
+        (1.5, (0, 1)),
+        (True, (1, "true")),
+        ("3", (1, "seccbc87e4b5ce2fe28308fd9f2a7baf3")),
+    ],
+    ids=[
+        "string",
+        "int",
+        "negative_int",
+        "float",
+        "bool",
+        "numeric_string",
+    ],
+)
+def test_native_value_encoder(test_input, expected_output):
+    assert native_value_encoder(test_input) == expected_output